@@ -0,0 +1,76 @@
+"""Benchmark: HttpCache storage backends at N cached entries.
+
+Fills a ``files`` store (flat directory of bodies and meta sidecars) and a
+``sqlite`` store (SQLite index, sharded body directories) with N entries
+each, then reports for each:
+
+  lookup   get_meta() + read_body() for random cached keys, in µs
+  listdir  os.listdir() of the cache directory itself
+  entries  iter_entries() over every entry (what prune/stats walk)
+
+Usage: python bench_cache_store.py [N ...]   (default: 10000 50000)
+"""
+import hashlib
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pipeline.utils.cache_store import open_store
+
+LOOKUPS = 2000
+BODY = ("<p>Sec. 1-101. Definitions.</p>" * 100).encode()
+
+
+def fill(store, n: int) -> list[str]:
+    keys = []
+    for i in range(n):
+        url = f"https://law.example.gov/codes/title-{i // 100}/section-{i}"
+        key = hashlib.sha256(url.encode()).hexdigest()
+        store.write_body(key, "text", BODY)
+        store.put_meta(key, "text", {"url": url, "status_code": 200, "timestamp": time.time()})
+        keys.append(key)
+    return keys
+
+
+def bench(backend: str, n: int, tmp: Path) -> None:
+    cache_dir = tmp / f"{backend}-{n}"
+    cache_dir.mkdir()
+    store = open_store(cache_dir, backend)
+    start = time.perf_counter()
+    keys = fill(store, n)
+    filled = time.perf_counter() - start
+
+    sample = random.Random(0).sample(keys, min(LOOKUPS, n))
+    start = time.perf_counter()
+    for key in sample:
+        if store.get_meta(key, "text") is None or store.read_body(key, "text") is None:
+            raise RuntimeError(f"{backend}: lost entry {key}")
+    lookup_us = (time.perf_counter() - start) * 1e6 / len(sample)
+
+    start = time.perf_counter()
+    names = len(os.listdir(cache_dir))
+    listdir_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    entries = sum(1 for _ in store.iter_entries())
+    entries_s = time.perf_counter() - start
+    store.close()
+
+    print(f"  {backend:6s} fill {filled:5.1f}s  lookup {lookup_us:6.0f} µs  "
+          f"listdir {listdir_ms:7.1f} ms ({names:,} names)  entries {entries_s:5.2f}s ({entries:,})")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10000, 50000]
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            print(f"{n:,} entries")
+            for backend in ("files", "sqlite"):
+                bench(backend, n, Path(tmp))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark: cold DC parse from the extracted repository vs straight from the zip.
+
+  extract  extractall() the law-xml-codified zip, then parse the
+           extracted section files (what fetch + parse used to do)
+  zip      parse the section members straight from the archive
+
+Both run with the parse cache off, so every section is parsed. Uses the
+zip fetch() leaves in cache/raw/dc unless another path is given.
+
+Usage: python bench_dc_zip.py [--parse-workers N] [zip]
+"""
+import argparse
+import logging
+import shutil
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from pipeline.ingestion.dc_council import REPO_ZIP_NAME, DCCouncilIngestor
+from pipeline.utils.parse_pool import default_workers
+
+ROOT_DIR = Path(__file__).resolve().parent
+
+
+def sections(state_code) -> int:
+    return sum(len(chapter.sections) for title in state_code.titles for chapter in title.chapters)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("zip", nargs="?", type=Path, default=ROOT_DIR / "cache" / "raw" / "dc" / REPO_ZIP_NAME)
+    arg_parser.add_argument("--parse-workers", type=int, default=1, help="0: one per CPU")
+    args = arg_parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    config = {"parse_cache": False, "parse_workers": args.parse_workers or default_workers()}
+    with tempfile.TemporaryDirectory() as tmp:
+        ingestor = DCCouncilIngestor("district-of-columbia", config, cache_dir=Path(tmp))
+        members = sum(1 for info in zipfile.ZipFile(args.zip).infolist() if not info.is_dir())
+        print(f"{args.zip.name}: {members:,} members, {args.zip.stat().st_size / 2**20:.0f} MB, "
+              f"{config['parse_workers']} parse workers")
+
+        start = time.perf_counter()
+        extract_dir = Path(tmp) / "extracted"
+        with zipfile.ZipFile(args.zip) as zf:
+            zf.extractall(extract_dir)
+        extracted = time.perf_counter() - start
+        count = sections(ingestor.parse(extract_dir))
+        total = time.perf_counter() - start
+        print(f"  extract  {count:,} sections in {total:.1f}s (extractall {extracted:.1f}s)")
+        shutil.rmtree(extract_dir)
+
+        start = time.perf_counter()
+        count = sections(ingestor.parse(args.zip))
+        print(f"  zip      {count:,} sections in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
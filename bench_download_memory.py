@@ -0,0 +1,90 @@
+"""Memory benchmark: in-memory vs streamed download of a bulk zip archive.
+
+Serves a synthetic zip of incompressible members from a local HTTP server,
+then downloads and extracts it in a fresh process each way:
+
+  bytes  HttpCache.fetch_bytes() and ZipFile(BytesIO(...)).extractall()
+         (what the bulk ingestors used to do)
+  file   HttpCache.fetch_file() and ZipFile(path).extractall()
+
+and reports each process's peak RSS against its RSS before the download.
+
+Usage: python bench_download_memory.py [MB ...]   (default: 50 200)
+"""
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent
+MEMBER_MB = 5
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def write_zip(path: Path, mb: int) -> None:
+    with zipfile.ZipFile(path, "w") as zf:
+        for i in range(mb // MEMBER_MB):
+            zf.writestr(f"member-{i}.bin", os.urandom(MEMBER_MB << 20))
+
+
+def run(mode: str, url: str, tmp: Path) -> dict:
+    """Download and extract ``url`` one way in this process and measure it."""
+    from io import BytesIO
+
+    from pipeline.utils.cache import HttpCache
+
+    cache = HttpCache(tmp / f"cache-{mode}")
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == "bytes":
+        archive = BytesIO(cache.fetch_bytes(url))
+    else:
+        archive = cache.fetch_file(url)
+    with zipfile.ZipFile(archive) as zf:
+        zf.extractall(tmp / f"extract-{mode}")
+    return {
+        "seconds": time.perf_counter() - start,
+        # ru_maxrss is in KiB on Linux
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "growth_mb": (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before) / 1024,
+    }
+
+
+def main():
+    if len(sys.argv) == 5 and sys.argv[1] == "--run":
+        print(json.dumps(run(sys.argv[2], sys.argv[3], Path(sys.argv[4]))))
+        return
+    sizes = [int(arg) for arg in sys.argv[1:]] or [50, 200]
+    with tempfile.TemporaryDirectory() as tmp:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=tmp))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        for mb in sizes:
+            name = f"archive-{mb}.zip"
+            write_zip(Path(tmp) / name, mb)
+            url = f"http://127.0.0.1:{server.server_port}/{name}"
+            print(f"{mb} MB archive")
+            for mode in ("bytes", "file"):
+                work = Path(tmp) / f"{mode}-{mb}"
+                out = subprocess.run(
+                    [sys.executable, __file__, "--run", mode, url, str(work)],
+                    cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+                ).stdout
+                r = json.loads(out.splitlines()[-1])
+                print(f"  {mode:5s} {r['seconds']:.1f}s; peak RSS {r['rss_mb']:.0f} MB (+{r['growth_mb']:.0f} MB)")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark: a new connection per request vs HttpCache's pooled client.
+
+Serves a small HTML page from a local keep-alive HTTP server and requests
+it repeatedly each way:
+
+  get     httpx.get() per request: a fresh client, TLS context and
+          connection every time (what the ingestors did before HttpCache
+          kept one)
+  client  HttpCache.client.get(), the pooled connection alone
+  fetch   HttpCache.fetch(url, max_age=0), the pooled client plus the
+          cache lookup and store that every ingestor request goes through
+
+Usage: python bench_http_pool.py [requests]   (default: 500)
+"""
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+from pipeline.utils.cache import HttpCache
+from pipeline.utils.rate_limiter import RateLimiter
+
+PAGE = b"<html><body>" + b"<p>Sec. 1-101. Definitions.</p>" * 300 + b"</body></html>"
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    # Keep-alive, as real servers do, so a pooled client can reuse its connection
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; don't let Nagle hold the body back
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+def timed(label: str, requests: int, get) -> None:
+    start = time.perf_counter()
+    for i in range(requests):
+        get(i)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:6s} {elapsed * 1000 / requests:6.2f} ms/request  {requests / elapsed:7.0f} requests/s")
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    print(f"{requests} requests for a {len(PAGE) / 1024:.0f} KB page")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # No pacing: the server is local and the point is the connection cost
+        cache = HttpCache(Path(tmp), rate_limiter=RateLimiter(requests_per_second=1e6))
+        timed("get", requests, lambda i: httpx.get(f"{base}/get/{i}").raise_for_status())
+        timed("client", requests, lambda i: cache.client.get(f"{base}/client/{i}").raise_for_status())
+        timed("fetch", requests, lambda i: cache.fetch(f"{base}/fetch/{i}", max_age=0))
+        cache.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Micro-benchmark: link extraction on cached Justia pages.
+
+Compares building a BeautifulSoup tree and walking its <a> tags with the
+streaming extractor the crawl handlers use, and checks both return the
+same links. Reads pages already in the raw cache; no network access.
+
+Usage: python bench_links.py [state ...]
+"""
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from pipeline.ingestion.justia import CONTENT_AREAS
+from pipeline.utils.links import extract_links
+
+ROOT_DIR = Path(__file__).resolve().parent
+RAW_DIR = ROOT_DIR / "cache" / "raw"
+MAX_PAGES = 500
+
+
+def soup_links(html, within=()):
+    soup = BeautifulSoup(html, "html.parser")
+    content = None
+    for tag, attr, value in within:
+        content = soup.find(tag, attrs={attr: value})
+        if content:
+            break
+    content = content or soup
+    return [(a["href"], a.get_text(strip=True)) for a in content.find_all("a", href=True)]
+
+
+def bench(fn, pages, within):
+    start = time.perf_counter()
+    results = [fn(html, within) for html in pages]
+    return time.perf_counter() - start, results
+
+
+def main():
+    states = sys.argv[1:] or ["*"]
+    paths = []
+    for state in states:
+        # JustiaIngestor saves under justia/, Justia fallbacks of official sites under official/
+        for sub in ("justia", "official"):
+            paths += sorted((RAW_DIR).glob(f"{state}/{sub}/**/*.html"))
+    pages = []
+    for path in paths:
+        html = path.read_text(encoding="utf-8", errors="replace")
+        if "law.justia.com" in html:
+            pages.append(html)
+        if len(pages) >= MAX_PAGES:
+            break
+    if not pages:
+        print(f"No cached Justia pages under {RAW_DIR}", file=sys.stderr)
+        sys.exit(1)
+
+    size = sum(len(html) for html in pages) / 1e6
+    print(f"{len(pages)} pages, {size:.1f} MB")
+    for label, within in (("whole page", ()), ("content area", CONTENT_AREAS)):
+        soup_time, expected = bench(soup_links, pages, within)
+        stream_time, actual = bench(extract_links, pages, within)
+        mismatches = sum(a != b for a, b in zip(expected, actual))
+        print(
+            f"{label:>12}: soup {soup_time / len(pages) * 1000:.2f} ms/page, "
+            f"extract_links {stream_time / len(pages) * 1000:.2f} ms/page "
+            f"({soup_time / stream_time:.1f}x), {mismatches} pages differ"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Micro-benchmark: block text extraction on the largest cached pages.
+
+Compares calling get_text(strip=True) on every candidate element of
+soup.find_all (what extract_sections_from_soup used to do) with the
+one-pass TextIndex, checks both produce the same texts, then times the
+whole section extraction and counts which section-number patterns hit.
+Reads pages already in the raw cache.
+
+Usage: python bench_sections.py [state ...]
+"""
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from pipeline.ingestion.official_website import _SECTION_BLOCK_TAGS, extract_sections_from_soup
+from pipeline.utils.parsers import DEFAULT_PARSER
+from pipeline.utils.section_numbers import SECTION_NUMBER
+from pipeline.utils.text_index import TextIndex
+
+ROOT_DIR = Path(__file__).resolve().parent
+RAW_DIR = ROOT_DIR / "cache" / "raw"
+LARGEST = 20
+
+
+def per_element(soup):
+    return [elem.get_text(strip=True) for elem in soup.find_all(list(_SECTION_BLOCK_TAGS))]
+
+
+def one_pass(soup):
+    return [text for _, text in TextIndex(soup).find_all(_SECTION_BLOCK_TAGS)]
+
+
+def timed(fn, soups):
+    start = time.perf_counter()
+    results = [fn(soup) for soup in soups]
+    return time.perf_counter() - start, results
+
+
+def main():
+    states = sys.argv[1:] or ["*"]
+    paths = []
+    for state in states:
+        paths += [p for p in RAW_DIR.glob(f"{state}/**/*.htm*") if p.is_file()]
+    paths = sorted(paths, key=lambda p: p.stat().st_size, reverse=True)[:LARGEST]
+    if not paths:
+        print(f"No cached pages under {RAW_DIR}", file=sys.stderr)
+        sys.exit(1)
+
+    pages = [p.read_text(encoding="utf-8", errors="replace") for p in paths]
+    soups = [BeautifulSoup(html, DEFAULT_PARSER) for html in pages]
+    size = sum(len(html) for html in pages) / 1e6
+    print(f"{len(pages)} largest pages, {size:.1f} MB ({DEFAULT_PARSER})")
+
+    old_time, expected = timed(per_element, soups)
+    new_time, actual = timed(one_pass, soups)
+    mismatches = sum(a != b for a, b in zip(expected, actual))
+    print(
+        f"block texts: get_text per element {old_time / len(pages) * 1000:.1f} ms/page, "
+        f"TextIndex {new_time / len(pages) * 1000:.1f} ms/page "
+        f"({old_time / new_time:.1f}x), {mismatches} pages differ"
+    )
+    total, sections = timed(extract_sections_from_soup, soups)
+    print(
+        f"extract_sections_from_soup: {total / len(pages) * 1000:.1f} ms/page, "
+        f"{sum(len(s) for s in sections)} sections"
+    )
+    hits = ", ".join(f"{name} {count}" for name, count in SECTION_NUMBER.hits.most_common())
+    print(f"section number patterns: {hits or 'no matches'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Memory benchmark: whole-tree vs streaming parse of a bulk XML file.
+
+Writes a synthetic Law.Resource.Org-style file (titles > chapters >
+sections), then parses it in a fresh process each way:
+
+  tree    etree.parse() the file and parse every section element found
+          in the tree (what the XML ingestors used to do)
+  stream  LawResourceOrgIngestor._parse_xml_file (iter_xml_titles)
+
+and reports the peak Python allocations seen by tracemalloc and the
+process's peak RSS. libxml2 allocates the tree outside Python's
+allocator, so the tree's own size only shows up in the RSS column.
+
+Usage: python bench_xml_memory.py [sections ...]   (default: 10000 40000)
+"""
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent
+SECTIONS_PER_CHAPTER = 50
+CHAPTERS_PER_TITLE = 20
+
+
+def write_xml(path: Path, sections: int) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<code>\n')
+        for i in range(sections):
+            t, rest = divmod(i, SECTIONS_PER_CHAPTER * CHAPTERS_PER_TITLE)
+            c, s = divmod(rest, SECTIONS_PER_CHAPTER)
+            if rest == 0:
+                if i:
+                    f.write("</chapter></title>\n")
+                f.write(f"<title><num>{t + 1}</num><heading>Title {t + 1}</heading>\n")
+            if s == 0:
+                if rest:
+                    f.write("</chapter>\n")
+                f.write(f"<chapter><num>{c + 1}</num><heading>Chapter {c + 1}</heading>\n")
+            f.write(
+                f"<section><num>{t + 1}-{c + 1}-{s + 1}</num><heading>Section heading {s + 1}</heading>"
+                + "".join("<p>" + f"Paragraph {p} of the section text, long enough to be realistic. " * 4 + "</p>"
+                          for p in range(4))
+                + "<history>Acts 2001, No. 1, sec. 1.</history></section>\n"
+            )
+        f.write("</chapter></title>\n</code>\n")
+
+
+def run(mode: str, path: Path) -> dict:
+    """Parse ``path`` one way in this process and measure it."""
+    from lxml import etree
+
+    from pipeline.ingestion.law_resource_org import LawResourceOrgIngestor
+
+    ingestor = LawResourceOrgIngestor("bench", {"url": "https://example.com"}, cache_dir=path.parent)
+    tracemalloc.start()
+    if mode == "tree":
+        root = etree.parse(str(path)).getroot()
+        sections = [ingestor._parse_section_element(elem, "") for elem in root.iter("section")]
+    else:
+        titles = ingestor._parse_xml_file(path)
+        sections = [s for t in titles for c in t.chapters for s in c.sections]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "sections": len(sections),
+        "traced_mb": peak / 2**20,
+        # ru_maxrss is in KiB on Linux
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == "--run":
+        print(json.dumps(run(sys.argv[2], Path(sys.argv[3]))))
+        return
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10000, 40000]
+    with tempfile.TemporaryDirectory() as tmp:
+        for sections in sizes:
+            path = Path(tmp) / f"code-{sections}.xml"
+            write_xml(path, sections)
+            print(f"{sections:,} sections, {path.stat().st_size / 2**20:.0f} MB")
+            for mode in ("tree", "stream"):
+                out = subprocess.run(
+                    [sys.executable, __file__, "--run", mode, str(path)],
+                    cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+                ).stdout
+                r = json.loads(out.splitlines()[-1])
+                print(
+                    f"  {mode:6s} {r['sections']:,} sections; "
+                    f"tracemalloc peak {r['traced_mb']:.0f} MB, peak RSS {r['rss_mb']:.0f} MB"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,17 +3,29 @@
 
 Handles: WV (case fix), SC Title 62 (article URLs), DE, FL, PA.
 Also supports --rescrape mode to re-fetch truncated sections for FL/PA.
+URLs that 404'd or were blocked on earlier runs are skipped unless
+--ignore-negative-cache is given.
 """
-import json, os, glob, re, subprocess, time, logging, sys, html
+import json, os, glob, re, time, logging, sys, html
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from pipeline.utils.cache_store import open_store
+from pipeline.utils.curl import CHROME_HTML_HEADERS, CurlTransport
+from pipeline.utils.negative_cache import NegativeCache, failure_class
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
 log = logging.getLogger(__name__)
 
 WORKERS = 4
 DELAY = 1.5
+# Concurrent fetches from the worker threads share curl invocations
+CURL = CurlTransport(timeout=15, headers=CHROME_HTML_HEADERS, parallel=WORKERS, retries=0)
 BASE = 'https://law.justia.com/codes'
 
+# URLs that 404'd or only returned a Cloudflare challenge on earlier runs (set in __main__)
+negative_cache = None
+
 
 def extract_content(raw_html):
     """Extract text from Justia codes-content div using div-depth tracking."""
@@ -123,15 +135,15 @@ def fetch_text(state, section_number, file_path=''):
     url = section_to_url(state, section_number, file_path)
     if not url:
         return section_number, None, None
+    if negative_cache is not None and negative_cache.get(url):
+        return section_number, None, url
     try:
-        result = subprocess.run([
-            'curl', '-s', '-L', '--max-time', '15',
-            '-H', 'User-Agent: Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-            '-H', 'Accept: text/html,application/xhtml+xml',
-            '-H', 'Accept-Language: en-US,en;q=0.9',
-            url
-        ], capture_output=True, text=True, timeout=20, encoding='utf-8', errors='replace')
-        raw = result.stdout
+        result = CURL.fetch_result(url)
+        raw = result.body or ''
+        if negative_cache is not None:
+            failure = failure_class(result.status) or ('blocked' if result.challenged else None)
+            if failure is not None:
+                negative_cache.record(url, failure)
         if not raw or len(raw) < 500:
             return section_number, None, url
         text = extract_content(raw)
@@ -240,6 +252,9 @@ def process_state(state, rescrape=False):
 
 if __name__ == '__main__':
     rescrape = '--rescrape' in sys.argv
+    http_cache_dir = Path('cache') / 'http'
+    http_cache_dir.mkdir(parents=True, exist_ok=True)
+    negative_cache = NegativeCache(open_store(http_cache_dir), ignore='--ignore-negative-cache' in sys.argv)
     states = [s for s in sys.argv[1:] if not s.startswith('--')]
     if not states:
         states = ['west-virginia', 'south-carolina', 'delaware']
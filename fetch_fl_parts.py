@@ -5,14 +5,18 @@ FL chapters on Justia are sometimes split into parts (e.g., /chapter-468/part-i/
 Sections in these chapters need the part in the URL path.
 This script discovers parts and fetches section text.
 """
-import json, os, glob, re, subprocess, time, logging, html as html_mod
+import json, os, glob, re, time, logging, html as html_mod
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from pipeline.utils.curl import CHROME_HTML_HEADERS, CurlTransport
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
 log = logging.getLogger(__name__)
 
 WORKERS = 4
 DELAY = 1.5
+# Concurrent fetches from the worker threads share curl invocations
+CURL = CurlTransport(timeout=15, headers=CHROME_HTML_HEADERS, parallel=WORKERS, retries=0)
 BASE = 'https://law.justia.com/codes/florida'
 
 
@@ -46,14 +50,8 @@ def extract_content(raw_html):
 
 def curl_get(url):
     """Fetch URL with browser headers."""
-    result = subprocess.run([
-        'curl', '-s', '-L', '--max-time', '15',
-        '-H', 'User-Agent: Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-        '-H', 'Accept: text/html,application/xhtml+xml',
-        '-H', 'Accept-Language: en-US,en;q=0.9',
-        url
-    ], capture_output=True, text=True, timeout=20, encoding='utf-8', errors='replace')
-    return result.stdout
+    result = CURL.fetch_result(url)
+    return result.body or ''
 
 
 def discover_section_urls(chapters_with_missing):
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """Fetch missing Pennsylvania section text from Justia."""
-import json, os, glob, re, subprocess, time, logging
+import json, os, glob, re, time, logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from html.parser import HTMLParser
 
+from pipeline.utils.curl import CHROME_HTML_HEADERS, CurlTransport
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
 log = logging.getLogger(__name__)
 
@@ -12,6 +14,8 @@ BASE = f'https://law.justia.com/codes/{STATE}'
 CONTENT_DIR = f'data/states/{STATE}/content'
 WORKERS = 4
 DELAY = 1.5
+# Concurrent fetches from the worker threads share curl invocations
+CURL = CurlTransport(timeout=15, headers=CHROME_HTML_HEADERS, parallel=WORKERS, retries=0)
 
 class ContentParser(HTMLParser):
     def __init__(self):
@@ -65,14 +69,8 @@ def fetch_text(section_number, file_path):
         return section_number, None
     time.sleep(DELAY)
     try:
-        result = subprocess.run([
-            'curl', '-s', '-L', '--max-time', '15',
-            '-H', 'User-Agent: Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-            '-H', 'Accept: text/html,application/xhtml+xml',
-            '-H', 'Accept-Language: en-US,en;q=0.9',
-            url
-        ], capture_output=True, text=True, timeout=20, encoding='utf-8', errors='replace')
-        html = result.stdout
+        result = CURL.fetch_result(url)
+        html = result.body or ''
         if not html or len(html) < 500:
             return section_number, None
         parser = ContentParser()
@@ -12,7 +12,6 @@ import json
 import logging
 import os
 import re
-import subprocess
 import sys
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -21,6 +20,9 @@ from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
+from pipeline.utils.compression import read_text, resolve_codec, write_text
+from pipeline.utils.curl import CurlTransport
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s %(levelname)s %(message)s",
@@ -34,43 +36,23 @@ DATA_DIR = ROOT / "data" / "states"
 
 # Rate limiting
 MIN_DELAY = 1.5  # seconds between requests per worker
-WORKERS = 4  # parallel curl processes
+WORKERS = 4  # parallel fetch workers (their curl calls share batches)
 CURL_TIMEOUT = 45
 
 # HTTP cache for fetched section pages
 SECTION_CACHE_DIR = CACHE_DIR / "sections"
+# Codec for newly cached section pages (None, "zlib" or "zstd"); set by --compress
+SECTION_CACHE_COMPRESSION = None
+
+
+# Shared curl transport: concurrent curl_fetch calls from the worker threads
+# are batched into one curl invocation that reuses connections
+CURL = CurlTransport(timeout=CURL_TIMEOUT, parallel=WORKERS, retries=2, retry_delay=2, min_length=500)
 
 
 def curl_fetch(url: str) -> str | None:
     """Fetch a URL with curl, bypassing Cloudflare TLS fingerprinting."""
-    cloudflare_markers = ["Just a moment", "Checking your browser", "cf-browser-verification"]
-    for attempt in range(3):
-        if attempt > 0:
-            time.sleep(2 * attempt)
-        try:
-            result = subprocess.run(
-                [
-                    "curl", "-sL", "--max-time", str(CURL_TIMEOUT),
-                    "-H", "User-Agent: Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-                    "-H", "Accept: text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "-H", "Accept-Language: en-US,en;q=0.5",
-                    "-H", "Accept-Encoding: identity",
-                    url,
-                ],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                timeout=CURL_TIMEOUT + 15,
-            )
-            if result.returncode == 0 and len(result.stdout) > 500:
-                if any(m in result.stdout[:2000] for m in cloudflare_markers):
-                    logger.debug("Cloudflare challenge for %s (attempt %d)", url, attempt + 1)
-                    continue
-                return result.stdout
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
-    return None
+    return CURL.fetch(url)
 
 
 def extract_text_from_section_page(html: str) -> tuple[str, str]:
@@ -418,14 +400,13 @@ def fetch_and_extract(url: str) -> tuple[str, str, str]:
     # Check cache first
     cache_key = url.replace("https://law.justia.com/codes/", "").strip("/").replace("/", "_")
     cache_file = SECTION_CACHE_DIR / f"{cache_key}.html"
-    if cache_file.exists():
-        try:
-            html = cache_file.read_text(encoding="utf-8", errors="replace")
-            if html and len(html) > 500 and "Just a moment" not in html[:2000]:
-                heading, text = extract_text_from_section_page(html)
-                return url, heading, text
-        except Exception:
-            pass
+    try:
+        html = read_text(cache_file)
+        if html and len(html) > 500 and "Just a moment" not in html[:2000]:
+            heading, text = extract_text_from_section_page(html)
+            return url, heading, text
+    except Exception:
+        pass
 
     time.sleep(MIN_DELAY)
     html = curl_fetch(url)
@@ -435,7 +416,7 @@ def fetch_and_extract(url: str) -> tuple[str, str, str]:
     # Cache the response
     try:
         cache_file.parent.mkdir(parents=True, exist_ok=True)
-        cache_file.write_text(html, encoding="utf-8")
+        write_text(cache_file, html, SECTION_CACHE_COMPRESSION)
     except Exception:
         pass
 
@@ -570,10 +551,16 @@ def main():
         help="Max sections per state (0=unlimited)",
     )
     parser.add_argument("--workers", type=int, default=4, help="Parallel workers")
+    parser.add_argument(
+        "--compress", choices=["zlib", "zstd"], default=None,
+        help="Compress newly cached section pages (existing pages are read either way)",
+    )
     args = parser.parse_args()
 
-    global WORKERS
+    global WORKERS, SECTION_CACHE_COMPRESSION
     WORKERS = args.workers
+    CURL.parallel = WORKERS
+    SECTION_CACHE_COMPRESSION = resolve_codec(args.compress)
 
     if args.all:
         states = []
@@ -7,7 +7,6 @@ import json
 import logging
 import os
 import re
-import subprocess
 import sys
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -15,6 +14,9 @@ from pathlib import Path
 
 from bs4 import BeautifulSoup
 
+from pipeline.utils.compression import read_text, write_text
+from pipeline.utils.curl import CurlTransport
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s %(levelname)s %(message)s",
@@ -31,34 +33,14 @@ WORKERS = 4
 CURL_TIMEOUT = 45
 
 
+# Shared curl transport: concurrent curl_fetch calls from the worker threads
+# are batched into one curl invocation that reuses connections
+CURL = CurlTransport(timeout=CURL_TIMEOUT, parallel=WORKERS, retries=2, retry_delay=2, min_length=500)
+
+
 def curl_fetch(url: str) -> str | None:
-    cloudflare_markers = ["Just a moment", "Checking your browser", "cf-browser-verification"]
-    for attempt in range(3):
-        if attempt > 0:
-            time.sleep(2 * attempt)
-        try:
-            result = subprocess.run(
-                [
-                    "curl", "-sL", "--max-time", str(CURL_TIMEOUT),
-                    "-H", "User-Agent: Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-                    "-H", "Accept: text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "-H", "Accept-Language: en-US,en;q=0.5",
-                    "-H", "Accept-Encoding: identity",
-                    url,
-                ],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                timeout=CURL_TIMEOUT + 15,
-            )
-            if result.returncode == 0 and len(result.stdout) > 500:
-                if any(m in result.stdout[:2000] for m in cloudflare_markers):
-                    continue
-                return result.stdout
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
-    return None
+    """Fetch a URL with curl, bypassing Cloudflare TLS fingerprinting."""
+    return CURL.fetch(url)
 
 
 def extract_text_from_section_page(html: str) -> tuple[str, str]:
@@ -118,15 +100,14 @@ def fetch_section(section_number: str) -> tuple[str, str, str, str]:
     cache_key = url.replace("https://law.justia.com/codes/", "").strip("/").replace("/", "_")
     cache_file = CACHE_DIR / f"{cache_key}.html"
 
-    if cache_file.exists():
-        try:
-            html = cache_file.read_text(encoding="utf-8", errors="replace")
-            if html and len(html) > 500 and "Just a moment" not in html[:2000]:
-                heading, text = extract_text_from_section_page(html)
-                if text:
-                    return section_number, heading, text, url
-        except Exception:
-            pass
+    try:
+        html = read_text(cache_file)
+        if html and len(html) > 500 and "Just a moment" not in html[:2000]:
+            heading, text = extract_text_from_section_page(html)
+            if text:
+                return section_number, heading, text, url
+    except Exception:
+        pass
 
     time.sleep(MIN_DELAY)
     html = curl_fetch(url)
@@ -135,7 +116,7 @@ def fetch_section(section_number: str) -> tuple[str, str, str, str]:
 
     try:
         cache_file.parent.mkdir(parents=True, exist_ok=True)
-        cache_file.write_text(html, encoding="utf-8")
+        write_text(cache_file, html)
     except Exception:
         pass
 
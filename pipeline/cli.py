@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import sys
+import time
 from pathlib import Path
 
 import click
@@ -13,6 +14,8 @@ import yaml
 from pipeline.ingestion.base import BaseIngestor, StructureLevel
 from pipeline.normalization.normalizer import write_state, build_manifest
 from pipeline.utils.cache import HttpCache
+from pipeline.utils.parse_pool import default_workers
+from pipeline.utils.parsers import PARSERS, parser_available
 from pipeline.utils.rate_limiter import RateLimiter
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
@@ -32,8 +35,17 @@ def _load_metadata() -> dict:
     return {s["slug"]: s for s in data}
 
 
-def _get_ingestor(state_slug: str, source_config: dict, metadata: dict) -> BaseIngestor:
-    """Instantiate the appropriate ingestor for a state."""
+def _get_ingestor(
+    state_slug: str,
+    source_config: dict,
+    metadata: dict,
+    run_options: dict | None = None,
+) -> BaseIngestor:
+    """Instantiate the appropriate ingestor for a state.
+
+    ``run_options`` are run-wide settings (e.g. ``cache_backend``) merged
+    into the state's config.
+    """
     from pipeline.ingestion.dc_council import DCCouncilIngestor
     from pipeline.ingestion.justia import JustiaIngestor
     from pipeline.ingestion.law_resource_org import LawResourceOrgIngestor
@@ -52,6 +64,7 @@ def _get_ingestor(state_slug: str, source_config: dict, metadata: dict) -> BaseI
             StructureLevel(level=s["level"], label=s["label"])
             for s in source_config.get("structure", [])
         ],
+        **(run_options or {}),
     }
 
     ingestor_map = {
@@ -88,10 +101,42 @@ def cli(verbose: bool):
 @click.option("--all", "ingest_all", is_flag=True, help="Ingest all states")
 @click.option("--data-dir", type=click.Path(), default=None, help="Output data directory")
 @click.option("--content-dir", type=click.Path(), default=None, help="Output content directory (for data branch)")
-def ingest(state: str | None, source_type: str | None, ingest_all: bool, data_dir: str | None, content_dir: str | None):
+@click.option("--cache-backend", type=click.Choice(["files", "sqlite"]), default=None,
+              help="HTTP cache layout (default: sqlite if the cache has been migrated, else files)")
+@click.option("--cache-compression", type=click.Choice(["none", "zlib", "zstd"]), default=None,
+              help="Compress newly cached bodies (zstd needs the 'zstandard' package)")
+@click.option("--ignore-negative-cache", is_flag=True,
+              help="Re-request URLs remembered as 404/410 or blocked on earlier runs")
+@click.option("--parse-workers", type=click.IntRange(min=0), default=1, show_default=True,
+              help="Processes for the parse phase (0: one per CPU)")
+@click.option("--no-parse-cache", is_flag=True,
+              help="Re-parse every raw file instead of reusing results for unchanged files")
+@click.option("--extract-at-fetch", is_flag=True,
+              help="Parse each crawl round's chapter pages in the background while the next round is fetched")
+def ingest(
+    state: str | None,
+    source_type: str | None,
+    ingest_all: bool,
+    data_dir: str | None,
+    content_dir: str | None,
+    cache_backend: str | None,
+    cache_compression: str | None,
+    ignore_negative_cache: bool,
+    parse_workers: int,
+    no_parse_cache: bool,
+    extract_at_fetch: bool,
+):
     """Ingest statute data for one or more states."""
     sources = _load_sources()
     metadata = _load_metadata()
+    run_options = {
+        "cache_backend": cache_backend,
+        "cache_compression": cache_compression,
+        "ignore_negative_cache": ignore_negative_cache,
+        "parse_workers": parse_workers or default_workers(),
+        "parse_cache": not no_parse_cache,
+        "extract_at_fetch": extract_at_fetch,
+    }
 
     out_data = Path(data_dir) if data_dir else DATA_DIR
     out_content = Path(content_dir) if content_dir else None
@@ -124,7 +169,7 @@ def ingest(state: str | None, source_type: str | None, ingest_all: bool, data_di
             click.echo(f"Ingesting: {slug}")
             click.echo(f"{'='*60}")
 
-            ingestor = _get_ingestor(slug, sources[slug], metadata)
+            ingestor = _get_ingestor(slug, sources[slug], metadata, run_options)
             state_code = ingestor.ingest()
 
             state_data_dir = out_data / slug
@@ -161,6 +206,170 @@ def build_index(output: str, data_dir: str | None):
     build_search_index(content_root, output_path)
 
 
+@cli.command("migrate-cache")
+@click.option("--cache-dir", type=click.Path(), default=None, help="HTTP cache directory (default: cache/http)")
+@click.option("--delete", is_flag=True, help="Remove the old per-URL files after copying")
+def migrate_cache(cache_dir: str | None, delete: bool):
+    """Move the flat-file HTTP cache into the SQLite-indexed layout."""
+    from pipeline.utils.cache_store import migrate_file_cache
+
+    http_dir = Path(cache_dir) if cache_dir else CACHE_DIR / "http"
+    if not http_dir.exists():
+        click.echo(f"Error: {http_dir} does not exist", err=True)
+        sys.exit(1)
+    count = migrate_file_cache(http_dir, delete=delete)
+    click.echo(f"Migrated {count} entries into {http_dir}")
+
+
+def _raw_path(state_slug: str, source_type: str) -> Path | None:
+    """Where ``fetch()`` leaves a state's raw files, if they are cached."""
+    raw_root = CACHE_DIR / "raw"
+    candidates = {
+        "justia": [raw_root / state_slug / "justia"],
+        "official_website": [raw_root / state_slug / "official"],
+        "state_provided": [raw_root / state_slug / "html", raw_root / state_slug],
+        "internet_archive": [raw_root / state_slug / "content"],
+        "law_resource_org": [raw_root / state_slug / "xml"],
+        "dc_council": [raw_root / "dc" / "law-xml-codified.zip", raw_root / "dc" / "law-xml-codified"],
+    }.get(source_type, [raw_root / state_slug])
+    for path in candidates:
+        if path.is_file() or (path.exists() and any(p.is_file() for p in path.rglob("*"))):
+            return path
+    return None
+
+
+def _section_rows(state_code) -> list[tuple]:
+    """Flatten a StateCode into comparable per-section rows."""
+    return [
+        (title.id, chapter.id, section.id, section.number, section.heading, section.text, section.history)
+        for title in state_code.titles
+        for chapter in title.chapters
+        for section in chapter.sections
+    ]
+
+
+@cli.command("compare-parsers")
+@click.option("--state", "-s", "states", multiple=True, required=True, help="State slug (repeatable)")
+@click.option("--parser", "-p", "parsers", multiple=True, type=click.Choice(PARSERS),
+              help="Backends to compare (default: every installed backend)")
+@click.option("--raw-path", type=click.Path(exists=True), default=None,
+              help="Raw files to parse (default: the state's cached fetch output)")
+def compare_parsers(states: tuple[str, ...], parsers: tuple[str, ...], raw_path: str | None):
+    """Parse cached pages under each HTML parser backend and compare the sections.
+
+    Reports pages/sec per backend and exits non-zero if any backend
+    produces different sections from the first one.
+    """
+    sources = _load_sources()
+    metadata = _load_metadata()
+    parsers = parsers or tuple(p for p in PARSERS if parser_available(p))
+    missing = [p for p in parsers if not parser_available(p)]
+    if missing:
+        click.echo(f"Error: parser(s) not installed: {', '.join(missing)}", err=True)
+        sys.exit(1)
+
+    differing = []
+    for slug in states:
+        if slug not in sources:
+            click.echo(f"Error: Unknown state '{slug}'", err=True)
+            sys.exit(1)
+        path = Path(raw_path) if raw_path else _raw_path(slug, sources[slug]["source_type"])
+        if path is None:
+            click.echo(f"{slug}: no cached raw files; run ingest first", err=True)
+            continue
+        pages = sum(1 for p in path.rglob("*") if p.suffix.lower() in (".htm", ".html"))
+        click.echo(f"{slug}: {pages} HTML pages in {path}")
+
+        baseline = None
+        for parser in parsers:
+            ingestor = _get_ingestor(slug, sources[slug], metadata, {"parser": parser, "parse_cache": False})
+            start = time.perf_counter()
+            rows = _section_rows(ingestor.parse(path))
+            elapsed = time.perf_counter() - start
+            ingestor.close()
+            if baseline is None:
+                baseline = rows
+                verdict = "baseline"
+            else:
+                changed = sum(a != b for a, b in zip(baseline, rows)) + abs(len(baseline) - len(rows))
+                verdict = "identical" if changed == 0 else f"{changed} sections differ"
+                if changed:
+                    differing.append((slug, parser))
+            click.echo(
+                f"  {parser:<12} {len(rows):>7} sections  {pages / max(elapsed, 1e-9):8.1f} pages/s  "
+                f"({elapsed:.1f}s)  {verdict}"
+            )
+            if rows is not baseline and rows != baseline:
+                first = next(
+                    (i for i, (a, b) in enumerate(zip(baseline, rows)) if a != b),
+                    min(len(baseline), len(rows)),
+                )
+                where = (baseline if first < len(baseline) else rows)[first][:3]
+                click.echo(f"    first difference: {'/'.join(where)}")
+
+    if differing:
+        click.echo(
+            "Backends differ: " + ", ".join(f"{slug}/{parser}" for slug, parser in differing), err=True
+        )
+        sys.exit(1)
+
+
+@cli.command("profile-sections")
+@click.option("--state", "-s", "states", multiple=True, required=True, help="State slug (repeatable)")
+@click.option("--raw-path", type=click.Path(exists=True), default=None,
+              help="Raw files to parse (default: the state's cached fetch output)")
+def profile_sections(states: tuple[str, ...], raw_path: str | None):
+    """Compare profiled section extraction with trying every pattern.
+
+    Parses each official-website state once with every pattern, learns its
+    extraction profile if it has none, then parses it with the profile.
+    Reports the speedup and exits non-zero if the sections differ.
+    """
+    sources = _load_sources()
+    metadata = _load_metadata()
+    differing = []
+    for slug in states:
+        if slug not in sources:
+            click.echo(f"Error: Unknown state '{slug}'", err=True)
+            sys.exit(1)
+        source_type = sources[slug]["source_type"]
+        if source_type != "official_website":
+            click.echo(f"{slug}: {source_type} states have no extraction profile", err=True)
+            continue
+        path = Path(raw_path) if raw_path else _raw_path(slug, source_type)
+        if path is None:
+            click.echo(f"{slug}: no cached raw files; run ingest first", err=True)
+            continue
+
+        timings = {}
+        results = {}
+        for mode, options in (
+            ("full", {"extraction_profile": False, "parse_cache": False}),
+            ("profiled", {"parse_cache": False}),
+        ):
+            ingestor = _get_ingestor(slug, sources[slug], metadata, options)
+            if mode == "profiled" and not (CACHE_DIR / "profiles" / f"{slug}-official.json").exists():
+                ingestor.parse(path)  # learn the profile
+            start = time.perf_counter()
+            results[mode] = _section_rows(ingestor.parse(path))
+            timings[mode] = time.perf_counter() - start
+            ingestor.close()
+
+        full, profiled = results["full"], results["profiled"]
+        verdict = "identical" if full == profiled else "SECTIONS DIFFER"
+        if full != profiled:
+            differing.append(slug)
+        click.echo(
+            f"{slug}: {len(full)} sections full ({timings['full']:.1f}s), "
+            f"{len(profiled)} profiled ({timings['profiled']:.1f}s), "
+            f"{timings['full'] / max(timings['profiled'], 1e-9):.2f}x, {verdict}"
+        )
+
+    if differing:
+        click.echo("Profiled extraction differs: " + ", ".join(differing), err=True)
+        sys.exit(1)
+
+
 def _update_master_index(data_dir: Path) -> None:
     """Rebuild data/index.json from all state manifests."""
     index = {"states": []}
@@ -6,11 +6,29 @@ import abc
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from collections.abc import Callable, Iterable, Sequence
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+from ..utils.cache import HttpCache
+from ..utils.checksum import file_hash
+from ..utils.crawler import DEFAULT_MAX_PER_HOST, RoundParser, crawl
+from ..utils.frontier import CrawlFrontier, FrontierItem
+from ..utils.parse_cache import ParseCache, code_version, describe
+from ..utils.parse_pool import parse_map
+from ..utils.parsers import resolve_parser
 
 logger = logging.getLogger(__name__)
 
+# Modules shared by every ingestor's parse; the ingestor's own module is added
+_PARSE_MODULES = (
+    __name__,
+    "pipeline.normalization.text_cleaner",
+    "pipeline.utils.extraction_profile",
+    "pipeline.utils.section_numbers",
+    "pipeline.utils.text_index",
+)
+
 
 @dataclass
 class Section:
@@ -74,13 +92,24 @@ class StateCode:
 class BaseIngestor(abc.ABC):
     """Abstract base class for all statute ingestors.
 
-    Subclasses must implement fetch() and parse().
+    Subclasses must implement fetch() and parse(). HTML is parsed with the
+    BeautifulSoup backend in ``self.parser``, set from the state's
+    ``parser`` config (see utils.parsers). Per-file parse work goes through
+    ``_parse_files``, which reuses cached results for unchanged raw files
+    (unless ``parse_cache`` is off) and spreads the rest over
+    ``parse_workers`` processes.
     """
 
     def __init__(self, state: str, config: dict, cache_dir: Path | None = None):
         self.state = state
         self.config = config
         self.cache_dir = cache_dir or Path("cache")
+        self.parser = resolve_parser(config.get("parser"))
+        self.parse_workers = config.get("parse_workers") or 1
+        # Cleared to force a re-parse that ignores (but refreshes) cached results
+        self.reuse_parses = config.get("parse_cache", True)
+        # Set while a crawl parses pages at fetch time (see _crawl)
+        self._round_parser: RoundParser | None = None
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
     @abc.abstractmethod
@@ -102,11 +131,137 @@ class BaseIngestor(abc.ABC):
             Fully populated StateCode instance.
         """
 
+    def _make_http_cache(self, **kwargs) -> HttpCache:
+        """Create the ingestor's HTTP cache under ``cache_dir/http``.
+
+        Run-wide cache settings carried in the config (``cache_backend``,
+        ``cache_compression``, ``ignore_negative_cache``) are applied here so
+        every ingestor picks them up.
+        """
+        kwargs.setdefault("backend", self.config.get("cache_backend"))
+        kwargs.setdefault("compression", self.config.get("cache_compression"))
+        kwargs.setdefault("ignore_negative_cache", self.config.get("ignore_negative_cache", False))
+        return HttpCache(cache_dir=self.cache_dir / "http", **kwargs)
+
+    def _open_frontier(self, name: str) -> CrawlFrontier:
+        """Open the persistent frontier for this state's ``name`` crawl.
+
+        Stored as ``cache_dir/frontier/<state>-<name>.sqlite``.
+        """
+        return CrawlFrontier(self.cache_dir / "frontier" / f"{self.state}-{name}.sqlite")
+
+    def _parse_map(self, fn: Callable[..., Any], *iterables: Iterable) -> list:
+        """``list(map(fn, *iterables))`` across ``parse_workers`` processes, in order."""
+        return parse_map(fn, *iterables, workers=self.parse_workers)
+
+    def _parse_files(self, fn: Callable[..., Any], paths: Sequence[Path], *iterables: Iterable) -> list:
+        """``list(map(fn, paths, *iterables))``, parsing only files whose results are not cached.
+
+        Results are cached per file in ``cache_dir/parse/<state>.sqlite``
+        under the file's content hash, ``fn``, the HTML parser backend and
+        the matching items of ``iterables`` (see utils.parse_cache). ``fn``'s results may hold
+        Sections and Chapters.
+        """
+        return self._parse_cached(fn, paths, file_hash, *iterables)
+
+    def _parse_cached(
+        self,
+        fn: Callable[..., Any],
+        items: Sequence[Any],
+        digest: Callable[[Any], str],
+        *iterables: Iterable,
+    ) -> list:
+        """``_parse_files`` for items that are not plain files (e.g. archive members).
+
+        ``digest(item)`` must change whenever the item's content does.
+        """
+        if not self.config.get("parse_cache", True):
+            return self._parse_map(fn, items, *iterables)
+        items = list(items)
+        columns = [list(iterable) for iterable in iterables]
+        version = code_version((*_PARSE_MODULES, type(self).__module__))
+        with ParseCache(self.cache_dir / "parse" / f"{self.state}.sqlite", version, (Section, Chapter)) as cache:
+            task = describe(fn)
+            # The backend changes the trees, and so what parsing yields
+            keys = [
+                cache.key(task, digest(item), [self.parser, *(column[i] for column in columns)])
+                for i, item in enumerate(items)
+            ]
+            found = cache.get_many(keys) if self.reuse_parses else {}
+            todo = [i for i, key in enumerate(keys) if key not in found]
+            parsed = self._parse_map(fn, [items[i] for i in todo], *([column[i] for i in todo] for column in columns))
+            fresh = {keys[i]: result for i, result in zip(todo, parsed)}
+            cache.put_many(fresh)
+            found.update(fresh)
+            if items:
+                self.logger.debug("Parse cache for %s: %d of %d files reused", self.state, len(items) - len(todo), len(items))
+        return [found[key] for key in keys]
+
+    def _crawl(
+        self,
+        frontier: CrawlFrontier,
+        seeds: Iterable[FrontierItem],
+        handle: Callable[[FrontierItem, str], Iterable[FrontierItem]],
+    ) -> None:
+        """``crawl`` through the ingestor's HTTP cache, ``max_per_host`` requests per host at a time.
+
+        With ``extract_at_fetch`` (and the parse cache) on, the pages
+        handlers pass to ``_parse_at_fetch`` are parsed round by round on a
+        background thread while the crawl fetches the next round (see
+        utils.crawler.RoundParser).
+        """
+        max_per_host = getattr(self, "max_per_host", DEFAULT_MAX_PER_HOST)
+        if not self.config.get("extract_at_fetch") or not self.config.get("parse_cache", True):
+            crawl(self.http_cache, frontier, seeds, handle, max_per_host=max_per_host)
+            return
+        self._round_parser = RoundParser(self._parse_fetched)
+        try:
+            crawl(
+                self.http_cache, frontier, seeds, handle,
+                max_per_host=max_per_host, after_round=self._round_parser.after_round,
+            )
+        finally:
+            self._round_parser.close()
+            self._round_parser = None
+
+    def _parse_at_fetch(self, fn: Callable[..., Any], path: Path) -> None:
+        """Queue a page a crawl handler just saved, so parse() finds its result cached.
+
+        Only during ``_crawl`` with ``extract_at_fetch`` on. ``fn`` must be
+        the per-file function parse() passes to ``_parse_files`` for this
+        page, or the cached result will never be looked up.
+        """
+        if self._round_parser is not None:
+            self._round_parser.add(fn, path, describe(fn))
+
+    def _parse_fetched(self, fn: Callable[..., Any], paths: list[Path]) -> None:
+        """Parse one crawl round's pages for ``fn`` into the parse cache (on the RoundParser thread)."""
+        self._parse_files(fn, paths)
+
+    def __getstate__(self) -> dict:
+        # Parse workers get a copy of the ingestor; connections stay here
+        state = self.__dict__.copy()
+        state.pop("http_cache", None)
+        state.pop("_round_parser", None)
+        return state
+
+    def close(self) -> None:
+        """Release network resources (pooled HTTP connections) held by the ingestor."""
+        http_cache = getattr(self, "http_cache", None)
+        if http_cache is not None:
+            http_cache.close()
+
     def ingest(self) -> StateCode:
         """Run the full ingestion pipeline: fetch then parse."""
         self.logger.info("Starting ingestion for %s", self.state)
-        raw_path = self.fetch()
+        try:
+            raw_path = self.fetch()
+        finally:
+            self.close()
         self.logger.info("Fetched raw data to %s", raw_path)
+        http_cache = getattr(self, "http_cache", None)
+        if http_cache is not None:
+            self.logger.info("HTTP cache for %s: %s", self.state, http_cache.stats_summary())
         state_code = self.parse(raw_path)
         self.logger.info(
             "Parsed %d titles, %d chapters, %d sections for %s",
@@ -1,19 +1,32 @@
-"""DC Council ingestor - parses DC law XML from GitHub."""
+"""DC Council ingestor - parses DC law XML from GitHub.
+
+The repository zip is parsed in place: section files are read straight
+from the archive, so its tens of thousands of small XML files are never
+written to disk.
+
+The zip is tied to the upstream commit it was downloaded at. fetch() asks
+GitHub which commit the branch points at and downloads only when that
+has moved; parse() then re-parses only the section files whose content
+changed, the rest coming from the parse cache.
+"""
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import re
 import zipfile
-from io import BytesIO
+from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
 
+import httpx
 from lxml import etree
 
 from .base import BaseIngestor, Chapter, Section, StateCode, StructureLevel, Title
 from ..normalization.text_cleaner import clean_text
-from ..utils.cache import HttpCache
+from ..utils.curl import USER_AGENT
 from ..utils.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
@@ -21,7 +34,29 @@ logger = logging.getLogger(__name__)
 NS = {"dc": "https://code.dccouncil.us/schemas/dc-library"}
 
 # The law-xml-codified repo has the complete codified DC Code
-REPO_ZIP_URL = "https://github.com/DCCouncil/law-xml-codified/archive/refs/heads/master.zip"
+REPO_ARCHIVE_URL = "https://github.com/DCCouncil/law-xml-codified/archive/{ref}.zip"
+# Answers with the commit SHA the branch points at
+REPO_REVISION_URL = "https://api.github.com/repos/DCCouncil/law-xml-codified/commits/master"
+REPO_BRANCH = "refs/heads/master"
+REPO_ZIP_NAME = "law-xml-codified.zip"
+
+# Where the titles directory sits in the repository
+_CODE_DIRS = ("us/dc/council/code/titles", "dc/council/code/titles")
+
+
+@lru_cache(maxsize=2)
+def _open_archive(path: Path, mtime_ns: int, pid: int) -> zipfile.ZipFile:
+    return zipfile.ZipFile(path)
+
+
+def _open_zip(path: Path) -> zipfile.ZipFile:
+    """The archive at ``path``, opened once per process (and again if it changes).
+
+    Reading the central directory of a large zip is not free, so parse
+    workers keep it open across the members they are given. Forked workers
+    must not share the parent's file position, hence the pid.
+    """
+    return _open_archive(path, path.stat().st_mtime_ns, os.getpid())
 
 
 class DCCouncilIngestor(BaseIngestor):
@@ -29,52 +64,92 @@ class DCCouncilIngestor(BaseIngestor):
 
     def __init__(self, state: str, config: dict, cache_dir: Path | None = None):
         super().__init__(state, config, cache_dir)
-        self.http_cache = HttpCache(
-            cache_dir=(cache_dir or Path("cache")) / "http",
+        self.http_cache = self._make_http_cache(
             rate_limiter=RateLimiter(requests_per_second=5.0),
         )
+        self.archive_url = config.get("archive_url", REPO_ARCHIVE_URL)
+        self.revision_url = config.get("revision_url", REPO_REVISION_URL)
 
     def fetch(self) -> Path:
-        """Download the law-xml-codified repo as a zip archive."""
+        """Download the law-xml-codified repo as a zip archive (parsed without extracting).
+
+        The cached zip is reused while the upstream branch still points at
+        the commit it was downloaded at, or when that cannot be checked.
+        """
         raw_dir = self.cache_dir / "raw" / "dc"
         raw_dir.mkdir(parents=True, exist_ok=True)
 
-        zip_path = raw_dir / "law-xml-codified.zip"
+        zip_path = raw_dir / REPO_ZIP_NAME
         extract_dir = raw_dir / "law-xml-codified"
 
-        if extract_dir.exists() and any(extract_dir.iterdir()):
+        revision = self._upstream_revision()
+        if zipfile.is_zipfile(zip_path):
+            recorded = self._recorded_revision(zip_path)
+            if revision is None or revision == recorded:
+                logger.info("Using cached DC law-xml-codified at %s (revision %s)", zip_path, recorded or "unknown")
+                return zip_path
+            logger.info("DC law-xml-codified moved from %s to %s", recorded or "unknown", revision)
+        # Left by runs that extracted the archive
+        elif revision is None and extract_dir.exists() and any(extract_dir.iterdir()):
             logger.info("Using cached DC law-xml-codified at %s", extract_dir)
             return extract_dir
 
-        logger.info("Downloading DC law-xml-codified from GitHub...")
-        data = self.http_cache.fetch_bytes(REPO_ZIP_URL)
-
-        zip_path.write_bytes(data)
-        logger.info("Downloaded %d bytes", len(data))
+        # Streamed straight to disk; the zip itself is the cached copy
+        url = self.archive_url.format(ref=revision or REPO_BRANCH)
+        logger.info("Downloading DC law-xml-codified from %s", url)
+        self.http_cache.download(url, zip_path)
+        self._record_revision(zip_path, revision, url)
+        logger.info("Downloaded %d bytes to %s", zip_path.stat().st_size, zip_path)
+        return zip_path
 
-        # Extract
-        with zipfile.ZipFile(BytesIO(data)) as zf:
-            zf.extractall(raw_dir)
+    def _upstream_revision(self) -> str | None:
+        """The commit the upstream branch points at, or None if GitHub cannot be asked."""
+        try:
+            response = self.http_cache.client.get(
+                self.revision_url,
+                headers={"User-Agent": USER_AGENT, "Accept": "application/vnd.github.sha"},
+                timeout=30,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning("Could not check the DC law-xml-codified revision: %s", e)
+            return None
+        revision = response.text.strip()
+        if not re.fullmatch(r"[0-9a-f]{40}", revision):
+            logger.warning("Unexpected DC law-xml-codified revision %r", revision[:80])
+            return None
+        return revision
 
-        # GitHub zips have a top-level directory like "law-xml-codified-master"
-        extracted = [d for d in raw_dir.iterdir() if d.is_dir() and "law-xml-codified" in d.name]
-        if extracted and extracted[0] != extract_dir:
-            extracted[0].rename(extract_dir)
+    @staticmethod
+    def _recorded_revision(zip_path: Path) -> str | None:
+        """The commit the cached zip was downloaded at, if it was recorded."""
+        try:
+            return json.loads(zip_path.with_suffix(".json").read_text(encoding="utf-8")).get("revision")
+        except (OSError, ValueError):
+            return None
 
-        logger.info("Extracted to %s", extract_dir)
-        return extract_dir
+    @staticmethod
+    def _record_revision(zip_path: Path, revision: str | None, url: str) -> None:
+        info = {
+            "revision": revision,
+            "url": url,
+            "downloaded_at": datetime.now(timezone.utc).isoformat(),
+        }
+        zip_path.with_suffix(".json").write_text(json.dumps(info, indent=2) + "\n", encoding="utf-8")
 
     def parse(self, raw_path: Path) -> StateCode:
-        """Parse the extracted DC law XML into a StateCode."""
-        # Find the code directory
-        code_dir = self._find_code_dir(raw_path)
-        if code_dir is None:
-            raise FileNotFoundError(f"Could not find DC Code directory in {raw_path}")
-
-        logger.info("Parsing DC Code from %s", code_dir)
-
-        # Parse the code index to find titles
-        titles = self._parse_titles(code_dir)
+        """Parse the DC law XML (the repository zip, or an extracted copy) into a StateCode."""
+        zip_path = raw_path if raw_path.is_file() else raw_path / REPO_ZIP_NAME
+        if zipfile.is_zipfile(zip_path):
+            logger.info("Parsing DC Code from %s", zip_path)
+            titles = self._parse_archive(zip_path)
+        else:
+            # Find the code directory
+            code_dir = self._find_code_dir(raw_path)
+            if code_dir is None:
+                raise FileNotFoundError(f"Could not find DC Code directory in {raw_path}")
+            logger.info("Parsing DC Code from %s", code_dir)
+            titles = self._parse_titles(code_dir)
 
         return StateCode(
             state="district-of-columbia",
@@ -119,8 +194,18 @@ class DCCouncilIngestor(BaseIngestor):
             key=lambda d: self._sort_key(d.name),
         )
 
+        # Section files from every title at once, so parse workers stay busy
+        section_files = {title_dir: self._section_files(title_dir) for title_dir in title_dirs}
+        all_files = [f for files in section_files.values() for f in files]
+        title_nums = [title_dir.name for title_dir, files in section_files.items() for _ in files]
+        parsed = dict(zip(all_files, self._parse_files(self._parse_section_file, all_files, title_nums)))
+
         for title_dir in title_dirs:
-            title = self._parse_title(title_dir)
+            title = self._parse_title(
+                title_dir.name,
+                self._get_title_heading(title_dir),
+                [parsed[f] for f in section_files[title_dir]],
+            )
             if title and title.chapters:
                 titles.append(title)
                 logger.debug(
@@ -130,26 +215,100 @@ class DCCouncilIngestor(BaseIngestor):
 
         return titles
 
-    def _parse_title(self, title_dir: Path) -> Title | None:
-        """Parse a single title directory."""
-        title_num = title_dir.name
-        title_id = f"title-{title_num}"
+    def _parse_archive(self, zip_path: Path) -> list[Title]:
+        """Parse all titles straight from the repository zip.
 
-        # Try to get title heading from index.xml
-        heading = self._get_title_heading(title_dir)
+        Section members are parsed across the parse workers, each of which
+        opens the archive itself. Cached parse results are keyed by each
+        member's CRC-32 and size from the zip directory, so unchanged
+        members are not even decompressed.
+        """
+        try:
+            return self._parse_archive_titles(zip_path, _open_zip(zip_path))
+        finally:
+            _open_archive.cache_clear()
+
+    def _parse_archive_titles(self, zip_path: Path, zf: zipfile.ZipFile) -> list[Title]:
+        infos = [info for info in zf.infolist() if not info.is_dir()]
+        code_prefix = self._find_code_prefix([info.filename for info in infos])
+        if code_prefix is None:
+            raise FileNotFoundError(f"Could not find DC Code directory in {zip_path}")
+
+        # titles/<title>/sections/<section>.xml and titles/<title>/index.xml
+        section_members: dict[str, list[zipfile.ZipInfo]] = {}
+        index_members: dict[str, zipfile.ZipInfo] = {}
+        for info in infos:
+            if not info.filename.startswith(code_prefix):
+                continue
+            parts = info.filename[len(code_prefix):].split("/")
+            if len(parts) == 3 and parts[1] == "sections" and parts[2].endswith(".xml"):
+                section_members.setdefault(parts[0], []).append(info)
+            elif len(parts) == 2 and parts[1] == "index.xml":
+                index_members[parts[0]] = info
+        title_nums = sorted(section_members, key=self._sort_key)
+        for members in section_members.values():
+            members.sort(key=lambda info: self._sort_key(Path(info.filename).stem))
+
+        members = [info for num in title_nums for info in section_members[num]]
+        digests = {info.filename: f"crc32:{info.CRC:08x}:{info.file_size}" for info in members}
+        parsed = self._parse_cached(
+            partial(self._parse_section_member, zip_path),
+            [info.filename for info in members],
+            digests.__getitem__,
+            [num for num in title_nums for _ in section_members[num]],
+        )
+
+        titles = []
+        start = 0
+        for title_num in title_nums:
+            count = len(section_members[title_num])
+            index = index_members.get(title_num)
+            heading = self._title_heading_from(zf.read(index), index.filename) if index else None
+            title = self._parse_title(title_num, heading, parsed[start:start + count])
+            start += count
+            if title and title.chapters:
+                titles.append(title)
+                logger.debug(
+                    "Parsed title %s: %s (%d chapters)",
+                    title.number, title.heading, len(title.chapters),
+                )
+
+        return titles
+
+    def _find_code_prefix(self, names: list[str]) -> str | None:
+        """Member-name prefix of the DC Code titles directory in the repository zip."""
+        # GitHub zips have a top-level directory like "law-xml-codified-master"
+        tops = {name.split("/", 1)[0] for name in names if "/" in name}
+        for top in sorted(tops):
+            for code_dir in _CODE_DIRS:
+                prefix = f"{top}/{code_dir}/"
+                if any(name.startswith(prefix) for name in names):
+                    return prefix
+        # Any titles directory with a title 1
+        for name in names:
+            head, sep, _ = name.partition("/titles/1/")
+            if sep:
+                return f"{head}/titles/"
+        return None
 
-        # Find all section XML files
+    def _section_files(self, title_dir: Path) -> list[Path]:
+        """A title's section XML files, in section order."""
         sections_dir = title_dir / "sections"
         if not sections_dir.exists():
             logger.debug("No sections directory in %s", title_dir)
-            return None
-
-        section_files = sorted(
+            return []
+        return sorted(
             sections_dir.glob("*.xml"),
             key=lambda f: self._sort_key(f.stem),
         )
 
-        if not section_files:
+    def _parse_title(
+        self, title_num: str, heading: str | None, parsed_sections: list[Section | None],
+    ) -> Title | None:
+        """Build a title from its heading (from index.xml) and its parsed section files, in file order."""
+        title_id = f"title-{title_num}"
+
+        if not parsed_sections:
             return None
 
         # Group sections into chapters based on section numbering
@@ -157,8 +316,7 @@ class DCCouncilIngestor(BaseIngestor):
         # We group by the chapter portion
         chapters_dict: dict[str, list[Section]] = {}
 
-        for section_file in section_files:
-            section = self._parse_section_file(section_file, title_num)
+        for section in parsed_sections:
             if section:
                 # Determine chapter from section number
                 chapter_key = self._extract_chapter(section.number, title_num)
@@ -190,10 +348,12 @@ class DCCouncilIngestor(BaseIngestor):
         index_file = title_dir / "index.xml"
         if not index_file.exists():
             return None
+        return self._title_heading_from(index_file.read_bytes(), index_file)
 
+    def _title_heading_from(self, data: bytes, index_file: Path | str) -> str | None:
+        """Extract title heading from the contents of an index.xml."""
         try:
-            tree = etree.parse(str(index_file))
-            root = tree.getroot()
+            root = etree.fromstring(data)
 
             # Try to find heading element
             heading = root.find(".//dc:heading", NS)
@@ -209,50 +369,58 @@ class DCCouncilIngestor(BaseIngestor):
     def _parse_section_file(self, section_file: Path, title_num: str) -> Section | None:
         """Parse a single section XML file."""
         try:
-            tree = etree.parse(str(section_file))
-            root = tree.getroot()
-
-            # Get section number
-            num_elem = root.find("dc:num", NS)
-            if num_elem is None:
-                num_elem = root.find("{*}num")
-            if num_elem is None or not num_elem.text:
-                return None
-            number = num_elem.text.strip()
-
-            # Get heading
-            heading_elem = root.find("dc:heading", NS)
-            if heading_elem is None:
-                heading_elem = root.find("{*}heading")
-            heading = ""
-            if heading_elem is not None and heading_elem.text:
-                heading = heading_elem.text.strip()
-
-            # Get text content - combine all <text> and <para> elements
-            text_parts = []
-            self._extract_text(root, text_parts, depth=0)
-            text = "\n\n".join(text_parts)
-            text = clean_text(text)
-
-            # Get legislative history from annotations
-            history = self._extract_history(root)
-
-            section_id = f"section-{number}"
-            source_url = f"https://code.dccouncil.us/us/dc/council/code/sections/{number}.html"
-
-            return Section(
-                id=section_id,
-                number=number,
-                heading=heading,
-                text=text,
-                history=history,
-                source_url=source_url,
-            )
-
+            return self._parse_section_root(etree.parse(str(section_file)).getroot())
         except Exception as e:
             logger.warning("Failed to parse %s: %s", section_file, e)
             return None
 
+    def _parse_section_member(self, zip_path: Path, member: str, title_num: str) -> Section | None:
+        """Parse a single section XML file from the repository zip."""
+        try:
+            return self._parse_section_root(etree.fromstring(_open_zip(zip_path).read(member)))
+        except Exception as e:
+            logger.warning("Failed to parse %s in %s: %s", member, zip_path.name, e)
+            return None
+
+    def _parse_section_root(self, root) -> Section | None:
+        """Parse the root element of a section XML file."""
+        # Get section number
+        num_elem = root.find("dc:num", NS)
+        if num_elem is None:
+            num_elem = root.find("{*}num")
+        if num_elem is None or not num_elem.text:
+            return None
+        number = num_elem.text.strip()
+
+        # Get heading
+        heading_elem = root.find("dc:heading", NS)
+        if heading_elem is None:
+            heading_elem = root.find("{*}heading")
+        heading = ""
+        if heading_elem is not None and heading_elem.text:
+            heading = heading_elem.text.strip()
+
+        # Get text content - combine all <text> and <para> elements
+        text_parts = []
+        self._extract_text(root, text_parts, depth=0)
+        text = "\n\n".join(text_parts)
+        text = clean_text(text)
+
+        # Get legislative history from annotations
+        history = self._extract_history(root)
+
+        section_id = f"section-{number}"
+        source_url = f"https://code.dccouncil.us/us/dc/council/code/sections/{number}.html"
+
+        return Section(
+            id=section_id,
+            number=number,
+            heading=heading,
+            text=text,
+            history=history,
+            source_url=source_url,
+        )
+
     def _extract_text(self, element, parts: list[str], depth: int) -> None:
         """Recursively extract text from <text> and <para> elements."""
         tag = etree.QName(element.tag).localname if isinstance(element.tag, str) else ""
@@ -8,41 +8,49 @@ from __future__ import annotations
 import json
 import logging
 import re
-import zipfile
-from io import BytesIO
 from pathlib import Path
 
-from lxml import etree
-
 from .base import BaseIngestor, Chapter, Section, StateCode, StructureLevel, Title
 from ..normalization.text_cleaner import clean_text, clean_section_number
-from ..utils.cache import HttpCache
+from ..utils.archives import extract_members
+from ..utils.checksum import file_hash
 from ..utils.rate_limiter import RateLimiter
+from ..utils.xml_stream import XmlDivision, XmlTitle, iter_xml_titles
 
 logger = logging.getLogger(__name__)
 
+# Item files worth downloading
+_DOWNLOAD_EXTS = frozenset({"xml", "html", "htm", "txt", "json", "zip"})
+# Zip members parse() reads; nothing else is extracted
+_PARSED_SUFFIXES = (".xml", ".html", ".htm", ".txt")
+# What fetch() has downloaded, with the md5/size/mtime it had upstream
+LEDGER_NAME = "ledger.json"
+# Downloaded zips, kept beside the content extracted from them
+ARCHIVES_DIR = "archives"
+
 
 class InternetArchiveIngestor(BaseIngestor):
     """Ingest statutes from Internet Archive bulk downloads."""
 
     def __init__(self, state: str, config: dict, cache_dir: Path | None = None):
         super().__init__(state, config, cache_dir)
-        self.http_cache = HttpCache(
-            cache_dir=(cache_dir or Path("cache")) / "http",
+        self.http_cache = self._make_http_cache(
             ttl=30 * 24 * 3600,  # 30 day cache for archive.org
             rate_limiter=RateLimiter(requests_per_second=1.0),
         )
 
     def fetch(self) -> Path:
-        """Download statute data from Internet Archive."""
+        """Sync statute data from Internet Archive.
+
+        The item's metadata lists every file with its md5, size and mtime.
+        What was downloaded is recorded in a ledger (``ledger.json`` next to
+        the content), so a re-run downloads only the files that are new or
+        changed upstream and deletes the ones that are gone; an unchanged
+        item costs the one metadata request. Downloads stream to disk,
+        resume after an interruption and are checked against the md5.
+        """
         raw_dir = self.cache_dir / "raw" / self.state
-        raw_dir.mkdir(parents=True, exist_ok=True)
-
         extract_dir = raw_dir / "content"
-        if extract_dir.exists() and any(extract_dir.rglob("*")):
-            logger.info("Using cached content for %s", self.state)
-            return extract_dir
-
         extract_dir.mkdir(parents=True, exist_ok=True)
 
         # Get metadata for the Internet Archive item
@@ -53,39 +61,127 @@ class InternetArchiveIngestor(BaseIngestor):
 
         metadata_url = f"https://archive.org/metadata/{item_id}"
         try:
-            metadata_text = self.http_cache.fetch(metadata_url)
+            # Always asked again (a 304 if the item is unchanged): the
+            # listed checksums are what decide what to download
+            metadata_text = self.http_cache.fetch(metadata_url, max_age=0)
             metadata = json.loads(metadata_text)
         except Exception as e:
             logger.warning("Could not fetch IA metadata for %s: %s", item_id, e)
+            if any(extract_dir.rglob("*")):
+                logger.info("Using cached content for %s", self.state)
+                return extract_dir
             # Fallback: try to download known file patterns
             return self._fallback_fetch(item_id, extract_dir)
 
-        # Download relevant files (XML, HTML, TXT, PDF)
-        files = metadata.get("files", [])
-        download_base = f"https://archive.org/download/{item_id}"
+        self._sync_files(metadata.get("files", []), f"https://archive.org/download/{item_id}", raw_dir)
+        return extract_dir
 
+    def _sync_files(self, files: list[dict], download_base: str, raw_dir: Path) -> None:
+        """Bring ``raw_dir``/content in line with the item's file list (see ``fetch``)."""
+        extract_dir = raw_dir / "content"
+        ledger_path = raw_dir / LEDGER_NAME
+        ledger = self._read_ledger(ledger_path)
+
+        # Download relevant files (XML, HTML, TXT, JSON and zips of them)
+        listed = {}
         for file_info in files:
             name = file_info.get("name", "")
             ext = name.rsplit(".", 1)[-1].lower() if "." in name else ""
-            if ext in ("xml", "html", "htm", "txt", "json"):
-                file_url = f"{download_base}/{name}"
-                try:
-                    content = self.http_cache.fetch(file_url)
-                    dest = extract_dir / name
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-                    dest.write_text(content, encoding="utf-8")
-                except Exception as e:
-                    logger.warning("Failed to download %s: %s", file_url, e)
-            elif ext == "zip":
-                file_url = f"{download_base}/{name}"
-                try:
-                    data = self.http_cache.fetch_bytes(file_url)
-                    with zipfile.ZipFile(BytesIO(data)) as zf:
-                        zf.extractall(extract_dir)
-                except Exception as e:
-                    logger.warning("Failed to download zip %s: %s", file_url, e)
+            if ext in _DOWNLOAD_EXTS:
+                listed[name] = {key: file_info.get(key) for key in ("md5", "size", "mtime")}
+
+        downloaded = unchanged = 0
+        for name, current in listed.items():
+            entry = ledger.get(name)
+            if entry is None and not name.lower().endswith(".zip"):
+                # Content from before the ledger: keep it if it matches
+                entry = self._adopt_existing(extract_dir, name, current)
+            if entry is not None and self._is_current(entry, current, extract_dir):
+                # Only the mtime may have moved; nothing to download
+                ledger[name] = {**entry, **current}
+                unchanged += 1
+                continue
 
-        return extract_dir
+            file_url = f"{download_base}/{name}"
+            try:
+                members = self._download_file(file_url, name, current["md5"], raw_dir)
+            except Exception as e:
+                logger.warning("Failed to download %s: %s", file_url, e)
+                continue
+            if entry is not None:
+                self._remove_members(extract_dir, set(entry.get("files", [])) - set(members))
+            ledger[name] = {**current, "files": members}
+            # Saved after every file so an interrupted sync keeps its progress
+            self._write_ledger(ledger_path, ledger)
+            downloaded += 1
+
+        removed = [name for name in ledger if name not in listed]
+        for name in removed:
+            self._remove_members(extract_dir, ledger.pop(name).get("files", []))
+            archive = raw_dir / ARCHIVES_DIR / name
+            archive.unlink(missing_ok=True)
+        self._write_ledger(ledger_path, ledger)
+        logger.info(
+            "%s: %d files downloaded, %d unchanged, %d removed upstream",
+            self.state, downloaded, unchanged, len(removed),
+        )
+
+    def _download_file(self, url: str, name: str, md5: str | None, raw_dir: Path) -> list[str]:
+        """Download one listed file; returns the content files it provides.
+
+        Zips are kept under ``archives/`` (so an interrupted download can be
+        resumed and the next sync can tell they are unchanged) and extracted
+        into the content directory.
+        """
+        extract_dir = raw_dir / "content"
+        if not name.lower().endswith(".zip"):
+            self.http_cache.download(url, extract_dir / name, md5=md5)
+            return [name]
+        archive = self.http_cache.download(url, raw_dir / ARCHIVES_DIR / name, md5=md5)
+        return extract_members(archive, extract_dir, _PARSED_SUFFIXES, source=name)
+
+    @staticmethod
+    def _is_current(entry: dict, current: dict, extract_dir: Path) -> bool:
+        """True if a ledger entry matches the listed file and its content is still on disk."""
+        if entry.get("size") != current["size"]:
+            return False
+        if current["md5"]:
+            if entry.get("md5") != current["md5"]:
+                return False
+        elif entry.get("mtime") != current["mtime"]:
+            return False
+        return all((extract_dir / member).exists() for member in entry.get("files", []))
+
+    @staticmethod
+    def _adopt_existing(extract_dir: Path, name: str, current: dict) -> dict | None:
+        """Ledger entry for a file already on disk that matches the listed md5, if it does."""
+        path = extract_dir / name
+        if not current["md5"] or not path.is_file():
+            return None
+        if file_hash(path, "md5") != current["md5"]:
+            return None
+        return {**current, "files": [name]}
+
+    @staticmethod
+    def _remove_members(extract_dir: Path, members) -> None:
+        for member in members:
+            (extract_dir / member).unlink(missing_ok=True)
+
+    @staticmethod
+    def _read_ledger(path: Path) -> dict[str, dict]:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable download ledger %s: %s", path, e)
+            return {}
+
+    @staticmethod
+    def _write_ledger(path: Path, ledger: dict[str, dict]) -> None:
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(ledger, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        tmp.replace(path)
 
     def _fallback_fetch(self, item_id: str, extract_dir: Path) -> Path:
         """Fallback: try common file patterns if metadata fetch fails."""
@@ -94,9 +190,8 @@ class InternetArchiveIngestor(BaseIngestor):
             url = f"{download_base}/{item_id}.{ext}"
             try:
                 if ext == "zip":
-                    data = self.http_cache.fetch_bytes(url)
-                    with zipfile.ZipFile(BytesIO(data)) as zf:
-                        zf.extractall(extract_dir)
+                    archive = self.http_cache.fetch_file(url)
+                    extract_members(archive, extract_dir, _PARSED_SUFFIXES, source=f"{item_id}.zip")
                 else:
                     content = self.http_cache.fetch(url)
                     (extract_dir / f"{item_id}.{ext}").write_text(content, encoding="utf-8")
@@ -144,27 +239,24 @@ class InternetArchiveIngestor(BaseIngestor):
         )
 
     def _parse_xml_files(self, xml_files: list[Path]) -> list[Title]:
-        """Parse XML statute files."""
+        """Parse XML statute files, streaming each one (see ``iter_xml_titles``)."""
         titles = []
         for xml_file in sorted(xml_files):
             try:
-                tree = etree.parse(str(xml_file))
-                root = tree.getroot()
-                ns = ""
-                if root.tag.startswith("{"):
-                    ns = root.tag.split("}")[0] + "}"
-
-                for title_elem in root.findall(f".//{ns}title") or [root]:
-                    title = self._parse_title_xml(title_elem, ns)
+                file_titles = []
+                for found in iter_xml_titles(xml_file, self._parse_section_xml):
+                    title = self._parse_title_xml(found)
                     if title and title.chapters:
-                        titles.append(title)
+                        file_titles.append(title)
+                titles.extend(file_titles)
             except Exception as e:
                 logger.warning("Failed to parse XML %s: %s", xml_file, e)
 
         return titles
 
-    def _parse_title_xml(self, elem, ns: str) -> Title | None:
+    def _parse_title_xml(self, found: XmlTitle) -> Title | None:
         """Parse a title from XML."""
+        elem, ns = found.elem, found.ns
         num_elem = elem.find(f"{ns}num") or elem.find("num")
         heading_elem = elem.find(f"{ns}heading") or elem.find("heading")
 
@@ -176,15 +268,14 @@ class InternetArchiveIngestor(BaseIngestor):
         title_id = f"title-{_slugify(num or heading or 'unknown')}"
 
         chapters = []
-        for ch_elem in (elem.findall(f".//{ns}chapter") or elem.findall(".//chapter") or
-                        elem.findall(f".//{ns}article") or elem.findall(".//article")):
-            chapter = self._parse_chapter_xml(ch_elem, ns)
+        for division in found.chapters or found.articles:
+            chapter = self._parse_chapter_xml(division, ns)
             if chapter:
                 chapters.append(chapter)
 
         if not chapters:
             # Try sections directly
-            sections = self._find_sections_xml(elem, ns)
+            sections = found.sections
             if sections:
                 chapters.append(Chapter(
                     id="chapter-1", number="1",
@@ -196,8 +287,9 @@ class InternetArchiveIngestor(BaseIngestor):
 
         return Title(id=title_id, number=num, heading=heading, chapters=chapters)
 
-    def _parse_chapter_xml(self, elem, ns: str) -> Chapter | None:
+    def _parse_chapter_xml(self, division: XmlDivision, ns: str) -> Chapter | None:
         """Parse a chapter from XML."""
+        elem = division.elem
         num_elem = elem.find(f"{ns}num") or elem.find("num")
         heading_elem = elem.find(f"{ns}heading") or elem.find("heading")
 
@@ -207,38 +299,34 @@ class InternetArchiveIngestor(BaseIngestor):
                    elem.get("heading", ""))
 
         chapter_id = f"chapter-{_slugify(num or heading or 'unknown')}"
-        sections = self._find_sections_xml(elem, ns)
+        sections = division.sections
 
         if not sections:
             return None
 
         return Chapter(id=chapter_id, number=num, heading=heading, sections=sections)
 
-    def _find_sections_xml(self, parent, ns: str) -> list[Section]:
-        """Find sections within an XML element."""
-        sections = []
-        for sec_elem in parent.findall(f".//{ns}section") or parent.findall(".//section"):
-            num_elem = sec_elem.find(f"{ns}num") or sec_elem.find("num")
-            heading_elem = sec_elem.find(f"{ns}heading") or sec_elem.find("heading")
-
-            num = clean_section_number(
-                num_elem.text.strip() if num_elem is not None and num_elem.text else
-                sec_elem.get("number", "")
-            )
-            if not num:
-                continue
+    def _parse_section_xml(self, sec_elem, ns: str) -> Section | None:
+        """Parse a section from XML."""
+        num_elem = sec_elem.find(f"{ns}num") or sec_elem.find("num")
+        heading_elem = sec_elem.find(f"{ns}heading") or sec_elem.find("heading")
 
-            heading = (heading_elem.text.strip() if heading_elem is not None and heading_elem.text else "")
-            text = clean_text("".join(sec_elem.itertext()))
+        num = clean_section_number(
+            num_elem.text.strip() if num_elem is not None and num_elem.text else
+            sec_elem.get("number", "")
+        )
+        if not num:
+            return None
 
-            sections.append(Section(
-                id=f"section-{_slugify(num)}",
-                number=num,
-                heading=heading,
-                text=text,
-            ))
+        heading = (heading_elem.text.strip() if heading_elem is not None and heading_elem.text else "")
+        text = clean_text("".join(sec_elem.itertext()))
 
-        return sections
+        return Section(
+            id=f"section-{_slugify(num)}",
+            number=num,
+            heading=heading,
+            text=text,
+        )
 
     def _parse_html_files(self, html_files: list[Path]) -> list[Title]:
         """Parse HTML statute files."""
@@ -248,7 +336,7 @@ class InternetArchiveIngestor(BaseIngestor):
         for html_file in sorted(html_files):
             try:
                 content = html_file.read_text(encoding="utf-8", errors="replace")
-                soup = BeautifulSoup(content, "html.parser")
+                soup = BeautifulSoup(content, self.parser)
 
                 # Try to find title/chapter structure in HTML
                 title = self._parse_html_doc(soup, html_file.stem)
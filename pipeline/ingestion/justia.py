@@ -8,7 +8,6 @@ from __future__ import annotations
 
 import logging
 import re
-import time
 from pathlib import Path
 from urllib.parse import urljoin
 
@@ -16,71 +15,89 @@ from bs4 import BeautifulSoup
 
 from .base import BaseIngestor, Chapter, Section, StateCode, StructureLevel, Title
 from ..normalization.text_cleaner import clean_text, clean_section_number
-from ..utils.cache import HttpCache
+from ..utils.crawler import DEFAULT_MAX_PER_HOST
+from ..utils.frontier import FrontierItem
+from ..utils.links import extract_links
 from ..utils.rate_limiter import RateLimiter
+from ..utils.retry import RetryPolicy
+from ..utils.urls import canonicalize_url
 
 logger = logging.getLogger(__name__)
 
 JUSTIA_BASE = "https://law.justia.com/codes/"
 
+# Main listing container, depending on the page layout; the whole page if neither
+CONTENT_AREAS = (("div", "class", "codes-listing"), ("div", "id", "codes"))
+
 
 class JustiaIngestor(BaseIngestor):
     """Scrape statutes from Justia's free law resources."""
 
     def __init__(self, state: str, config: dict, cache_dir: Path | None = None):
         super().__init__(state, config, cache_dir)
-        self.http_cache = HttpCache(
-            cache_dir=(cache_dir or Path("cache")) / "http",
+        self.http_cache = self._make_http_cache(
             ttl=7 * 24 * 3600,  # 7 day cache
             rate_limiter=RateLimiter(requests_per_second=1.0, burst=2),
+            retry_policy=RetryPolicy(attempts=3, base_delay=5),
         )
         self.base_url = self.config["url"].rstrip("/") + "/"
-        self.max_retries = 3
-        self.retry_delay = 5
+        self.max_per_host = config.get("max_per_host", DEFAULT_MAX_PER_HOST)
 
     def fetch(self) -> Path:
-        """Scrape the state's statute pages from Justia."""
+        """Crawl the state's statute pages from Justia.
+
+        The crawl is resumable: its frontier is kept on disk, so an
+        interrupted run continues with the pages it had not fetched yet.
+        """
         raw_dir = self.cache_dir / "raw" / self.state / "justia"
         raw_dir.mkdir(parents=True, exist_ok=True)
 
-        # Step 1: Fetch the state index page
-        index_html = self._fetch_with_retry(self.base_url)
-        index_path = raw_dir / "index.html"
-        index_path.write_text(index_html, encoding="utf-8")
-
-        # Step 2: Parse the index to find title/chapter links
-        soup = BeautifulSoup(index_html, "html.parser")
-        title_links = self._extract_title_links(soup)
-
-        logger.info("Found %d top-level links for %s", len(title_links), self.state)
-
-        # Step 3: Fetch each title page
-        for i, (title_url, title_name) in enumerate(title_links):
-            safe_name = _slugify(title_name or f"title-{i}")
-            title_dir = raw_dir / safe_name
-            title_dir.mkdir(parents=True, exist_ok=True)
-
-            try:
-                title_html = self._fetch_with_retry(title_url)
-                (title_dir / "index.html").write_text(title_html, encoding="utf-8")
+        seed = FrontierItem(self.base_url, data={"kind": "index", "dest": str(raw_dir / "index.html")})
+        with self._open_frontier("justia") as frontier:
+            self._crawl(frontier, [seed], self._handle_page)
+            index_error = frontier.error(self.base_url)
+        if index_error:
+            raise RuntimeError(f"Failed to fetch Justia index {self.base_url}: {index_error}")
 
-                # Parse title page for chapter links
-                title_soup = BeautifulSoup(title_html, "html.parser")
-                chapter_links = self._extract_chapter_links(title_soup, title_url)
+        return raw_dir
 
-                # Fetch each chapter/section page
-                for j, (ch_url, ch_name) in enumerate(chapter_links):
-                    safe_ch = _slugify(ch_name or f"chapter-{j}")
-                    try:
-                        ch_html = self._fetch_with_retry(ch_url)
-                        (title_dir / f"{safe_ch}.html").write_text(ch_html, encoding="utf-8")
-                    except Exception as e:
-                        logger.warning("Failed to fetch chapter %s: %s", ch_url, e)
+    def _handle_page(self, item: FrontierItem, html: str) -> list[FrontierItem]:
+        """Save a crawled page and return the links to follow from it.
 
-            except Exception as e:
-                logger.warning("Failed to fetch title %s: %s", title_url, e)
+        index -> title pages (one directory each) -> chapter/section pages.
+        """
+        dest = Path(item.data["dest"])
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_text(html, encoding="utf-8")
+        kind = item.data["kind"]
+
+        if kind == "index":
+            title_links = self._extract_title_links(html)
+            logger.info("Found %d top-level links for %s", len(title_links), self.state)
+            return [
+                item.child(
+                    title_url,
+                    kind="title",
+                    dest=str(dest.parent / _slugify(title_name or f"title-{i}") / "index.html"),
+                )
+                for i, (title_url, title_name) in enumerate(title_links)
+            ]
+
+        if kind == "chapter":
+            self._parse_at_fetch(self._parse_chapter_file, dest)
+
+        if kind == "title":
+            chapter_links = self._extract_chapter_links(html, item.url)
+            return [
+                item.child(
+                    ch_url,
+                    kind="chapter",
+                    dest=str(dest.parent / f"{_slugify(ch_name or f'chapter-{j}')}.html"),
+                )
+                for j, (ch_url, ch_name) in enumerate(chapter_links)
+            ]
 
-        return raw_dir
+        return []
 
     def parse(self, raw_path: Path) -> StateCode:
         """Parse scraped Justia HTML into a StateCode."""
@@ -92,8 +109,14 @@ class JustiaIngestor(BaseIngestor):
             key=lambda d: _sort_key(d.name),
         )
 
+        # Chapter files from every title at once, so parse workers stay busy
+        chapter_files = {title_dir: self._chapter_files(title_dir) for title_dir in title_dirs}
+        all_files = [ch_file for files in chapter_files.values() for ch_file in files]
+        parsed = dict(zip(all_files, self._parse_files(self._parse_chapter_file, all_files)))
+
         for title_dir in title_dirs:
-            title = self._parse_title_dir(title_dir)
+            chapters = [parsed[f] for f in chapter_files[title_dir] if parsed[f]]
+            title = self._parse_title_dir(title_dir, chapters)
             if title and title.chapters:
                 titles.append(title)
 
@@ -112,31 +135,12 @@ class JustiaIngestor(BaseIngestor):
             titles=titles,
         )
 
-    def _fetch_with_retry(self, url: str) -> str:
-        """Fetch URL with exponential backoff retry."""
-        last_error = None
-        for attempt in range(self.max_retries):
-            try:
-                return self.http_cache.fetch(url)
-            except Exception as e:
-                last_error = e
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2 ** attempt)
-                    logger.info("Retry %d for %s in %ds: %s", attempt + 1, url, delay, e)
-                    time.sleep(delay)
-        raise last_error
-
-    def _extract_title_links(self, soup: BeautifulSoup) -> list[tuple[str, str]]:
+    def _extract_title_links(self, html: str) -> list[tuple[str, str]]:
         """Extract title/top-level division links from the state index page."""
         links = []
 
         # Justia uses various layouts. Look for the main content area.
-        content = soup.find("div", class_="codes-listing") or soup.find("div", id="codes") or soup
-
-        for a in content.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(strip=True)
-
+        for href, text in extract_links(html, within=CONTENT_AREAS):
             # Filter for actual code links (not navigation, not external)
             if not text or len(text) < 2:
                 continue
@@ -153,21 +157,17 @@ class JustiaIngestor(BaseIngestor):
         seen = set()
         unique = []
         for url, name in links:
-            normalized = url.rstrip("/")
-            if normalized not in seen:
-                seen.add(normalized)
+            canonical = canonicalize_url(url)
+            if canonical not in seen:
+                seen.add(canonical)
                 unique.append((url, name))
 
         return unique
 
-    def _extract_chapter_links(self, soup: BeautifulSoup, parent_url: str) -> list[tuple[str, str]]:
+    def _extract_chapter_links(self, html: str, parent_url: str) -> list[tuple[str, str]]:
         """Extract chapter/sub-division links from a title page."""
         links = []
-        content = soup.find("div", class_="codes-listing") or soup.find("div", id="codes") or soup
-
-        for a in content.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(strip=True)
+        for href, text in extract_links(html, within=CONTENT_AREAS):
             if not text or href.startswith("#") or href.startswith("javascript"):
                 continue
 
@@ -179,15 +179,22 @@ class JustiaIngestor(BaseIngestor):
         seen = set()
         unique = []
         for url, name in links:
-            normalized = url.rstrip("/")
-            if normalized not in seen:
-                seen.add(normalized)
+            canonical = canonicalize_url(url)
+            if canonical not in seen:
+                seen.add(canonical)
                 unique.append((url, name))
 
         return unique
 
-    def _parse_title_dir(self, title_dir: Path) -> Title | None:
-        """Parse a title directory containing scraped HTML files."""
+    def _chapter_files(self, title_dir: Path) -> list[Path]:
+        """A title's chapter pages, in chapter order."""
+        return sorted(
+            [f for f in title_dir.glob("*.html") if f.name != "index.html"],
+            key=lambda f: _sort_key(f.stem),
+        )
+
+    def _parse_title_dir(self, title_dir: Path, chapters: list[Chapter]) -> Title | None:
+        """Build a title from its directory and its already-parsed chapter files."""
         title_num = title_dir.name
         title_heading = ""
 
@@ -195,29 +202,17 @@ class JustiaIngestor(BaseIngestor):
         index_file = title_dir / "index.html"
         if index_file.exists():
             try:
-                soup = BeautifulSoup(index_file.read_text(encoding="utf-8", errors="replace"), "html.parser")
+                soup = BeautifulSoup(index_file.read_text(encoding="utf-8", errors="replace"), self.parser)
                 h1 = soup.find("h1") or soup.find("h2")
                 if h1:
                     title_heading = h1.get_text(strip=True)
             except Exception:
                 pass
 
-        # Parse chapter files
-        chapters = []
-        chapter_files = sorted(
-            [f for f in title_dir.glob("*.html") if f.name != "index.html"],
-            key=lambda f: _sort_key(f.stem),
-        )
-
-        for ch_file in chapter_files:
-            chapter = self._parse_chapter_file(ch_file)
-            if chapter:
-                chapters.append(chapter)
-
         # If no chapter files, try to extract sections from the index page itself
         if not chapters and index_file.exists():
             try:
-                soup = BeautifulSoup(index_file.read_text(encoding="utf-8", errors="replace"), "html.parser")
+                soup = BeautifulSoup(index_file.read_text(encoding="utf-8", errors="replace"), self.parser)
                 sections = self._extract_sections_from_page(soup)
                 if sections:
                     chapters.append(Chapter(
@@ -250,7 +245,7 @@ class JustiaIngestor(BaseIngestor):
         """Parse a chapter HTML file for sections."""
         try:
             content = ch_file.read_text(encoding="utf-8", errors="replace")
-            soup = BeautifulSoup(content, "html.parser")
+            soup = BeautifulSoup(content, self.parser)
 
             # Get chapter heading
             heading = ""
@@ -7,16 +7,14 @@ from __future__ import annotations
 
 import logging
 import re
-import zipfile
-from io import BytesIO
 from pathlib import Path
 
-from lxml import etree
-
 from .base import BaseIngestor, Chapter, Section, StateCode, StructureLevel, Title
 from ..normalization.text_cleaner import clean_text, clean_section_number
-from ..utils.cache import HttpCache
+from ..utils.archives import extract_members
+from ..utils.links import extract_links
 from ..utils.rate_limiter import RateLimiter
+from ..utils.xml_stream import XmlDivision, XmlTitle, iter_xml_titles
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +24,7 @@ class LawResourceOrgIngestor(BaseIngestor):
 
     def __init__(self, state: str, config: dict, cache_dir: Path | None = None):
         super().__init__(state, config, cache_dir)
-        self.http_cache = HttpCache(
-            cache_dir=(cache_dir or Path("cache")) / "http",
+        self.http_cache = self._make_http_cache(
             rate_limiter=RateLimiter(requests_per_second=2.0),
         )
 
@@ -44,41 +41,35 @@ class LawResourceOrgIngestor(BaseIngestor):
             return extract_dir
 
         # Law.Resource.Org has XML in subdirectories like state.xml.2012/
-        from bs4 import BeautifulSoup
-
         extract_dir.mkdir(parents=True, exist_ok=True)
         downloaded = 0
 
         # Fetch the top-level index
         index_html = self.http_cache.fetch(base_url + "/")
-        soup = BeautifulSoup(index_html, "html.parser")
+        index_links = [href for href, _ in extract_links(index_html)]
 
         # Collect all URLs to check (top-level + subdirectories)
-        urls_to_scan = [(base_url, soup)]
+        urls_to_scan = [(base_url, index_links)]
 
         # Find subdirectories that might contain XML
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
+        for href in index_links:
             if href.endswith("/index.html") and "xml" in href.lower():
                 subdir_url = base_url + "/" + href.replace("/index.html", "")
                 try:
                     sub_html = self.http_cache.fetch(subdir_url + "/index.html")
-                    sub_soup = BeautifulSoup(sub_html, "html.parser")
-                    urls_to_scan.append((subdir_url, sub_soup))
+                    urls_to_scan.append((subdir_url, [h for h, _ in extract_links(sub_html)]))
                 except Exception as e:
                     logger.debug("Skip subdir %s: %s", subdir_url, e)
 
         # Download all XML/zip files from all directories
-        for dir_url, dir_soup in urls_to_scan:
-            for link in dir_soup.find_all("a", href=True):
-                href = link["href"]
+        for dir_url, dir_links in urls_to_scan:
+            for href in dir_links:
                 if href.endswith(".xml") or href.endswith(".zip"):
                     file_url = dir_url + "/" + href if not href.startswith("http") else href
                     try:
                         if href.endswith(".zip"):
-                            data = self.http_cache.fetch_bytes(file_url)
-                            with zipfile.ZipFile(BytesIO(data)) as zf:
-                                zf.extractall(extract_dir)
+                            archive = self.http_cache.fetch_file(file_url)
+                            extract_members(archive, extract_dir, (".xml",), source=href)
                         else:
                             content = self.http_cache.fetch(file_url)
                             (extract_dir / href).write_text(content, encoding="utf-8")
@@ -123,28 +114,22 @@ class LawResourceOrgIngestor(BaseIngestor):
         )
 
     def _parse_xml_file(self, xml_file: Path) -> list[Title]:
-        """Parse a single XML file, which may contain one or more titles."""
-        tree = etree.parse(str(xml_file))
-        root = tree.getroot()
-        ns = self._detect_namespace(root)
+        """Parse a single XML file, which may contain one or more titles.
 
+        The file is streamed (see ``iter_xml_titles``); the whole file
+        might be a single title.
+        """
         titles = []
-
-        # Look for title-level elements
-        title_elements = root.findall(f".//{ns}title") or root.findall(".//title")
-        if not title_elements:
-            # The whole file might be a single title
-            title_elements = [root]
-
-        for title_elem in title_elements:
-            title = self._parse_title_element(title_elem, ns)
+        for found in iter_xml_titles(xml_file, self._parse_section_element):
+            title = self._parse_title_element(found)
             if title and (title.chapters or title.heading):
                 titles.append(title)
 
         return titles
 
-    def _parse_title_element(self, elem, ns: str) -> Title | None:
+    def _parse_title_element(self, found: XmlTitle) -> Title | None:
         """Parse a title XML element."""
+        elem, ns = found.elem, found.ns
         num = self._get_text(elem, f"{ns}num") or self._get_text(elem, "num") or ""
         heading = self._get_text(elem, f"{ns}heading") or self._get_text(elem, "heading") or ""
 
@@ -157,21 +142,16 @@ class LawResourceOrgIngestor(BaseIngestor):
 
         # Find chapters
         chapters = []
-        chapter_elems = (
-            elem.findall(f".//{ns}chapter") or
-            elem.findall(".//chapter") or
-            elem.findall(f".//{ns}article") or
-            elem.findall(".//article")
-        )
+        divisions = found.chapters or found.articles
 
-        if chapter_elems:
-            for ch_elem in chapter_elems:
-                chapter = self._parse_chapter_element(ch_elem, ns)
+        if divisions:
+            for division in divisions:
+                chapter = self._parse_chapter_element(division, ns)
                 if chapter:
                     chapters.append(chapter)
         else:
             # No chapter subdivision - sections directly under title
-            sections = self._find_sections(elem, ns)
+            sections = found.sections
             if sections:
                 chapters.append(Chapter(
                     id="chapter-1",
@@ -185,8 +165,9 @@ class LawResourceOrgIngestor(BaseIngestor):
 
         return Title(id=title_id, number=num, heading=heading, chapters=chapters)
 
-    def _parse_chapter_element(self, elem, ns: str) -> Chapter | None:
+    def _parse_chapter_element(self, division: XmlDivision, ns: str) -> Chapter | None:
         """Parse a chapter XML element."""
+        elem = division.elem
         num = self._get_text(elem, f"{ns}num") or self._get_text(elem, "num") or ""
         heading = self._get_text(elem, f"{ns}heading") or self._get_text(elem, "heading") or ""
 
@@ -197,27 +178,12 @@ class LawResourceOrgIngestor(BaseIngestor):
 
         chapter_id = f"chapter-{self._slugify(num or heading)}"
 
-        sections = self._find_sections(elem, ns)
+        sections = division.sections
         if not sections:
             return None
 
         return Chapter(id=chapter_id, number=num, heading=heading, sections=sections)
 
-    def _find_sections(self, parent, ns: str) -> list[Section]:
-        """Find and parse all section elements within a parent."""
-        sections = []
-        section_elems = (
-            parent.findall(f".//{ns}section") or
-            parent.findall(".//section")
-        )
-
-        for sec_elem in section_elems:
-            section = self._parse_section_element(sec_elem, ns)
-            if section:
-                sections.append(section)
-
-        return sections
-
     def _parse_section_element(self, elem, ns: str) -> Section | None:
         """Parse a section XML element."""
         num = self._get_text(elem, f"{ns}num") or self._get_text(elem, "num") or ""
@@ -270,14 +236,6 @@ class LawResourceOrgIngestor(BaseIngestor):
             history=history,
         )
 
-    def _detect_namespace(self, root) -> str:
-        """Detect XML namespace from root element."""
-        tag = root.tag
-        if tag.startswith("{"):
-            ns = tag.split("}")[0] + "}"
-            return ns
-        return ""
-
     def _get_text(self, elem, tag: str) -> str | None:
         """Get text content of a child element."""
         child = elem.find(tag)
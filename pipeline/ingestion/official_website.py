@@ -9,16 +9,25 @@ from __future__ import annotations
 import json
 import logging
 import re
-import time
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
+from typing import Any
 from urllib.parse import urljoin, quote
 
 from bs4 import BeautifulSoup, Tag
 
 from .base import BaseIngestor, Chapter, Section, StateCode, StructureLevel, Title
 from ..normalization.text_cleaner import clean_text, clean_section_number
-from ..utils.cache import HttpCache
+from ..utils.crawler import DEFAULT_MAX_PER_HOST
+from ..utils.extraction_profile import ExtractionProfile
+from ..utils.frontier import FrontierItem
+from ..utils.links import extract_links
 from ..utils.rate_limiter import RateLimiter
+from ..utils.retry import RetryPolicy
+from ..utils.section_numbers import SECTION_NUMBER, SectionNumberMatcher
+from ..utils.text_index import TextIndex
+from ..utils.urls import canonicalize_url
 
 logger = logging.getLogger(__name__)
 
@@ -29,27 +38,20 @@ class OfficialWebsiteIngestor(BaseIngestor):
     def __init__(self, state: str, config: dict, cache_dir: Path | None = None):
         super().__init__(state, config, cache_dir)
         verify_ssl = config.get("verify_ssl", True)
-        self.http_cache = HttpCache(
-            cache_dir=(cache_dir or Path("cache")) / "http",
+        self.http_cache = self._make_http_cache(
             ttl=7 * 24 * 3600,
             rate_limiter=RateLimiter(requests_per_second=3.0, burst=5),
             verify_ssl=verify_ssl,
+            retry_policy=RetryPolicy(attempts=3, base_delay=3),
         )
         self.base_url = config["url"].rstrip("/")
-        self.max_retries = 3
+        self.max_per_host = config.get("max_per_host", DEFAULT_MAX_PER_HOST)
+        # Set for the duration of parse() unless extraction_profile is off
+        self.profile: ExtractionProfile | None = None
 
     def _fetch_page(self, url: str) -> str:
-        """Fetch a URL with retries."""
-        for attempt in range(self.max_retries):
-            try:
-                return self.http_cache.fetch(url)
-            except Exception as e:
-                if attempt < self.max_retries - 1:
-                    delay = 3 * (2 ** attempt)
-                    logger.info("Retry %d for %s: %s", attempt + 1, url, e)
-                    time.sleep(delay)
-                else:
-                    raise
+        """Fetch a URL, retrying transient failures (404s fail immediately)."""
+        return self.http_cache.fetch_with_retry(url)
 
     def fetch(self) -> Path:
         """Fetch all pages for this state, save to cache dir."""
@@ -65,12 +67,38 @@ class OfficialWebsiteIngestor(BaseIngestor):
         return raw_dir
 
     def parse(self, raw_path: Path) -> StateCode:
-        """Parse cached HTML into a StateCode."""
-        handler = _PARSE_HANDLERS.get(self.state)
-        if handler:
-            titles = handler(self, raw_path)
-        else:
-            titles = self._generic_parse(raw_path)
+        """Parse cached HTML into a StateCode.
+
+        Section extraction is steered by the state's extraction profile
+        (see utils.extraction_profile) unless ``extraction_profile: false``
+        is configured. If a profiled parse yields fewer sections than the
+        profile was learned from, the state is parsed again with every
+        pattern and the profile relearned.
+        """
+        profile_path = self.cache_dir / "profiles" / f"{self.state}-official.json"
+        if self.config.get("extraction_profile", True):
+            self.profile = ExtractionProfile.load(profile_path, SECTION_NUMBER, _SECTION_BLOCK_TAGS, self.parser)
+        try:
+            titles = self._parse_titles(raw_path)
+            if self.profile is not None:
+                count = sum(len(c.sections) for t in titles for c in t.chapters)
+                if self.profile.learned and count < self.profile.sections:
+                    logger.info(
+                        "Profiled extraction for %s found %d sections, %d expected; reparsing with all patterns",
+                        self.state, count, self.profile.sections,
+                    )
+                    self.profile = self.profile.relearn()
+                    self.reuse_parses = False
+                    try:
+                        titles = self._parse_titles(raw_path)
+                    finally:
+                        self.reuse_parses = self.config.get("parse_cache", True)
+                    count = sum(len(c.sections) for t in titles for c in t.chapters)
+                logger.info("Sections for %s: %s", self.state, self.profile.summary())
+                if self.profile.seen_patterns:
+                    self.profile.save(profile_path, count)
+        finally:
+            self.profile = None
 
         return StateCode(
             state=self.state,
@@ -87,47 +115,84 @@ class OfficialWebsiteIngestor(BaseIngestor):
             titles=titles,
         )
 
+    def _parse_titles(self, raw_path: Path) -> list[Title]:
+        handler = _PARSE_HANDLERS.get(self.state)
+        if handler:
+            return handler(self, raw_path)
+        return self._generic_parse(raw_path)
+
     # ================================================================
     # Generic fetcher: download index page, follow title/chapter links
     # ================================================================
 
     def _generic_fetch(self, raw_dir: Path) -> None:
-        """Generic: fetch index, then follow links 2 levels deep."""
-        index_html = self._fetch_page(self.base_url)
-        (raw_dir / "index.html").write_text(index_html, encoding="utf-8")
-
-        soup = BeautifulSoup(index_html, "html.parser")
-        links = self._find_code_links(soup, self.base_url)
-        logger.info("Found %d top-level links for %s", len(links), self.state)
-
-        for i, (url, text) in enumerate(links[:200]):
-            safe = _slugify(text or f"item-{i}")[:60]
-            tdir = raw_dir / safe
-            tdir.mkdir(exist_ok=True)
-            try:
-                html = self._fetch_page(url)
-                (tdir / "index.html").write_text(html, encoding="utf-8")
-                sub_soup = BeautifulSoup(html, "html.parser")
-                sub_links = self._find_code_links(sub_soup, url)
-                for j, (sub_url, sub_text) in enumerate(sub_links[:300]):
-                    safe_sub = _slugify(sub_text or f"sub-{j}")[:60]
-                    try:
-                        sub_html = self._fetch_page(sub_url)
-                        (tdir / f"{safe_sub}.html").write_text(sub_html, encoding="utf-8")
-                    except Exception as e:
-                        logger.debug("Skip %s: %s", sub_url, e)
-            except Exception as e:
-                logger.warning("Skip title %s: %s", url, e)
+        """Generic: fetch index, then follow links 2 levels deep (resumable crawl)."""
+        seed = FrontierItem(self.base_url, data={"kind": "index", "dest": str(raw_dir / "index.html")})
+        with self._open_frontier("generic") as frontier:
+            self._crawl(frontier, [seed], self._handle_generic_page)
+            index_error = frontier.error(self.base_url)
+        if index_error:
+            raise RuntimeError(f"Failed to fetch index {self.base_url}: {index_error}")
+
+    def _handle_generic_page(self, item: FrontierItem, html: str) -> list[FrontierItem]:
+        """Save a page of the generic crawl and return the links to follow.
+
+        index -> title pages (one directory each) -> sub-pages.
+        """
+        dest = Path(item.data["dest"])
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_text(html, encoding="utf-8")
+        kind = item.data["kind"]
+
+        if kind == "index":
+            links = self._find_code_links(html, self.base_url)[:200]
+            logger.info("Found %d top-level links for %s", len(links), self.state)
+            return [
+                item.child(
+                    url,
+                    kind="title",
+                    dest=str(dest.parent / _slugify(text or f"item-{i}")[:60] / "index.html"),
+                )
+                for i, (url, text) in enumerate(links)
+            ]
+
+        if kind == "sub":
+            self._extract_at_fetch(dest)
+
+        if kind == "title":
+            sub_links = self._find_code_links(html, item.url)
+            return [
+                item.child(
+                    sub_url,
+                    kind="sub",
+                    dest=str(dest.parent / f"{_slugify(sub_text or f'sub-{j}')[:60]}.html"),
+                )
+                for j, (sub_url, sub_text) in enumerate(sub_links[:300])
+            ]
+
+        return []
 
     def _generic_parse(self, raw_path: Path) -> list[Title]:
         """Generic: parse directories as titles, files as chapters."""
         titles = []
-        for tdir in sorted(d for d in raw_path.iterdir() if d.is_dir()):
+        tdirs = sorted(d for d in raw_path.iterdir() if d.is_dir())
+        chapter_files = {tdir: _chapter_pages(tdir) for tdir in tdirs}
+        flat_files = _chapter_pages(raw_path)
+        found = self._extract_each(
+            OfficialWebsiteIngestor._extract_sections_from_file,
+            [f for files in chapter_files.values() for f in files] + flat_files,
+        )
+        # A title's index page is only used when none of its chapter pages had sections
+        indexes = [
+            tdir / "index.html" for tdir in tdirs
+            if (tdir / "index.html").exists() and not any(found[f] for f in chapter_files[tdir])
+        ]
+        found.update(self._extract_each(OfficialWebsiteIngestor._extract_sections_from_file, indexes))
+
+        for tdir in tdirs:
             chapters = []
-            for html_file in sorted(tdir.glob("*.html")):
-                if html_file.name == "index.html":
-                    continue
-                sections = self._extract_sections_from_file(html_file)
+            for html_file in chapter_files[tdir]:
+                sections = found[html_file]
                 if sections:
                     chapters.append(Chapter(
                         id=f"chapter-{html_file.stem}",
@@ -137,7 +202,7 @@ class OfficialWebsiteIngestor(BaseIngestor):
                     ))
             idx = tdir / "index.html"
             if idx.exists() and not chapters:
-                sections = self._extract_sections_from_file(idx)
+                sections = found[idx]
                 if sections:
                     chapters.append(Chapter(
                         id=f"chapter-{tdir.name}",
@@ -154,10 +219,8 @@ class OfficialWebsiteIngestor(BaseIngestor):
                 ))
 
         # Also parse flat HTML files in raw_path itself
-        for html_file in sorted(raw_path.glob("*.html")):
-            if html_file.name == "index.html":
-                continue
-            sections = self._extract_sections_from_file(html_file)
+        for html_file in flat_files:
+            sections = found[html_file]
             if sections:
                 name = html_file.stem
                 titles.append(Title(
@@ -174,6 +237,67 @@ class OfficialWebsiteIngestor(BaseIngestor):
 
         return titles
 
+    def _extract_at_fetch(self, path: Path) -> None:
+        """Queue a chapter page fetch() just saved for extraction into the parse cache.
+
+        Uses the per-file function this state's parse handler will use on
+        the page (see ``BaseIngestor._parse_at_fetch``); states with their
+        own page formats are left to parse().
+        """
+        handler = _PARSE_HANDLERS.get(self.state)
+        if handler is None:
+            extract = OfficialWebsiteIngestor._extract_sections_from_file
+        elif handler is _parse_justia_impl:
+            extract = _justia_page_sections
+        else:
+            return
+        self._parse_at_fetch(partial(self._extract_recording, extract), path)
+
+    def _parse_fetched(self, fn: Callable[..., Any], paths: list[Path]) -> None:
+        # Matches are recorded into an unlearned profile, so the cached
+        # results carry what a full extraction saw and the next saved
+        # profile stays complete
+        profile = self.profile
+        self.profile = ExtractionProfile(SECTION_NUMBER, _SECTION_BLOCK_TAGS, self.parser)
+        try:
+            super()._parse_fetched(fn, paths)
+        finally:
+            self.profile = profile
+
+    def _extract_each(
+        self,
+        extract: Callable[[OfficialWebsiteIngestor, Path], list[Section]],
+        paths: list[Path],
+    ) -> dict[Path, list[Section]]:
+        """``extract(self, path)`` for every path, across the parse workers.
+
+        Each call records matches in a scratch copy of the extraction
+        profile, merged back here in path order, so matches made in worker
+        processes (or replayed from the parse cache) still reach the saved
+        profile.
+        """
+        results = self._parse_files(partial(self._extract_recording, extract), paths)
+        found = {}
+        for path, (sections, recorded) in zip(paths, results):
+            if self.profile is not None and recorded is not None:
+                self.profile.merge(recorded)
+            found[path] = sections
+        return found
+
+    def _extract_recording(
+        self,
+        extract: Callable[[OfficialWebsiteIngestor, Path], list[Section]],
+        path: Path,
+    ) -> tuple[list[Section], dict | None]:
+        profile = self.profile
+        if profile is None:
+            return extract(self, path), None
+        self.profile = profile.scratch()
+        try:
+            return extract(self, path), self.profile.recorded()
+        finally:
+            self.profile = profile
+
     def _extract_sections_from_file(self, path: Path) -> list[Section]:
         """Extract sections from an HTML file."""
         try:
@@ -181,27 +305,25 @@ class OfficialWebsiteIngestor(BaseIngestor):
             # Skip binary/PDF files that were saved as .html
             if content.startswith("%PDF") or "\x00" in content[:1000]:
                 return []
-            soup = BeautifulSoup(content, "html.parser")
-            return extract_sections_from_soup(soup)
+            soup = BeautifulSoup(content, self.parser)
+            return extract_sections_from_soup(soup, self.profile)
         except Exception as e:
             logger.debug("Failed to parse %s: %s", path, e)
             return []
 
-    def _find_code_links(self, soup: BeautifulSoup, parent_url: str) -> list[tuple[str, str]]:
+    def _find_code_links(self, html: str, parent_url: str) -> list[tuple[str, str]]:
         """Find statute navigation links in a page."""
         links = []
         seen = set()
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(strip=True)
+        for href, text in extract_links(html):
             if not text or len(text) < 2 or len(text) > 300:
                 continue
             if href.startswith("#") or href.startswith("javascript") or href.startswith("mailto"):
                 continue
             full = urljoin(parent_url, href)
-            normalized = full.rstrip("/")
-            if normalized not in seen and normalized != parent_url.rstrip("/"):
-                seen.add(normalized)
+            canonical = canonicalize_url(full)
+            if canonical not in seen and canonical != canonicalize_url(parent_url):
+                seen.add(canonical)
                 links.append((full, text))
         return links
 
@@ -220,10 +342,7 @@ class OfficialWebsiteIngestor(BaseIngestor):
                     tdir = raw_dir / f"title-{title_num:02d}"
                     tdir.mkdir(exist_ok=True)
                     (tdir / "index.html").write_text(html, encoding="utf-8")
-                    soup = BeautifulSoup(html, "html.parser")
-                    for a in soup.find_all("a", href=True):
-                        href = a["href"]
-                        text = a.get_text(strip=True)
+                    for href, text in extract_links(html):
                         if ".htm" in href:
                             aurl = urljoin(url, href)
                             safe = _slugify(text or href.split("/")[-1])[:60]
@@ -254,9 +373,7 @@ class OfficialWebsiteIngestor(BaseIngestor):
             try:
                 html = self._fetch_page(url)
                 (tdir / "index.html").write_text(html, encoding="utf-8")
-                tsoup = BeautifulSoup(html, "html.parser")
-                for a in tsoup.find_all("a", href=True):
-                    href = a["href"]
+                for href, _ in extract_links(html):
                     if href.endswith(".html") and "c0" in href.lower():
                         surl = urljoin(url, href)
                         sname = _slugify(href.replace(".html", ""))[:60]
@@ -273,11 +390,8 @@ class OfficialWebsiteIngestor(BaseIngestor):
         base_url = "https://legislature.idaho.gov/statutesrules/idstat/"
         index_html = self._fetch_page(base_url)
         (raw_dir / "index.html").write_text(index_html, encoding="utf-8")
-        soup = BeautifulSoup(index_html, "html.parser")
 
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(strip=True)
+        for href, text in extract_links(index_html):
             if "/idstat/Title" in href or "/idstat/title" in href:
                 url = urljoin(base_url, href)
                 safe = _slugify(text or href.split("/")[-1])[:60]
@@ -286,13 +400,11 @@ class OfficialWebsiteIngestor(BaseIngestor):
                 try:
                     html = self._fetch_page(url)
                     (tdir / "index.html").write_text(html, encoding="utf-8")
-                    tsoup = BeautifulSoup(html, "html.parser")
-                    for sa in tsoup.find_all("a", href=True):
-                        sh = sa["href"]
+                    for sh, st in extract_links(html):
                         # Chapter links like /statutesrules/idstat/Title1/T1CH1
                         if re.search(r"T\d+CH\d+", sh):
                             surl = urljoin(url, sh)
-                            sname = _slugify(sa.get_text(strip=True) or sh.split("/")[-1])[:60]
+                            sname = _slugify(st or sh.split("/")[-1])[:60]
                             try:
                                 shtml = self._fetch_page(surl)
                                 (tdir / f"{sname}.html").write_text(shtml, encoding="utf-8")
@@ -319,11 +431,8 @@ class OfficialWebsiteIngestor(BaseIngestor):
         base_url = "https://www.akleg.gov/basis/statutes.asp"
         index_html = self._fetch_page(base_url)
         (raw_dir / "index.html").write_text(index_html, encoding="utf-8")
-        soup = BeautifulSoup(index_html, "html.parser")
 
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(strip=True)
+        for href, text in extract_links(index_html):
             if "statutes.asp" in href and "#" not in href and href != base_url:
                 url = urljoin(base_url, href)
                 safe = _slugify(text or href.split("=")[-1])[:60]
@@ -350,11 +459,8 @@ class OfficialWebsiteIngestor(BaseIngestor):
         base_url = "https://apps.legislature.ky.gov/law/statutes/"
         index_html = self._fetch_page(base_url + "index.aspx")
         (raw_dir / "index.html").write_text(index_html, encoding="utf-8")
-        soup = BeautifulSoup(index_html, "html.parser")
         # Follow title/chapter links
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(strip=True)
+        for href, text in extract_links(index_html):
             if "statute.aspx" in href or "chapter.aspx" in href or "title.aspx" in href:
                 url = urljoin(base_url + "index.aspx", href)
                 safe = _slugify(text or href.split("=")[-1])[:60]
@@ -364,10 +470,7 @@ class OfficialWebsiteIngestor(BaseIngestor):
                     html = self._fetch_page(url)
                     (tdir / "index.html").write_text(html, encoding="utf-8")
                     # Follow deeper links to actual statute text
-                    tsoup = BeautifulSoup(html, "html.parser")
-                    for sa in tsoup.find_all("a", href=True):
-                        sh = sa["href"]
-                        st = sa.get_text(strip=True)
+                    for sh, st in extract_links(html):
                         if "statute.aspx" in sh or "chapter.aspx" in sh:
                             surl = urljoin(url, sh)
                             sname = _slugify(st or sh.split("=")[-1])[:60]
@@ -384,11 +487,8 @@ class OfficialWebsiteIngestor(BaseIngestor):
         index_url = "https://www.revisor.mn.gov/statutes/"
         index_html = self._fetch_page(index_url)
         (raw_dir / "index.html").write_text(index_html, encoding="utf-8")
-        soup = BeautifulSoup(index_html, "html.parser")
         # Follow /statutes/part/ links to get topic pages
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(strip=True)
+        for href, text in extract_links(index_html):
             if "/statutes/part/" in href or "/statutes/cite/" in href:
                 url = urljoin(index_url, href)
                 safe = _slugify(text or href.split("/")[-1])[:60]
@@ -398,10 +498,7 @@ class OfficialWebsiteIngestor(BaseIngestor):
                     html = self._fetch_page(url)
                     (tdir / "index.html").write_text(html, encoding="utf-8")
                     # Follow chapter/cite links within part pages
-                    tsoup = BeautifulSoup(html, "html.parser")
-                    for sa in tsoup.find_all("a", href=True):
-                        sh = sa["href"]
-                        st = sa.get_text(strip=True)
+                    for sh, st in extract_links(html):
                         if "/statutes/cite/" in sh:
                             surl = urljoin(url, sh)
                             sname = _slugify(st or sh.split("/")[-1])[:60]
@@ -418,9 +515,7 @@ class OfficialWebsiteIngestor(BaseIngestor):
         index_url = "https://www.leg.state.nv.us/nrs/"
         index_html = self._fetch_page(index_url)
         (raw_dir / "index.html").write_text(index_html, encoding="utf-8")
-        soup = BeautifulSoup(index_html, "html.parser")
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
+        for href, _ in extract_links(index_html):
             if href.upper().startswith("NRS-") and href.endswith(".html"):
                 url = urljoin(index_url, href)
                 safe = _slugify(href.replace(".html", ""))[:60]
@@ -435,23 +530,19 @@ class OfficialWebsiteIngestor(BaseIngestor):
         index_url = "https://gc.nh.gov/rsa/html/NHTOC.htm"
         index_html = self._fetch_page(index_url)
         (raw_dir / "index.html").write_text(index_html, encoding="utf-8")
-        soup = BeautifulSoup(index_html, "html.parser")
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
+        for href, text in extract_links(index_html):
             if href.endswith(".htm"):
                 url = urljoin(index_url, href)
-                text = a.get_text(strip=True)
                 safe = _slugify(text or href)[:60]
                 tdir = raw_dir / safe
                 tdir.mkdir(exist_ok=True)
                 try:
                     html = self._fetch_page(url)
                     (tdir / "index.html").write_text(html, encoding="utf-8")
-                    tsoup = BeautifulSoup(html, "html.parser")
-                    for sa in tsoup.find_all("a", href=True):
-                        if sa["href"].endswith(".htm"):
-                            surl = urljoin(url, sa["href"])
-                            sname = _slugify(sa.get_text(strip=True) or sa["href"])[:60]
+                    for sh, st in extract_links(html):
+                        if sh.endswith(".htm"):
+                            surl = urljoin(url, sh)
+                            sname = _slugify(st or sh)[:60]
                             try:
                                 shtml = self._fetch_page(surl)
                                 (tdir / f"{sname}.html").write_text(shtml, encoding="utf-8")
@@ -469,10 +560,7 @@ class OfficialWebsiteIngestor(BaseIngestor):
         index_url = "https://www.ncleg.gov/Laws/GeneralStatutesTOC"
         index_html = self._fetch_page(index_url)
         (raw_dir / "index.html").write_text(index_html, encoding="utf-8")
-        soup = BeautifulSoup(index_html, "html.parser")
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(strip=True)
+        for href, text in extract_links(index_html):
             if "/EnactedLegislation/Statutes" in href or "GeneralStatutes" in href:
                 url = urljoin(index_url, href)
                 safe = _slugify(text or href.split("/")[-1])[:60]
@@ -487,10 +575,7 @@ class OfficialWebsiteIngestor(BaseIngestor):
         base_url = "https://ndlegis.gov/general-information/north-dakota-century-code"
         index_html = self._fetch_page(base_url)
         (raw_dir / "index.html").write_text(index_html, encoding="utf-8")
-        soup = BeautifulSoup(index_html, "html.parser")
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(strip=True)
+        for href, text in extract_links(index_html):
             if "cencode" in href.lower() or "century-code" in href:
                 url = urljoin(base_url, href)
                 safe = _slugify(text or href.split("/")[-1])[:60]
@@ -509,11 +594,8 @@ class OfficialWebsiteIngestor(BaseIngestor):
         base_url = "https://legislature.vermont.gov/statutes/"
         index_html = self._fetch_page(base_url)
         (raw_dir / "index.html").write_text(index_html, encoding="utf-8")
-        soup = BeautifulSoup(index_html, "html.parser")
         # Follow title links, then follow chapter links within each title
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(strip=True)
+        for href, text in extract_links(index_html):
             if "/statutes/title/" in href:
                 url = urljoin(base_url, href)
                 safe = _slugify(text or href.split("/")[-1])[:60]
@@ -522,10 +604,7 @@ class OfficialWebsiteIngestor(BaseIngestor):
                 try:
                     html = self._fetch_page(url)
                     (tdir / "index.html").write_text(html, encoding="utf-8")
-                    tsoup = BeautifulSoup(html, "html.parser")
-                    for sa in tsoup.find_all("a", href=True):
-                        sh = sa["href"]
-                        st = sa.get_text(strip=True)
+                    for sh, st in extract_links(html):
                         if "/statutes/section/" in sh or "/statutes/chapter/" in sh:
                             surl = urljoin(url, sh)
                             sname = _slugify(st or sh.split("/")[-1])[:60]
@@ -550,23 +629,19 @@ class OfficialWebsiteIngestor(BaseIngestor):
         index_url = "https://webserver.rilegislature.gov/Statutes/"
         index_html = self._fetch_page(index_url)
         (raw_dir / "index.html").write_text(index_html, encoding="utf-8")
-        soup = BeautifulSoup(index_html, "html.parser")
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
+        for href, text in extract_links(index_html):
             if "TITLE" in href.upper() and "/" in href:
                 url = urljoin(index_url, href)
-                text = a.get_text(strip=True)
                 safe = _slugify(text or href)[:60]
                 tdir = raw_dir / safe
                 tdir.mkdir(exist_ok=True)
                 try:
                     html = self._fetch_page(url)
                     (tdir / "index.html").write_text(html, encoding="utf-8")
-                    tsoup = BeautifulSoup(html, "html.parser")
-                    for sa in tsoup.find_all("a", href=True):
-                        if sa["href"].endswith(".htm"):
-                            surl = urljoin(url, sa["href"])
-                            sname = _slugify(sa["href"].replace(".htm", ""))[:60]
+                    for sh, _ in extract_links(html):
+                        if sh.endswith(".htm"):
+                            surl = urljoin(url, sh)
+                            sname = _slugify(sh.replace(".htm", ""))[:60]
                             try:
                                 shtml = self._fetch_page(surl)
                                 (tdir / f"{sname}.html").write_text(shtml, encoding="utf-8")
@@ -584,14 +659,12 @@ class OfficialWebsiteIngestor(BaseIngestor):
                 html = self._fetch_page(url)
                 if len(html) < 1000:
                     continue
-                # Parse to find chapter HTML links like /code/t01c001.php
-                soup = BeautifulSoup(html, "html.parser")
                 tdir = raw_dir / f"title-{title_num}"
                 tdir.mkdir(exist_ok=True)
                 (tdir / "index.html").write_text(html, encoding="utf-8")
 
-                for a in soup.find_all("a", href=True):
-                    href = a["href"]
+                # Chapter HTML links like /code/t01c001.php
+                for href, _ in extract_links(html):
                     if "/code/t" in href and href.endswith(".php"):
                         ch_url = urljoin(url, href)
                         ch_name = href.split("/")[-1].replace(".php", "")
@@ -609,11 +682,8 @@ class OfficialWebsiteIngestor(BaseIngestor):
         index_url = "https://app.leg.wa.gov/rcw/"
         index_html = self._fetch_page(index_url)
         (raw_dir / "index.html").write_text(index_html, encoding="utf-8")
-        soup = BeautifulSoup(index_html, "html.parser")
         # Follow title links
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(strip=True)
+        for href, text in extract_links(index_html):
             if "cite=" in href:
                 url = urljoin(index_url, href)
                 safe = _slugify(text or href.split("=")[-1])[:60]
@@ -623,10 +693,7 @@ class OfficialWebsiteIngestor(BaseIngestor):
                     html = self._fetch_page(url)
                     (tdir / "index.html").write_text(html, encoding="utf-8")
                     # Follow chapter links within title pages
-                    tsoup = BeautifulSoup(html, "html.parser")
-                    for sa in tsoup.find_all("a", href=True):
-                        sh = sa["href"]
-                        st = sa.get_text(strip=True)
+                    for sh, st in extract_links(html):
                         if "cite=" in sh and sh != href:
                             surl = urljoin(url, sh)
                             sname = _slugify(st or sh.split("=")[-1])[:60]
@@ -651,10 +718,7 @@ class OfficialWebsiteIngestor(BaseIngestor):
                 tdir = raw_dir / f"chapter-{ch:02d}"
                 tdir.mkdir(exist_ok=True)
                 (tdir / "index.html").write_text(html, encoding="utf-8")
-                soup = BeautifulSoup(html, "html.parser")
-                for a in soup.find_all("a", href=True):
-                    href = a["href"]
-                    text = a.get_text(strip=True)
+                for href, text in extract_links(html):
                     if f"/{ch}/" in href and href.rstrip("/") != f"/{ch}":
                         aurl = urljoin(url, href)
                         safe = _slugify(text or href.split("/")[-1])[:60]
@@ -692,23 +756,19 @@ class OfficialWebsiteIngestor(BaseIngestor):
         index_url = "https://malegislature.gov/Laws/GeneralLaws"
         index_html = self._fetch_page(index_url)
         (raw_dir / "index.html").write_text(index_html, encoding="utf-8")
-        soup = BeautifulSoup(index_html, "html.parser")
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
+        for href, text in extract_links(index_html):
             if "/Laws/GeneralLaws/Part" in href:
                 url = urljoin(index_url, href)
-                text = a.get_text(strip=True)
                 safe = _slugify(text or href.split("/")[-1])[:60]
                 tdir = raw_dir / safe
                 tdir.mkdir(exist_ok=True)
                 try:
                     html = self._fetch_page(url)
                     (tdir / "index.html").write_text(html, encoding="utf-8")
-                    tsoup = BeautifulSoup(html, "html.parser")
-                    for sa in tsoup.find_all("a", href=True):
-                        if "/Chapter" in sa["href"]:
-                            surl = urljoin(url, sa["href"])
-                            sname = _slugify(sa.get_text(strip=True) or sa["href"].split("/")[-1])[:60]
+                    for sh, st in extract_links(html):
+                        if "/Chapter" in sh:
+                            surl = urljoin(url, sh)
+                            sname = _slugify(st or sh.split("/")[-1])[:60]
                             try:
                                 shtml = self._fetch_page(surl)
                                 (tdir / f"{sname}.html").write_text(shtml, encoding="utf-8")
@@ -726,12 +786,9 @@ class OfficialWebsiteIngestor(BaseIngestor):
         index_url = "https://revisor.mo.gov/main/Home.aspx"
         index_html = self._fetch_page(index_url)
         (raw_dir / "index.html").write_text(index_html, encoding="utf-8")
-        soup = BeautifulSoup(index_html, "html.parser")
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
+        for href, text in extract_links(index_html):
             if "OneChapter" in href or "OneTitle" in href:
                 url = urljoin(index_url, href)
-                text = a.get_text(strip=True)
                 safe = _slugify(text or href)[:60]
                 try:
                     html = self._fetch_page(url)
@@ -749,11 +806,8 @@ class OfficialWebsiteIngestor(BaseIngestor):
         index_url = f"{base}/ohio-revised-code"
         index_html = self._fetch_page(index_url)
         (raw_dir / "index.html").write_text(index_html, encoding="utf-8")
-        soup = BeautifulSoup(index_html, "html.parser")
         # Follow title links like ohio-revised-code/title-1
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(strip=True)
+        for href, text in extract_links(index_html):
             if "ohio-revised-code/" in href and href.rstrip("/") != "ohio-revised-code":
                 url = urljoin(index_url, href)
                 safe = _slugify(text or href.split("/")[-1])[:60]
@@ -763,10 +817,7 @@ class OfficialWebsiteIngestor(BaseIngestor):
                     html = self._fetch_page(url)
                     (tdir / "index.html").write_text(html, encoding="utf-8")
                     # Follow chapter links within title pages
-                    tsoup = BeautifulSoup(html, "html.parser")
-                    for sa in tsoup.find_all("a", href=True):
-                        sh = sa["href"]
-                        st = sa.get_text(strip=True)
+                    for sh, st in extract_links(html):
                         if "chapter" in sh.lower() or "section" in sh.lower():
                             surl = urljoin(url, sh)
                             sname = _slugify(st or sh.split("/")[-1])[:60]
@@ -810,11 +861,8 @@ class OfficialWebsiteIngestor(BaseIngestor):
         index_url = "https://legislature.maine.gov/statutes/"
         index_html = self._fetch_page(index_url)
         (raw_dir / "index.html").write_text(index_html, encoding="utf-8")
-        soup = BeautifulSoup(index_html, "html.parser")
         # Links like "1/title1ch0sec0.html"
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(strip=True)
+        for href, text in extract_links(index_html):
             if "title" in href.lower() and href.endswith(".html"):
                 url = urljoin(index_url, href)
                 safe = _slugify(text or href.split("/")[-1].replace(".html", ""))[:60]
@@ -824,10 +872,7 @@ class OfficialWebsiteIngestor(BaseIngestor):
                     html = self._fetch_page(url)
                     (tdir / "index.html").write_text(html, encoding="utf-8")
                     # Follow chapter links within title pages
-                    tsoup = BeautifulSoup(html, "html.parser")
-                    for sa in tsoup.find_all("a", href=True):
-                        sh = sa["href"]
-                        st = sa.get_text(strip=True)
+                    for sh, st in extract_links(html):
                         if sh.endswith(".html") or sh.endswith(".htm"):
                             surl = urljoin(url, sh)
                             sname = _slugify(st or sh.split("/")[-1].replace(".html", ""))[:60]
@@ -916,75 +961,90 @@ class OfficialWebsiteIngestor(BaseIngestor):
         def _is_skip(href):
             return any(skip in href for skip in skip_pats)
 
-        def _extract_links(soup_obj, parent_url, exclude_urls=None):
+        def _extract_links(html, parent_url, exclude_urls=None):
             """Extract state-path links from a page, skipping accounts/login."""
             links = []
-            seen = set(exclude_urls or [])
-            for a in soup_obj.find_all("a", href=True):
-                href = a["href"]
-                text = a.get_text(strip=True)
+            seen = {canonicalize_url(url) for url in exclude_urls or []}
+            seen.add(canonicalize_url(parent_url))
+            for href, text in extract_links(html):
                 if not text or len(text) < 2 or _is_skip(href):
                     continue
                 if f"/codes/{state_slug}/" in href:
                     url = urljoin(parent_url, href)
-                    if url not in seen and url.rstrip("/") != parent_url.rstrip("/"):
-                        seen.add(url)
+                    canonical = canonicalize_url(url)
+                    if canonical not in seen:
+                        seen.add(canonical)
                         links.append((url, text))
             return links
 
-        try:
-            index_html = self._fetch_page(base)
-            (raw_dir / "index.html").write_text(index_html, encoding="utf-8")
-            soup = BeautifulSoup(index_html, "html.parser")
-
-            # Separate year links from title links
-            year_links = []
-            title_links = []
-            all_seen = {base.rstrip("/")}
-            for url, text in _extract_links(soup, base):
-                m = year_pat.search(url)
-                if m:
-                    year_links.append((int(m.group(1)), url, text))
-                else:
-                    title_links.append((url, text))
-                    all_seen.add(url.rstrip("/"))
-
-            # If no direct title links, follow the most recent year to find them
-            if not title_links and year_links:
-                year_links.sort(reverse=True)
-                best_year, year_url, _ = year_links[0]
-                logger.info("Justia %s: no direct titles, following year %d", state_slug, best_year)
-                year_html = self._fetch_page(year_url)
-                year_soup = BeautifulSoup(year_html, "html.parser")
-                for url, text in _extract_links(year_soup, year_url, all_seen):
-                    if not year_pat.search(url):
-                        title_links.append((url, text))
-                        all_seen.add(url.rstrip("/"))
-
+        def _title_items(item, title_links):
             logger.info("Justia %s: found %d title links", state_slug, len(title_links))
+            return [
+                item.child(
+                    url,
+                    kind="title",
+                    dest=str(raw_dir / _slugify(text or url.split("/")[-2])[:60] / "index.html"),
+                )
+                for url, text in title_links
+            ]
+
+        def _handle(item, html):
+            """Save a page and return the links to follow from it."""
+            kind = item.data["kind"]
+            if "dest" in item.data:
+                dest = Path(item.data["dest"])
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                dest.write_text(html, encoding="utf-8")
+
+            if kind == "index":
+                # Separate year links from title links
+                year_links = []
+                title_links = []
+                for url, text in _extract_links(html, base):
+                    m = year_pat.search(url)
+                    if m:
+                        year_links.append((int(m.group(1)), url, text))
+                    else:
+                        title_links.append((url, text))
+                # If no direct title links, follow the most recent year to find them
+                if not title_links and year_links:
+                    year_links.sort(reverse=True)
+                    best_year, year_url, _ = year_links[0]
+                    logger.info("Justia %s: no direct titles, following year %d", state_slug, best_year)
+                    return [item.child(year_url, kind="year")]
+                return _title_items(item, title_links)
+
+            if kind == "year":
+                title_links = [
+                    (url, text)
+                    for url, text in _extract_links(html, item.url, [base.rstrip("/")])
+                    if not year_pat.search(url)
+                ]
+                return _title_items(item, title_links)
+
+            if kind == "chapter":
+                self._extract_at_fetch(dest)
+
+            if kind == "title":
+                # Find chapter links from title page; the frontier drops
+                # links to pages (e.g. other titles) it already knows
+                children = []
+                for ch_url, ch_text in _extract_links(html, item.url, [base.rstrip("/")]):
+                    if year_pat.search(ch_url):
+                        continue
+                    sname = _slugify(ch_text or ch_url.split("/")[-2])[:60]
+                    children.append(item.child(ch_url, kind="chapter", dest=str(dest.parent / f"{sname}.html")))
+                return children
 
-            # Level 2+3: For each title, fetch title page then chapter pages
-            for title_url, title_text in title_links:
-                safe = _slugify(title_text or title_url.split("/")[-2])[:60]
-                tdir = raw_dir / safe
-                tdir.mkdir(exist_ok=True)
-                try:
-                    html = self._fetch_page(title_url)
-                    (tdir / "index.html").write_text(html, encoding="utf-8")
+            return []
 
-                    # Find chapter links from title page
-                    tsoup = BeautifulSoup(html, "html.parser")
-                    for ch_url, ch_text in _extract_links(tsoup, title_url, all_seen):
-                        if year_pat.search(ch_url):
-                            continue
-                        sname = _slugify(ch_text or ch_url.split("/")[-2])[:60]
-                        try:
-                            shtml = self._fetch_page(ch_url)
-                            (tdir / f"{sname}.html").write_text(shtml, encoding="utf-8")
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
+        seed = FrontierItem(base, data={"kind": "index", "dest": str(raw_dir / "index.html")})
+        try:
+            with self._open_frontier(f"justia-{state_slug}") as frontier:
+                self._crawl(frontier, [seed], _handle)
+                index_error = frontier.error(base)
+            if index_error:
+                logger.warning("Failed Justia fetch for %s: %s", state_slug, index_error)
         except Exception as e:
             logger.warning("Failed Justia fetch for %s: %s", state_slug, e)
 
@@ -1119,7 +1179,7 @@ def _parse_idaho_impl(self, raw_path: Path) -> list[Title]:
             content = html_file.read_text(encoding="utf-8", errors="replace")
             if content.startswith("%PDF") or "\x00" in content[:1000]:
                 continue
-            soup = BeautifulSoup(content, "html.parser")
+            soup = BeautifulSoup(content, self.parser)
             sections = []
             seen = set()
             # Find table rows with links to /SECT patterns
@@ -1176,7 +1236,7 @@ def _parse_missouri_impl(self, raw_path: Path) -> list[Title]:
         content = html_file.read_text(encoding="utf-8", errors="replace")
         if content.startswith("%PDF") or "\x00" in content[:1000]:
             continue
-        soup = BeautifulSoup(content, "html.parser")
+        soup = BeautifulSoup(content, self.parser)
         sections = []
         seen = set()
         for a in soup.find_all("a", href=True):
@@ -1225,7 +1285,7 @@ def _parse_washington_impl(self, raw_path: Path) -> list[Title]:
         if html_file.name == "index.html":
             continue
         content = html_file.read_text(encoding="utf-8", errors="replace")
-        soup = BeautifulSoup(content, "html.parser")
+        soup = BeautifulSoup(content, self.parser)
         sections = []
         seen = set()
         for a in soup.find_all("a", href=True):
@@ -1250,7 +1310,7 @@ def _parse_washington_impl(self, raw_path: Path) -> list[Title]:
             ))
         # Also try generic extraction
         if not sections:
-            sections = extract_sections_from_soup(soup)
+            sections = extract_sections_from_soup(soup, self.profile)
         if sections:
             name = html_file.stem
             titles.append(Title(
@@ -1278,7 +1338,7 @@ def _parse_illinois_impl(self, raw_path: Path) -> list[Title]:
             content = html_file.read_text(encoding="utf-8", errors="replace")
             if content.startswith("%PDF") or "\x00" in content[:1000]:
                 continue
-            soup = BeautifulSoup(content, "html.parser")
+            soup = BeautifulSoup(content, self.parser)
             sections = []
             seen = set()
             # ILCS format: "Sec. 1-101. Heading" or "(5 ILCS 100/1-5)"
@@ -1302,7 +1362,7 @@ def _parse_illinois_impl(self, raw_path: Path) -> list[Title]:
                         ))
             # Fallback to generic
             if not sections:
-                sections = extract_sections_from_soup(soup)
+                sections = extract_sections_from_soup(soup, self.profile)
             if sections:
                 ch_name = html_file.stem
                 chapters.append(Chapter(
@@ -1333,45 +1393,67 @@ def _parse_illinois_impl(self, raw_path: Path) -> list[Title]:
     return titles
 
 
+# Section links on Justia chapter pages; no ":" separator, unlike SECTION_NUMBER
+_JUSTIA_LINK_NUMBER = SectionNumberMatcher([
+    ("section_sign", r"(?:§+\s*)([\d\-\.a-zA-Z:]+)\s*[\-–—.\s]+(.*)"),
+    ("section", r"Section\s+([\d\-\.a-zA-Z:]+)\s*[\-–—.\s]+(.*)"),
+    ("numbered", r"^([\d]+[\-\.]\d[\d\-\.a-zA-Z]*)\s*[\-–—.\s]+(.*)"),
+])
+
+
+def _justia_page_sections(self, path: Path, links: bool = True, skip_binary: bool = True) -> list[Section]:
+    """Sections on one page of a Justia-backed state.
+
+    With ``links``, a page without section text falls back to its section
+    links. With ``skip_binary``, PDFs saved as .html yield nothing.
+    """
+    content = path.read_text(encoding="utf-8", errors="replace")
+    if skip_binary and (content.startswith("%PDF") or "\x00" in content[:1000]):
+        return []
+    soup = BeautifulSoup(content, self.parser)
+    sections = extract_sections_from_soup(soup, self.profile)
+    # Also try Justia-specific: look for links with section patterns
+    if not sections and links:
+        seen = set()
+        for a in soup.find_all("a", href=True):
+            text = a.get_text(strip=True)
+            if not text:
+                continue
+            # Justia format: "Section 1-1-1 - Heading" or "§ 1-1. Heading"
+            match = _JUSTIA_LINK_NUMBER.match(text)
+            if match:
+                num = clean_section_number(match.number)
+                if num and num not in seen and len(num) <= 30:
+                    seen.add(num)
+                    heading = match.rest.strip()[:300]
+                    sections.append(Section(
+                        id=f"section-{_slugify(num)}",
+                        number=num,
+                        heading=heading,
+                        text="",
+                    ))
+    return sections
+
+
 def _parse_justia_impl(self, raw_path: Path) -> list[Title]:
     """Parse Justia law pages - used as fallback for LexisNexis-hosted states."""
     titles = []
-    for tdir in sorted(d for d in raw_path.iterdir() if d.is_dir()):
+    tdirs = sorted(d for d in raw_path.iterdir() if d.is_dir())
+    chapter_files = {tdir: _chapter_pages(tdir) for tdir in tdirs}
+    flat_files = _chapter_pages(raw_path)
+    found = self._extract_each(_justia_page_sections, [f for files in chapter_files.values() for f in files])
+    found.update(self._extract_each(partial(_justia_page_sections, links=False), flat_files))
+    # Also parse flat files: a title's index, when none of its chapter pages had sections
+    indexes = [
+        tdir / "index.html" for tdir in tdirs
+        if (tdir / "index.html").exists() and not any(found[f] for f in chapter_files[tdir])
+    ]
+    found.update(self._extract_each(partial(_justia_page_sections, links=False, skip_binary=False), indexes))
+
+    for tdir in tdirs:
         chapters = []
-        for html_file in sorted(tdir.glob("*.html")):
-            if html_file.name == "index.html":
-                continue
-            content = html_file.read_text(encoding="utf-8", errors="replace")
-            if content.startswith("%PDF") or "\x00" in content[:1000]:
-                continue
-            soup = BeautifulSoup(content, "html.parser")
-            sections = extract_sections_from_soup(soup)
-            # Also try Justia-specific: look for links with section patterns
-            if not sections:
-                seen = set()
-                for a in soup.find_all("a", href=True):
-                    text = a.get_text(strip=True)
-                    if not text:
-                        continue
-                    # Justia format: "Section 1-1-1 - Heading" or "§ 1-1. Heading"
-                    for pat in [
-                        re.compile(r"(?:§+\s*)([\d\-\.a-zA-Z:]+)\s*[\-–—.\s]+(.*)", re.DOTALL),
-                        re.compile(r"Section\s+([\d\-\.a-zA-Z:]+)\s*[\-–—.\s]+(.*)", re.DOTALL),
-                        re.compile(r"^([\d]+[\-\.]\d[\d\-\.a-zA-Z]*)\s*[\-–—.\s]+(.*)", re.DOTALL),
-                    ]:
-                        match = pat.match(text)
-                        if match:
-                            num = clean_section_number(match.group(1))
-                            if num and num not in seen and len(num) <= 30:
-                                seen.add(num)
-                                heading = match.group(2).strip()[:300]
-                                sections.append(Section(
-                                    id=f"section-{_slugify(num)}",
-                                    number=num,
-                                    heading=heading,
-                                    text="",
-                                ))
-                            break
+        for html_file in chapter_files[tdir]:
+            sections = found[html_file]
             if sections:
                 ch_name = html_file.stem
                 chapters.append(Chapter(
@@ -1380,13 +1462,10 @@ def _parse_justia_impl(self, raw_path: Path) -> list[Title]:
                     heading=ch_name.replace("-", " ").title(),
                     sections=sections,
                 ))
-        # Also parse flat files
         if not chapters:
             idx = tdir / "index.html"
             if idx.exists():
-                content = idx.read_text(encoding="utf-8", errors="replace")
-                soup = BeautifulSoup(content, "html.parser")
-                sections = extract_sections_from_soup(soup)
+                sections = found[idx]
                 if sections:
                     chapters.append(Chapter(
                         id=f"chapter-{tdir.name}",
@@ -1403,14 +1482,8 @@ def _parse_justia_impl(self, raw_path: Path) -> list[Title]:
             ))
 
     # Also parse flat HTML files in raw_path itself
-    for html_file in sorted(raw_path.glob("*.html")):
-        if html_file.name == "index.html":
-            continue
-        content = html_file.read_text(encoding="utf-8", errors="replace")
-        if content.startswith("%PDF") or "\x00" in content[:1000]:
-            continue
-        soup = BeautifulSoup(content, "html.parser")
-        sections = extract_sections_from_soup(soup)
+    for html_file in flat_files:
+        sections = found[html_file]
         if sections:
             name = html_file.stem
             titles.append(Title(
@@ -1469,104 +1542,112 @@ _PARSE_HANDLERS: dict[str, callable] = {
 # Shared utilities - improved section extraction
 # ================================================================
 
-def extract_sections_from_soup(soup: BeautifulSoup) -> list[Section]:
+# Elements whose text may start a section, and headings for the fallback strategy
+_SECTION_BLOCK_TAGS = frozenset({
+    "p", "div", "li", "span", "td", "h2", "h3", "h4", "h5", "dt", "dd", "b", "strong", "a",
+})
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5"})
+
+
+def extract_sections_from_soup(soup: BeautifulSoup, profile: ExtractionProfile | None = None) -> list[Section]:
     """Extract statute sections from parsed HTML.
 
     Uses multiple strategies to handle different state website formats.
+    Element texts come from a TextIndex, built in one pass over the tree.
+
+    With a learned ``profile`` only the state's known patterns and tags
+    are tried first; a page that yields nothing that way is extracted
+    again with everything. Matches are recorded in the profile either way.
     """
+    index = TextIndex(soup)
+    if profile is not None and profile.learned:
+        sections = _extract_sections(index, profile.matcher, profile.tags, profile, headings=False)
+        if sections:
+            return sections
+        profile.fallbacks += 1
+    return _extract_sections(index, SECTION_NUMBER, _SECTION_BLOCK_TAGS, profile)
+
+
+def _extract_sections(
+    index: TextIndex,
+    matcher: SectionNumberMatcher,
+    tags: frozenset[str],
+    profile: ExtractionProfile | None,
+    headings: bool = True,
+) -> list[Section]:
     sections = []
     seen = set()
 
     # Strategy 1: Section number patterns in text content
-    _SECTION_PATTERNS = [
-        # § 1-1-1. Heading text
-        re.compile(r"(?:§+\s*)([\d\-\.a-zA-Z:]+)\s*[.\-–—:\s]+(.*)", re.DOTALL),
-        # SECTION 1-1-10. Heading (SC, other states with uppercase)
-        re.compile(r"SECTION\s+([\d\-\.a-zA-Z:]+)\s*[.\-–—:\s]+(.*)", re.DOTALL),
-        # NRS 0.010 (Nevada style - may use EN SPACE \u2002 and replacement chars)
-        re.compile(r"NRS[\s\u2002\u00a0]+([\d\.]+[A-Z]?)[\s\u2002\u00a0\ufffd]+([A-Za-z].*)", re.DOTALL),
-        # "Section: 1:1 Heading" or "Section: 1-A:1 Heading" (NH style)
-        re.compile(r"Section:\s+([\d\-a-zA-Z:]+)\s+(.*)", re.DOTALL),
-        # Section 1-1-1. or Sec. 1-1-1.
-        re.compile(r"Sec(?:tion)?\.?\s*([\d\-\.a-zA-Z:]+)\s*[.\-–—:\s]+(.*)", re.DOTALL),
-        # KRS style ".1-101 Short title" (dot-prefixed)
-        re.compile(r"\.([\d]+-[\d]+[a-zA-Z]?)\s+(.*)", re.DOTALL),
-        # Numbered like "1-101." or "12.01." at start of line
-        re.compile(r"^([\d]+[\-\.]\d[\d\-\.a-zA-Z]*)\s*[.\-–—:\s]+(.*)", re.DOTALL),
-        # ORS style "001.010" or "1.010"
-        re.compile(r"^(\d{1,3}\.\d{3,}[a-zA-Z]?)\s*[.\s]+(.*)", re.DOTALL),
-        # Art./Article prefix
-        re.compile(r"Art(?:icle)?\.?\s*([\d\-\.a-zA-Z]+)\s*[.\-–—:\s]+(.*)", re.DOTALL),
-    ]
-
-    for elem in soup.find_all(["p", "div", "li", "span", "td", "h2", "h3", "h4", "h5", "dt", "dd", "b", "strong", "a"]):
-        text = elem.get_text(strip=True)
+    for elem, text in index.find_all(tags):
         if not text or len(text) < 5:
             continue
 
-        for pattern in _SECTION_PATTERNS:
-            match = pattern.match(text)
-            if match:
-                num = clean_section_number(match.group(1))
-                if not num or num in seen:
-                    break
-                # Skip if the "number" is too long (probably not a section)
-                if len(num) > 30:
-                    break
-                seen.add(num)
+        match = matcher.match(text)
+        if match:
+            if profile is not None:
+                profile.record(match.pattern, elem.name)
+            num = clean_section_number(match.number)
+            if not num or num in seen:
+                continue
+            # Skip if the "number" is too long (probably not a section)
+            if len(num) > 30:
+                continue
+            seen.add(num)
+
+            rest = match.rest
+            lines = rest.split("\n", 1)
+            heading = lines[0].strip()[:300]
+            body = lines[1].strip() if len(lines) > 1 else ""
 
-                rest = match.group(2)
-                lines = rest.split("\n", 1)
-                heading = lines[0].strip()[:300]
-                body = lines[1].strip() if len(lines) > 1 else ""
+            if len(heading) > 150 and "." in heading:
+                dot = heading.find(".", 30)
+                if dot > 0:
+                    body = heading[dot+1:].strip() + ("\n" + body if body else "")
+                    heading = heading[:dot]
+
+            sections.append(Section(
+                id=f"section-{_slugify(num)}",
+                number=num,
+                heading=heading,
+                text=clean_text(body or rest),
+            ))
 
-                if len(heading) > 150 and "." in heading:
-                    dot = heading.find(".", 30)
-                    if dot > 0:
-                        body = heading[dot+1:].strip() + ("\n" + body if body else "")
-                        heading = heading[:dot]
+    # Strategy 2: If no sections found, look for headings with section-like text
+    if not sections and headings:
+        for heading_tag, htext in index.find_all(_HEADING_TAGS):
+            match = matcher.match(htext)
+            if match:
+                num = clean_section_number(match.number)
+                if not num or num in seen or len(num) > 30:
+                    continue
+                seen.add(num)
+                heading = match.rest.strip()[:300]
+
+                # Collect body text from siblings
+                body_parts = []
+                sib = heading_tag.find_next_sibling()
+                while sib and sib.name not in _HEADING_TAGS:
+                    t = index.text(sib)
+                    if t:
+                        body_parts.append(t)
+                    sib = sib.find_next_sibling()
+                    if len(body_parts) > 50:
+                        break
 
                 sections.append(Section(
                     id=f"section-{_slugify(num)}",
                     number=num,
                     heading=heading,
-                    text=clean_text(body or rest),
+                    text=clean_text("\n\n".join(body_parts)),
                 ))
-                break
 
-    # Strategy 2: If no sections found, look for headings with section-like text
-    if not sections:
-        for heading_tag in soup.find_all(["h1", "h2", "h3", "h4", "h5"]):
-            htext = heading_tag.get_text(strip=True)
-            for pattern in _SECTION_PATTERNS:
-                match = pattern.match(htext)
-                if match:
-                    num = clean_section_number(match.group(1))
-                    if not num or num in seen or len(num) > 30:
-                        break
-                    seen.add(num)
-                    heading = match.group(2).strip()[:300]
-
-                    # Collect body text from siblings
-                    body_parts = []
-                    sib = heading_tag.find_next_sibling()
-                    while sib and sib.name not in ("h1", "h2", "h3", "h4", "h5"):
-                        t = sib.get_text(strip=True)
-                        if t:
-                            body_parts.append(t)
-                        sib = sib.find_next_sibling()
-                        if len(body_parts) > 50:
-                            break
+    return sections
 
-                    sections.append(Section(
-                        id=f"section-{_slugify(num)}",
-                        number=num,
-                        heading=heading,
-                        text=clean_text("\n\n".join(body_parts)),
-                    ))
-                    break
 
-    return sections
+def _chapter_pages(directory: Path) -> list[Path]:
+    """HTML pages directly in ``directory`` other than its index, sorted."""
+    return [f for f in sorted(directory.glob("*.html")) if f.name != "index.html"]
 
 
 def _slugify(text: str) -> str:
@@ -14,8 +14,9 @@ from bs4 import BeautifulSoup
 
 from .base import BaseIngestor, Chapter, Section, StateCode, StructureLevel, Title
 from ..normalization.text_cleaner import clean_text, clean_section_number
-from ..utils.cache import HttpCache
+from ..utils.links import extract_links
 from ..utils.rate_limiter import RateLimiter
+from ..utils.section_numbers import SectionNumberMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -29,8 +30,7 @@ class StateProvidedIngestor(BaseIngestor):
     def __init__(self, state: str, config: dict, cache_dir: Path | None = None):
         super().__init__(state, config, cache_dir)
         verify_ssl = config.get("verify_ssl", True)
-        self.http_cache = HttpCache(
-            cache_dir=(cache_dir or Path("cache")) / "http",
+        self.http_cache = self._make_http_cache(
             rate_limiter=RateLimiter(requests_per_second=1.5),
             verify_ssl=verify_ssl,
         )
@@ -96,9 +96,7 @@ class StateProvidedIngestor(BaseIngestor):
         (out_dir / "titles.htm").write_text(index_html, encoding="utf-8")
 
         # Parse title links
-        soup = BeautifulSoup(index_html, "html.parser")
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
+        for href, _ in extract_links(index_html):
             if href.startswith("title") and href.endswith(".htm"):
                 try:
                     title_html = self.http_cache.fetch(f"{base_url}/{href}")
@@ -123,7 +121,7 @@ class StateProvidedIngestor(BaseIngestor):
 
     def _parse_ct_title(self, html: str, filename: str) -> Title | None:
         """Parse a single CT title HTML page."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, self.parser)
 
         title_heading = ""
         h1 = soup.find("h1") or soup.find("h2")
@@ -164,9 +162,7 @@ class StateProvidedIngestor(BaseIngestor):
         (out_dir / "index.html").write_text(index_html, encoding="utf-8")
 
         # Parse title links
-        soup = BeautifulSoup(index_html, "html.parser")
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
+        for href, _ in extract_links(index_html):
             if "Title_Request" in href or "StatutesBrowser" in href:
                 url = href if href.startswith("http") else f"{base_url}/{href}"
                 try:
@@ -184,7 +180,7 @@ class StateProvidedIngestor(BaseIngestor):
         for html_file in sorted(raw_path.glob("*.html")):
             try:
                 content = html_file.read_text(encoding="utf-8", errors="replace")
-                soup = BeautifulSoup(content, "html.parser")
+                soup = BeautifulSoup(content, self.parser)
                 sections = _extract_sections_from_html(soup)
                 if sections:
                     title_num = html_file.stem[:20]
@@ -238,7 +234,7 @@ class StateProvidedIngestor(BaseIngestor):
         for html_file in sorted(raw_path.glob("*.html")):
             try:
                 content = html_file.read_text(encoding="utf-8", errors="replace")
-                soup = BeautifulSoup(content, "html.parser")
+                soup = BeautifulSoup(content, self.parser)
                 sections = _extract_sections_from_html(soup)
                 if sections:
                     article = html_file.stem
@@ -272,9 +268,7 @@ class StateProvidedIngestor(BaseIngestor):
         (out_dir / "index.html").write_text(index_html, encoding="utf-8")
 
         # Parse chapter links
-        soup = BeautifulSoup(index_html, "html.parser")
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
+        for href, _ in extract_links(index_html):
             if "chapter" in href.lower() or "statutes.php" in href.lower():
                 url = href if href.startswith("http") else f"https://nebraskalegislature.gov{href}"
                 try:
@@ -294,7 +288,7 @@ class StateProvidedIngestor(BaseIngestor):
                 continue
             try:
                 content = html_file.read_text(encoding="utf-8", errors="replace")
-                soup = BeautifulSoup(content, "html.parser")
+                soup = BeautifulSoup(content, self.parser)
                 sections = _extract_sections_from_html(soup)
                 if sections:
                     chapter = html_file.stem
@@ -317,49 +311,44 @@ class StateProvidedIngestor(BaseIngestor):
         return titles
 
 
+# The generic extractor's patterns: a subset of SECTION_NUMBER's, same order
+_SECTION_NUMBER = SectionNumberMatcher.named("section_sign", "section_caps", "sec", "numbered")
+
+
 def _extract_sections_from_html(soup: BeautifulSoup) -> list[Section]:
     """Generic HTML section extractor - looks for common patterns."""
     sections = []
     seen_numbers = set()
 
-    _PATTERNS = [
-        re.compile(r"(?:§+\s*)([\d\-\.a-zA-Z:]+)\s*[.\-–—:\s]+(.*)", re.DOTALL),
-        re.compile(r"SECTION\s+([\d\-\.a-zA-Z:]+)\s*[.\-–—:\s]+(.*)", re.DOTALL),
-        re.compile(r"Sec(?:tion)?\.?\s*([\d\-\.a-zA-Z:]+)\s*[.\-–—:\s]+(.*)", re.DOTALL),
-        re.compile(r"^([\d]+[\-\.]\d[\d\-\.a-zA-Z]*)\s*[.\-–—:\s]+(.*)", re.DOTALL),
-    ]
-
     for elem in soup.find_all(["p", "div", "li", "span", "td", "h2", "h3", "h4", "h5", "dt", "b", "strong"]):
         text = elem.get_text(strip=True)
         if not text or len(text) < 5:
             continue
 
-        for pattern in _PATTERNS:
-            match = pattern.match(text)
-            if match:
-                num = clean_section_number(match.group(1))
-                if not num or num in seen_numbers or len(num) > 30:
-                    break
-                seen_numbers.add(num)
-
-                rest = match.group(2)
-                lines = rest.split("\n", 1)
-                heading = lines[0].strip()[:300]
-                body = lines[1].strip() if len(lines) > 1 else ""
-
-                if len(heading) > 150 and "." in heading:
-                    dot = heading.find(".", 30)
-                    if dot > 0:
-                        body = heading[dot+1:].strip() + ("\n" + body if body else "")
-                        heading = heading[:dot]
-
-                sections.append(Section(
-                    id=f"section-{_slugify(num)}",
-                    number=num,
-                    heading=heading,
-                    text=clean_text(body or rest),
-                ))
-                break
+        match = _SECTION_NUMBER.match(text)
+        if match:
+            num = clean_section_number(match.number)
+            if not num or num in seen_numbers or len(num) > 30:
+                continue
+            seen_numbers.add(num)
+
+            rest = match.rest
+            lines = rest.split("\n", 1)
+            heading = lines[0].strip()[:300]
+            body = lines[1].strip() if len(lines) > 1 else ""
+
+            if len(heading) > 150 and "." in heading:
+                dot = heading.find(".", 30)
+                if dot > 0:
+                    body = heading[dot+1:].strip() + ("\n" + body if body else "")
+                    heading = heading[:dot]
+
+            sections.append(Section(
+                id=f"section-{_slugify(num)}",
+                number=num,
+                heading=heading,
+                text=clean_text(body or rest),
+            ))
 
     return sections
 
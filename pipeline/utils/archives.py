@@ -0,0 +1,127 @@
+"""Selective, incremental extraction of downloaded zip archives.
+
+Bulk sources ship zips holding files the ingestors never read (PDFs,
+images, indexes), and ``extractall`` unpacked all of it on every fetch.
+``extract_members`` unpacks only the members with the suffixes an
+ingestor parses, spread over a few threads (inflating and writing both
+release the GIL), and records each extracted member's CRC-32 and size in
+a manifest beside the destination directory. A member whose CRC and size
+match the manifest and whose file is still on disk is left alone, so
+extracting an unchanged archive again writes nothing.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import zipfile
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from .parse_pool import default_workers
+
+logger = logging.getLogger(__name__)
+
+# Threads extracting one archive; each opens the zip itself
+MAX_EXTRACT_WORKERS = 8
+
+
+def manifest_path(dest: Path) -> Path:
+    """The manifest recording what was extracted into ``dest``."""
+    return dest.with_name(dest.name + ".manifest.json")
+
+
+def _read_manifest(path: Path) -> dict[str, dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable extraction manifest %s: %s", path, e)
+        return {}
+
+
+def _write_manifest(path: Path, manifest: dict[str, dict]) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
+def _is_current(entry: dict | None, info: zipfile.ZipInfo, dest: Path) -> bool:
+    if entry is None or entry.get("crc") != info.CRC or entry.get("size") != info.file_size:
+        return False
+    try:
+        return (dest / info.filename).stat().st_size == info.file_size
+    except OSError:
+        return False
+
+
+def _extract(archive: Path, dest: Path, members: list[zipfile.ZipInfo]) -> None:
+    # One ZipFile serialises reads through its single file handle, so each thread opens its own
+    with zipfile.ZipFile(archive) as zf:
+        for info in members:
+            zf.extract(info, dest)
+
+
+def extract_members(
+    archive: Path,
+    dest: Path,
+    suffixes: Iterable[str],
+    source: str | None = None,
+    workers: int | None = None,
+) -> list[str]:
+    """Extract the members of ``archive`` ending in one of ``suffixes`` into ``dest``.
+
+    Args:
+        archive: The zip file.
+        dest: Directory to extract into.
+        suffixes: File name endings to extract (case-insensitive), e.g. ``(".xml",)``.
+        source: Name the archive's entries are recorded under (default: its
+            file name). Files this source extracted before that its current
+            version no longer has are deleted.
+        workers: Extraction threads (default: one per CPU, at most
+            ``MAX_EXTRACT_WORKERS``).
+
+    Returns:
+        Names of the selected members, whether extracted now or already up to date.
+    """
+    source = source or archive.name
+    suffixes = tuple(suffix.lower() for suffix in suffixes)
+    with zipfile.ZipFile(archive) as zf:
+        selected = [
+            info for info in zf.infolist()
+            if not info.is_dir() and info.filename.lower().endswith(suffixes)
+        ]
+
+    manifest_file = manifest_path(dest)
+    manifest = _read_manifest(manifest_file)
+    changed = [info for info in selected if not _is_current(manifest.get(info.filename), info, dest)]
+    if changed:
+        workers = max(1, min(workers or min(MAX_EXTRACT_WORKERS, default_workers()), len(changed)))
+        dest.mkdir(parents=True, exist_ok=True)
+        # Strided so large and small members spread evenly over the threads
+        chunks = [changed[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(partial(_extract, archive, dest), chunks))
+
+    names = {info.filename for info in selected}
+    removed = [
+        name for name, entry in manifest.items()
+        if entry.get("source") == source and name not in names
+    ]
+    for name in removed:
+        (dest / name).unlink(missing_ok=True)
+        del manifest[name]
+    for info in changed:
+        manifest[info.filename] = {"crc": info.CRC, "size": info.file_size, "source": source}
+    if changed or removed:
+        _write_manifest(manifest_file, manifest)
+
+    logger.info(
+        "%s: extracted %d of %d %s members (%d unchanged, %d removed)",
+        source, len(changed), len(selected), "/".join(suffixes),
+        len(selected) - len(changed), len(removed),
+    )
+    return [info.filename for info in selected]
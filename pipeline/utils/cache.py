@@ -2,29 +2,86 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import json
 import logging
-import subprocess
+import threading
 import time
+from collections import Counter
 from pathlib import Path
+from urllib.parse import urlsplit
 
 import httpx
 
-from .rate_limiter import RateLimiter
+from .cache_store import open_store
+from .compression import compress, decompress, resolve_codec
+from .curl import USER_AGENT, shared_transport
+from .negative_cache import NegativeCache, failure_class
+from .checksum import file_hash
+from .rate_limiter import RateLimiter, host_limiter
+from .retry import RetryPolicy
+from .urls import canonicalize_url
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_TTL = 7 * 24 * 3600  # 7 days
 
+HTML_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+
+BINARY_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "*/*",
+}
+
+# Bytes read from the network per write when streaming a download to disk
+DOWNLOAD_CHUNK = 1 << 20
+
+
+def _http2_available() -> bool:
+    """Return True if the optional h2 package needed for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
 
 class HttpCache:
     """Disk-backed HTTP response cache with rate limiting.
 
+    Requests go through a single long-lived ``httpx.Client`` so connections
+    (and TLS sessions) are kept alive and pooled per host across fetches.
+    The client is created lazily and released by ``close()``; the cache can
+    also be used as a context manager.
+
+    Requests are paced by process-wide per-host limiters (see
+    ``rate_limiter.host_limiter``), so caches in parallel ingestors share
+    each host's budget and all back off together when it answers 429/503.
+
+    Entries are keyed by canonical URL (see ``urls.canonicalize_url``), so
+    a page linked in several spellings is fetched and stored once.
+
     Args:
         cache_dir: Directory for cached responses.
         ttl: Time-to-live in seconds for cached responses.
-        rate_limiter: Optional rate limiter for requests.
+        rate_limiter: Rate and burst to use for each host's shared limiter.
+        verify_ssl: Whether to verify TLS certificates.
+        http2: Negotiate HTTP/2 when the optional ``h2`` package is installed.
+        max_connections: Maximum number of open connections across all hosts.
+        max_keepalive_connections: Maximum number of idle connections kept alive.
+        keepalive_expiry: Seconds an idle connection is kept before closing.
+        backend: Storage layout, ``"files"`` or ``"sqlite"`` (see cache_store).
+            Defaults to sqlite when the directory already has a SQLite index.
+        compression: Compress new bodies with ``"zlib"`` or ``"zstd"``
+            (see compression). Existing entries are readable either way.
+        retry_policy: Retry/circuit-breaker policy used by ``fetch_with_retry``.
+        negative_ttls: Per-failure-class TTL overrides for remembered 404/410/403
+            responses (see negative_cache).
+        ignore_negative_cache: Request URLs even if they are remembered as failed.
     """
 
     def __init__(
@@ -33,59 +90,257 @@ class HttpCache:
         ttl: int = DEFAULT_TTL,
         rate_limiter: RateLimiter | None = None,
         verify_ssl: bool = True,
+        http2: bool = False,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        backend: str | None = None,
+        compression: str | None = None,
+        retry_policy: RetryPolicy | None = None,
+        negative_ttls: dict[str, float] | None = None,
+        ignore_negative_cache: bool = False,
     ):
         self.cache_dir = cache_dir
         self.ttl = ttl
         self.rate_limiter = rate_limiter or RateLimiter()
         self.verify_ssl = verify_ssl
+        self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+        self.stats: Counter[str] = Counter()
+        self._stats_lock = threading.Lock()
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.store = open_store(cache_dir, backend)
+        self.backend = self.store.name
+        self.compression = resolve_codec(compression)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.negative = NegativeCache(self.store, negative_ttls, ignore=ignore_negative_cache)
+
+    @property
+    def client(self) -> httpx.Client:
+        """The pooled HTTP client, created on first use."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(**self._client_options())
+        return self._client
+
+    def _client_options(self) -> dict:
+        """Keyword arguments shared by the sync and async client constructors."""
+        http2 = self.http2
+        if http2 and not _http2_available():
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+            http2 = False
+        return {
+            "verify": self.verify_ssl,
+            "http2": http2,
+            "limits": self.limits,
+            "follow_redirects": True,
+        }
+
+    def close(self) -> None:
+        """Close the pooled HTTP client and release its connections."""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+        self.store.close()
+
+    def __enter__(self) -> HttpCache:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _cache_key(self, url: str) -> str:
+        return hashlib.sha256(canonicalize_url(url).encode()).hexdigest()
+
+    def _legacy_key(self, url: str) -> str:
+        # Entries written before keys were canonicalized
         return hashlib.sha256(url.encode()).hexdigest()
 
-    def _cache_path(self, url: str) -> Path:
-        key = self._cache_key(url)
-        return self.cache_dir / f"{key}.json"
-
-    def _meta_path(self, url: str) -> Path:
-        key = self._cache_key(url)
-        return self.cache_dir / f"{key}.meta.json"
+    def _is_fresh(self, meta: dict) -> bool:
+        return time.time() - meta.get("timestamp", 0) <= self.ttl
+
+    def _count(self, event: str, amount: float = 1) -> None:
+        with self._stats_lock:
+            self.stats[event] += amount
+
+    def stats_summary(self) -> str:
+        """One-line summary of cache outcomes since the cache was created."""
+        summary = (
+            f"{self.stats['hits']} hits, {self.stats['revalidated']} revalidated, "
+            f"{self.stats['refetched']} refetched, {self.stats['fetched']} new"
+        )
+        if self.stats["negative_hits"]:
+            summary += f", {self.stats['negative_hits']} known failures skipped"
+        if self.stats["retries"] or self.stats["permanent_failures"] or self.stats["short_circuited"]:
+            summary += (
+                f"; {self.stats['retries']} retries ({self.stats['retry_sleep']:.0f}s backoff, "
+                f"{self.stats['wasted_sleep']:.0f}s wasted on pages that still failed), "
+                f"{self.stats['permanent_failures']} not retried, "
+                f"{self.stats['short_circuited']} skipped by open circuits"
+            )
+        return summary
 
     def get_cached(self, url: str) -> str | None:
         """Return cached response body if valid, else None."""
-        meta_path = self._meta_path(url)
-        cache_path = self._cache_path(url)
-
-        if not meta_path.exists() or not cache_path.exists():
+        key, meta, fresh = self._lookup(url, "text")
+        if meta is None:
             return None
-
-        meta = json.loads(meta_path.read_text(encoding="utf-8"))
-        if time.time() - meta.get("timestamp", 0) > self.ttl:
+        if not fresh:
             logger.debug("Cache expired for %s", url)
             return None
 
         logger.debug("Cache hit for %s", url)
-        return cache_path.read_text(encoding="utf-8")
+        return self._read_text(key, meta)
 
-    def put(self, url: str, body: str, status_code: int = 200) -> None:
-        """Store a response in the cache."""
-        cache_path = self._cache_path(url)
-        meta_path = self._meta_path(url)
+    def put(
+        self,
+        url: str,
+        body: str,
+        status_code: int = 200,
+        headers: httpx.Headers | None = None,
+    ) -> None:
+        """Store a response in the cache.
+
+        ETag and Last-Modified response headers, when given, are kept in the
+        entry's metadata so it can be revalidated after it expires.
+        """
+        self._store(url, "text", body.encode("utf-8"), status_code, headers)
 
-        cache_path.write_text(body, encoding="utf-8")
+    @staticmethod
+    def _entry_meta(url: str, status_code: int, headers: httpx.Headers | None) -> dict:
         meta = {
             "url": url,
             "timestamp": time.time(),
             "status_code": status_code,
         }
-        meta_path.write_text(json.dumps(meta), encoding="utf-8")
+        if headers is not None:
+            if headers.get("etag"):
+                meta["etag"] = headers["etag"]
+            if headers.get("last-modified"):
+                meta["last_modified"] = headers["last-modified"]
+        return meta
+
+    def _store(
+        self,
+        url: str,
+        kind: str,
+        data: bytes,
+        status_code: int,
+        headers: httpx.Headers | None,
+    ) -> None:
+        key = self._cache_key(url)
+        meta = self._entry_meta(url, status_code, headers)
+        if self.compression is not None:
+            packed = compress(data, self.compression)
+            # Already-compressed downloads (zip archives) are kept as-is
+            if len(packed) < len(data):
+                data = packed
+                meta["encoding"] = self.compression
+        self.store.write_body(key, kind, data)
+        self.store.put_meta(key, kind, meta)
+
+    def _read_body(self, key: str, kind: str, meta: dict) -> bytes | None:
+        """Read a stored body, decompressing it according to its metadata."""
+        data = self.store.read_body(key, kind)
+        if data is None:
+            return None
+        return decompress(data, meta.get("encoding"))
+
+    def _read_text(self, key: str, meta: dict) -> str | None:
+        data = self._read_body(key, "text", meta)
+        return data.decode("utf-8") if data is not None else None
 
-    def fetch(self, url: str, **kwargs) -> str:
+    def _lookup(self, url: str, kind: str) -> tuple[str, dict | None, bool]:
+        """Return ``(key, meta, fresh)`` for a stored entry; ``meta`` is None if absent.
+
+        Entries are found under the canonical URL, falling back to the exact
+        URL for entries cached before keys were canonicalized.
+        """
+        key = self._cache_key(url)
+        meta = self.store.get_meta(key, kind)
+        if meta is None:
+            legacy = self._legacy_key(url)
+            if legacy != key:
+                legacy_meta = self.store.get_meta(legacy, kind)
+                if legacy_meta is not None:
+                    key, meta = legacy, legacy_meta
+        if meta is None:
+            return key, None, False
+        return key, meta, self._is_fresh(meta)
+
+    def _request_kwargs(self, kwargs: dict, headers: dict, timeout: int, meta: dict | None) -> dict:
+        """Fill in request defaults, adding conditional headers for a stale entry."""
+        kwargs.setdefault("timeout", timeout)
+        request_headers = dict(kwargs.get("headers") or headers)
+        if meta is not None:
+            if meta.get("etag"):
+                request_headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                request_headers["If-Modified-Since"] = meta["last_modified"]
+        kwargs["headers"] = request_headers
+        return kwargs
+
+    def _limiter(self, url: str) -> RateLimiter:
+        """The shared limiter for ``url``'s host."""
+        return host_limiter(urlsplit(url).netloc, self.rate_limiter.max_rate, self.rate_limiter.burst)
+
+    @staticmethod
+    def _observe(limiter: RateLimiter, response: httpx.Response) -> None:
+        """Feed a response's status (and Retry-After) back into the host's limiter."""
+        limiter.observe(response.status_code, response.headers.get("retry-after"))
+
+    def _check_negative(self, url: str) -> dict | None:
+        """Raise the remembered HTTP error if ``url`` recently failed permanently.
+
+        Returns the (stale) negative entry, if any, so a later success can clear it.
+        """
+        entry = self.negative.lookup(url)
+        if entry is None:
+            return None
+        if self.negative.ignore or not self.negative.is_fresh(entry):
+            return entry
+        self._count("negative_hits")
+        logger.debug("Known failure (%s) for %s", entry["failure"], url)
+        request = httpx.Request("GET", url)
+        response = httpx.Response(entry["status_code"], request=request)
+        raise httpx.HTTPStatusError(
+            f"Cached {entry['failure']} ({entry['status_code']}) for {url}",
+            request=request,
+            response=response,
+        )
+
+    def _record_failure(self, url: str, status_code: int) -> None:
+        """Remember a 404/410/403 so later runs skip the URL."""
+        failure = failure_class(status_code)
+        if failure is not None:
+            self.negative.record(url, failure)
+
+    def _mark_revalidated(self, key: str, kind: str, meta: dict) -> None:
+        """Refresh a stale entry's timestamp after a 304 Not Modified."""
+        logger.debug("Not modified: %s", meta.get("url"))
+        meta["timestamp"] = time.time()
+        self.store.put_meta(key, kind, meta)
+        self._count("revalidated")
+
+    def fetch(self, url: str, max_age: float | None = None, **kwargs) -> str:
         """Fetch URL with caching and rate limiting.
 
+        Expired entries that carry an ETag or Last-Modified value are
+        revalidated with a conditional request; a 304 keeps the stored body.
+
         Args:
             url: URL to fetch.
-            **kwargs: Additional arguments passed to httpx.get().
+            max_age: Treat entries older than this many seconds as expired,
+                whatever the cache's TTL (0: always ask the server).
+            **kwargs: Additional arguments passed to httpx.Client.get().
 
         Returns:
             Response body as string.
@@ -93,102 +348,376 @@ class HttpCache:
         Raises:
             httpx.HTTPStatusError: On non-2xx response.
         """
-        cached = self.get_cached(url)
-        if cached is not None:
-            return cached
-
-        self.rate_limiter.wait()
+        key, meta, fresh = self._lookup(url, "text")
+        if fresh and max_age is not None:
+            fresh = time.time() - meta.get("timestamp", 0) <= max_age
+        if fresh:
+            cached = self._read_text(key, meta)
+            if cached is not None:
+                logger.debug("Cache hit for %s", url)
+                self._count("hits")
+                return cached
+            meta = None
+        negative = self._check_negative(url)
+
+        limiter = self._limiter(url)
+        limiter.wait()
         logger.info("Fetching %s", url)
 
-        kwargs.setdefault("timeout", 60)
-        kwargs.setdefault("follow_redirects", True)
-        kwargs.setdefault("verify", self.verify_ssl)
-        kwargs.setdefault("headers", {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-        })
+        kwargs = self._request_kwargs(kwargs, HTML_HEADERS, 60, meta)
 
+        headers = None
         try:
-            response = httpx.get(url, **kwargs)
+            response = self.client.get(url, **kwargs)
+            self._observe(limiter, response)
+            if response.status_code == 304 and meta is not None:
+                cached = self._read_text(key, meta)
+                if cached is not None:
+                    self._mark_revalidated(key, "text", meta)
+                    return cached
+                response = self.client.get(url, **self._request_kwargs({}, HTML_HEADERS, 60, None))
+                self._observe(limiter, response)
             response.raise_for_status()
             body = response.text
+            headers = response.headers
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 403:
                 # Cloudflare block - try curl as fallback
                 body = self._fetch_with_curl(url)
                 if body is None:
+                    self._record_failure(url, 403)
                     raise
             else:
+                self._record_failure(url, e.response.status_code)
                 raise
 
-        self.put(url, body, 200)
+        self.put(url, body, 200, headers)
+        if negative is not None:
+            self.negative.clear(url)
+        self._count("refetched" if meta is not None else "fetched")
         return body
 
-    def _fetch_with_curl(self, url: str, retries: int = 2) -> str | None:
-        """Fallback: fetch with curl to bypass Cloudflare TLS fingerprinting."""
-        cloudflare_markers = ["Just a moment", "Checking your browser", "cf-browser-verification"]
-        for attempt in range(retries + 1):
-            try:
-                if attempt > 0:
-                    time.sleep(3 * attempt)
-                result = subprocess.run(
-                    [
-                        "curl", "-sL", "--max-time", "60",
-                        "-H", "User-Agent: Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-                        "-H", "Accept: text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                        "-H", "Accept-Language: en-US,en;q=0.5",
-                        "-H", "Accept-Encoding: identity",
-                        url,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    encoding="utf-8",
-                    errors="replace",
-                    timeout=90,
-                )
-                if result.returncode == 0 and len(result.stdout) > 100:
-                    # Reject Cloudflare challenge pages
-                    if any(marker in result.stdout[:2000] for marker in cloudflare_markers):
-                        logger.debug("curl got Cloudflare challenge for %s (attempt %d)", url, attempt + 1)
-                        continue
-                    logger.info("curl fallback succeeded for %s (%d bytes)", url, len(result.stdout))
-                    return result.stdout
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
-        return None
+    def fetch_with_retry(self, url: str, **kwargs) -> str:
+        """``fetch`` under the cache's retry policy and the host's circuit breaker.
+
+        Raises:
+            httpx.HTTPStatusError: On a permanent error, or once retries run out.
+            CircuitOpenError: If the host's circuit breaker is open.
+        """
+        return self.retry_policy.call(lambda: self.fetch(url, **kwargs), url, self._count)
+
+    def _fetch_with_curl(self, url: str) -> str | None:
+        """Fallback: fetch with curl to bypass Cloudflare TLS fingerprinting.
+
+        Goes through the shared batching curl transport, so concurrent
+        fallbacks are fetched in one curl invocation over reused connections.
+        """
+        body = shared_transport().fetch(url)
+        if body is not None:
+            logger.info("curl fallback succeeded for %s (%d bytes)", url, len(body))
+        return body
 
     def fetch_bytes(self, url: str, **kwargs) -> bytes:
         """Fetch URL and return raw bytes (for binary downloads).
 
-        Results are cached as files with .bin extension.
+        Results are cached as files with .bin extension and revalidated
+        like text responses once they expire.
         """
-        key = self._cache_key(url)
-        bin_path = self.cache_dir / f"{key}.bin"
-        meta_path = self._meta_path(url)
-
-        if meta_path.exists() and bin_path.exists():
-            meta = json.loads(meta_path.read_text(encoding="utf-8"))
-            if time.time() - meta.get("timestamp", 0) <= self.ttl:
+        key, meta, fresh = self._lookup(url, "binary")
+        if fresh:
+            cached = self._read_body(key, "binary", meta)
+            if cached is not None:
                 logger.debug("Cache hit (binary) for %s", url)
-                return bin_path.read_bytes()
+                self._count("hits")
+                return cached
+            meta = None
+        negative = self._check_negative(url)
 
-        self.rate_limiter.wait()
+        limiter = self._limiter(url)
+        limiter.wait()
         logger.info("Fetching (binary) %s", url)
 
-        kwargs.setdefault("timeout", 120)
-        kwargs.setdefault("follow_redirects", True)
-        kwargs.setdefault("verify", self.verify_ssl)
-        kwargs.setdefault("headers", {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-            "Accept": "*/*",
-        })
-
-        response = httpx.get(url, **kwargs)
+        kwargs = self._request_kwargs(kwargs, BINARY_HEADERS, 120, meta)
+
+        response = self.client.get(url, **kwargs)
+        self._observe(limiter, response)
+        if response.status_code == 304 and meta is not None:
+            cached = self._read_body(key, "binary", meta)
+            if cached is not None:
+                self._mark_revalidated(key, "binary", meta)
+                return cached
+            response = self.client.get(url, **self._request_kwargs({}, BINARY_HEADERS, 120, None))
+            self._observe(limiter, response)
+        if response.is_error:
+            self._record_failure(url, response.status_code)
         response.raise_for_status()
 
-        bin_path.write_bytes(response.content)
-        meta = {"url": url, "timestamp": time.time(), "status_code": response.status_code}
-        meta_path.write_text(json.dumps(meta), encoding="utf-8")
+        self._store(url, "binary", response.content, response.status_code, response.headers)
+        if negative is not None:
+            self.negative.clear(url)
+        self._count("refetched" if meta is not None else "fetched")
 
         return response.content
+
+    def _stream_to(self, url: str, part: Path, limiter: RateLimiter, kwargs: dict) -> httpx.Response:
+        """Stream a GET of ``url`` into the file ``part``; returns the (closed) response.
+
+        A ``part`` file left by an interrupted download is resumed with a
+        Range request. If-Range carries the validator (ETag or Last-Modified)
+        of the response that started it, so a body that changed in between
+        comes back whole rather than being spliced onto the old bytes; with
+        no validator to send the download starts over. 304 and 416 (the part
+        is already complete) write nothing.
+
+        Raises:
+            httpx.HTTPStatusError: On an error response.
+        """
+        validator_path = part.with_name(part.name + ".validator")
+        offset = 0
+        if part.exists() and validator_path.exists():
+            offset = part.stat().st_size
+            kwargs["headers"]["Range"] = f"bytes={offset}-"
+            kwargs["headers"]["If-Range"] = validator_path.read_text(encoding="utf-8")
+            logger.info("Resuming download of %s at byte %d", url, offset)
+        else:
+            logger.info("Downloading %s", url)
+
+        with self.client.stream("GET", url, **kwargs) as response:
+            self._observe(limiter, response)
+            if response.status_code == 304:
+                return response
+            if offset and response.status_code == 416:
+                validator_path.unlink(missing_ok=True)
+                return response
+            if response.is_error:
+                self._record_failure(url, response.status_code)
+            response.raise_for_status()
+            resumed = offset and response.status_code == 206
+            if not resumed:
+                # Weak ETags cannot be used in If-Range
+                etag = response.headers.get("etag", "")
+                validator = etag if etag and not etag.startswith("W/") else response.headers.get("last-modified")
+                if validator:
+                    validator_path.write_text(validator, encoding="utf-8")
+                else:
+                    validator_path.unlink(missing_ok=True)
+            with part.open("ab" if resumed else "wb") as f:
+                for chunk in response.iter_bytes(DOWNLOAD_CHUNK):
+                    f.write(chunk)
+        validator_path.unlink(missing_ok=True)
+        return response
+
+    def fetch_file(self, url: str, **kwargs) -> Path:
+        """Fetch URL into a file in the cache and return its path (for large downloads).
+
+        The streaming counterpart of ``fetch_bytes``: the body goes to disk
+        in chunks and is never held in memory, an interrupted download is
+        resumed (see ``_stream_to``), and expired entries are revalidated
+        the same way. The file belongs to the cache; read it, don't change it.
+        """
+        key, meta, fresh = self._lookup(url, "binary")
+        if meta is not None and meta.get("encoding"):
+            # Stored compressed by fetch_bytes; fetched again as a plain file
+            meta, fresh = None, False
+        if fresh:
+            path = self.store.body_path(key, "binary")
+            if path.exists():
+                logger.debug("Cache hit (file) for %s", url)
+                self._count("hits")
+                return path
+            meta = None
+        negative = self._check_negative(url)
+
+        limiter = self._limiter(url)
+        limiter.wait()
+        kwargs = self._request_kwargs(kwargs, BINARY_HEADERS, 120, meta)
+        path = self.store.body_path(self._cache_key(url), "binary")
+        part = path.with_name(path.name + ".part")
+        response = self._stream_to(url, part, limiter, kwargs)
+        if response.status_code == 304:
+            cached = self.store.body_path(key, "binary")
+            if cached.exists():
+                # Whatever an interrupted refresh left is of no use now
+                part.unlink(missing_ok=True)
+                part.with_name(part.name + ".validator").unlink(missing_ok=True)
+                self._mark_revalidated(key, "binary", meta)
+                return cached
+            # The body went missing; fetch it again
+            response = self._stream_to(url, part, limiter, self._request_kwargs({}, BINARY_HEADERS, 120, None))
+
+        part.replace(path)
+        headers = response.headers if response.status_code in (200, 206) else None
+        self.store.put_meta(self._cache_key(url), "binary", self._entry_meta(url, 200, headers))
+        if negative is not None:
+            self.negative.clear(url)
+        self._count("refetched" if meta is not None else "fetched")
+        return path
+
+    def download(self, url: str, dest: Path, md5: str | None = None, **kwargs) -> Path:
+        """Stream URL to the file ``dest`` without holding the body in memory.
+
+        The body goes to ``dest`` + ".part" first and is renamed into place
+        when complete; an interrupted download is resumed (see
+        ``_stream_to``). Unlike ``fetch_file`` nothing is kept in the cache:
+        ``dest`` is the copy.
+
+        Args:
+            url: URL to download.
+            dest: File to write.
+            md5: Expected MD5 of the whole file, checked once it is complete.
+            **kwargs: Additional arguments passed to httpx.Client.stream().
+
+        Returns:
+            ``dest``.
+
+        Raises:
+            httpx.HTTPStatusError: On non-2xx response.
+            ValueError: If the file does not match ``md5``; the partial file is removed.
+        """
+        negative = self._check_negative(url)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        part = dest.with_name(dest.name + ".part")
+
+        limiter = self._limiter(url)
+        limiter.wait()
+        self._stream_to(url, part, limiter, self._request_kwargs(kwargs, BINARY_HEADERS, 120, None))
+
+        if md5 is not None:
+            digest = file_hash(part, "md5")
+            if digest != md5.lower():
+                part.unlink()
+                raise ValueError(f"MD5 mismatch for {url}: expected {md5}, got {digest}")
+        part.replace(dest)
+        if negative is not None:
+            self.negative.clear(url)
+        self._count("fetched")
+        return dest
+
+
+class AsyncHttpCache(HttpCache):
+    """Asyncio variant of HttpCache for fetching many pages concurrently.
+
+    Shares the on-disk cache format (and ``get_cached``/``put``) with
+    HttpCache, so pages fetched by either class are hits for the other.
+    In-flight requests are capped per host; pacing uses the same shared
+    per-host limiters as HttpCache.
+
+    Args:
+        max_per_host: Maximum number of concurrent requests to one host.
+        **kwargs: Passed through to HttpCache.
+    """
+
+    def __init__(self, cache_dir: Path, max_per_host: int = 4, **kwargs):
+        super().__init__(cache_dir, **kwargs)
+        self.max_per_host = max_per_host
+        self._aclient: httpx.AsyncClient | None = None
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    @classmethod
+    def from_cache(cls, cache: HttpCache, max_per_host: int = 4) -> AsyncHttpCache:
+        """Build an async cache with the same directory and settings as ``cache``.
+
+        Hit/revalidation counters are shared, so they show up in ``cache.stats``.
+        """
+        acache = cls(
+            cache.cache_dir,
+            max_per_host=max_per_host,
+            ttl=cache.ttl,
+            rate_limiter=cache.rate_limiter,
+            verify_ssl=cache.verify_ssl,
+            http2=cache.http2,
+            max_connections=cache.limits.max_connections,
+            max_keepalive_connections=cache.limits.max_keepalive_connections,
+            keepalive_expiry=cache.limits.keepalive_expiry,
+            backend=cache.backend,
+            compression=cache.compression,
+            retry_policy=cache.retry_policy,
+            negative_ttls=cache.negative.ttls,
+            ignore_negative_cache=cache.negative.ignore,
+        )
+        acache.stats = cache.stats
+        acache._stats_lock = cache._stats_lock
+        return acache
+
+    @property
+    def aclient(self) -> httpx.AsyncClient:
+        """The pooled async HTTP client, created on first use."""
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(**self._client_options())
+        return self._aclient
+
+    async def aclose(self) -> None:
+        """Close the async client (and the sync client, if one was opened)."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+        self.close()
+
+    async def __aenter__(self) -> AsyncHttpCache:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        return self._host_semaphores[host]
+
+    async def afetch(self, url: str, **kwargs) -> str:
+        """Async counterpart of ``fetch`` with per-host concurrency limits.
+
+        Raises:
+            httpx.HTTPStatusError: On non-2xx response.
+        """
+        key, meta, fresh = self._lookup(url, "text")
+        if fresh:
+            cached = self._read_text(key, meta)
+            if cached is not None:
+                self._count("hits")
+                return cached
+            meta = None
+        negative = self._check_negative(url)
+
+        host = urlsplit(url).netloc
+        limiter = self._limiter(url)
+        async with self._host_semaphore(host):
+            await limiter.async_wait()
+            logger.info("Fetching %s", url)
+
+            kwargs = self._request_kwargs(kwargs, HTML_HEADERS, 60, meta)
+
+            headers = None
+            try:
+                response = await self.aclient.get(url, **kwargs)
+                self._observe(limiter, response)
+                if response.status_code == 304 and meta is not None:
+                    cached = self._read_text(key, meta)
+                    if cached is not None:
+                        self._mark_revalidated(key, "text", meta)
+                        return cached
+                    response = await self.aclient.get(url, **self._request_kwargs({}, HTML_HEADERS, 60, None))
+                    self._observe(limiter, response)
+                response.raise_for_status()
+                body = response.text
+                headers = response.headers
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 403:
+                    # Cloudflare block - curl is blocking, keep it off the event loop
+                    body = await asyncio.to_thread(self._fetch_with_curl, url)
+                    if body is None:
+                        self._record_failure(url, 403)
+                        raise
+                else:
+                    self._record_failure(url, e.response.status_code)
+                    raise
+
+        self.put(url, body, 200, headers)
+        if negative is not None:
+            self.negative.clear(url)
+        self._count("refetched" if meta is not None else "fetched")
+        return body
+
+    async def afetch_with_retry(self, url: str, **kwargs) -> str:
+        """Async counterpart of ``fetch_with_retry``."""
+        return await self.retry_policy.acall(lambda: self.afetch(url, **kwargs), url, self._count)
@@ -0,0 +1,240 @@
+"""Storage backends for HttpCache.
+
+Two layouts are supported:
+
+* ``files`` - the original layout: ``<sha>.json`` / ``<sha>.bin`` bodies
+  next to a ``<sha>.meta.json`` sidecar, all in one flat directory.
+* ``sqlite`` - a single SQLite index (WAL mode) holding the metadata, with
+  bodies in sharded subdirectories (``bodies/ab/cd/<sha>.json``). A lookup
+  is one indexed query plus one file read, and no directory grows past a
+  few thousand entries. Safe for concurrent use from threads and processes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+SQLITE_INDEX = "index.sqlite"
+
+# Body file extension per body kind ("negative" entries have an empty body)
+BODY_EXTENSIONS = {"text": "json", "binary": "bin", "negative": "neg"}
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write data so concurrent readers never observe a partial file."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+class FileCacheStore:
+    """Flat-directory store: one body file plus one JSON meta sidecar per URL."""
+
+    name = "files"
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    def _body_path(self, key: str, kind: str) -> Path:
+        return self.cache_dir / f"{key}.{BODY_EXTENSIONS[kind]}"
+
+    def body_path(self, key: str, kind: str) -> Path:
+        """Where the body of this kind is (or would be) stored, for streaming writes."""
+        return self._body_path(key, kind)
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.meta.json"
+
+    def get_meta(self, key: str, kind: str) -> dict | None:
+        """Return the entry's metadata if a body of this kind is stored."""
+        meta_path = self._meta_path(key)
+        if not meta_path.exists() or not self._body_path(key, kind).exists():
+            return None
+        return json.loads(meta_path.read_text(encoding="utf-8"))
+
+    def put_meta(self, key: str, kind: str, meta: dict) -> None:
+        self._meta_path(key).write_text(json.dumps(meta), encoding="utf-8")
+
+    def read_body(self, key: str, kind: str) -> bytes | None:
+        try:
+            return self._body_path(key, kind).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def write_body(self, key: str, kind: str, data: bytes) -> None:
+        self._body_path(key, kind).write_bytes(data)
+
+    def iter_entries(self) -> Iterator[tuple[str, str, dict]]:
+        """Yield ``(key, kind, meta)`` for every stored entry."""
+        for meta_path in self.cache_dir.glob("*.meta.json"):
+            key = meta_path.name[: -len(".meta.json")]
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            for kind in BODY_EXTENSIONS:
+                if self._body_path(key, kind).exists():
+                    yield key, kind, meta
+
+    def delete(self, key: str, kind: str) -> None:
+        self._body_path(key, kind).unlink(missing_ok=True)
+        if not any(self._body_path(key, k).exists() for k in BODY_EXTENSIONS):
+            self._meta_path(key).unlink(missing_ok=True)
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteCacheStore:
+    """SQLite-indexed store with bodies in sharded subdirectories.
+
+    Each thread (and each forked process) lazily opens its own connection;
+    WAL mode lets readers proceed while another connection writes, and the
+    busy timeout serialises concurrent writers.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.db_path = cache_dir / SQLITE_INDEX
+        self.bodies_dir = cache_dir / "bodies"
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._conn()  # create the schema up front
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(
+            self.db_path, timeout=30, isolation_level=None, check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT NOT NULL,"
+            " kind TEXT NOT NULL,"
+            " url TEXT NOT NULL,"
+            " timestamp REAL NOT NULL,"
+            " meta TEXT NOT NULL,"
+            " PRIMARY KEY (key, kind)"
+            ") WITHOUT ROWID"
+        )
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def _body_path(self, key: str, kind: str) -> Path:
+        return self.bodies_dir / key[:2] / key[2:4] / f"{key}.{BODY_EXTENSIONS[kind]}"
+
+    def body_path(self, key: str, kind: str) -> Path:
+        """Where the body of this kind is (or would be) stored, for streaming writes."""
+        path = self._body_path(key, kind)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def get_meta(self, key: str, kind: str) -> dict | None:
+        """Return the entry's metadata if a body of this kind is stored."""
+        row = self._conn().execute(
+            "SELECT meta FROM entries WHERE key = ? AND kind = ?", (key, kind),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_meta(self, key: str, kind: str, meta: dict) -> None:
+        self._conn().execute(
+            "INSERT OR REPLACE INTO entries (key, kind, url, timestamp, meta) VALUES (?, ?, ?, ?, ?)",
+            (key, kind, meta.get("url", ""), meta.get("timestamp", 0), json.dumps(meta)),
+        )
+
+    def read_body(self, key: str, kind: str) -> bytes | None:
+        try:
+            return self._body_path(key, kind).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def write_body(self, key: str, kind: str, data: bytes) -> None:
+        path = self._body_path(key, kind)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(path, data)
+
+    def iter_entries(self) -> Iterator[tuple[str, str, dict]]:
+        """Yield ``(key, kind, meta)`` for every stored entry."""
+        rows = self._conn().execute("SELECT key, kind, meta FROM entries").fetchall()
+        for key, kind, meta in rows:
+            yield key, kind, json.loads(meta)
+
+    def delete(self, key: str, kind: str) -> None:
+        self._conn().execute("DELETE FROM entries WHERE key = ? AND kind = ?", (key, kind))
+        self._body_path(key, kind).unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Close every connection opened so far; new ones open on next use."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+
+def open_store(cache_dir: Path, backend: str | None = None) -> FileCacheStore | SQLiteCacheStore:
+    """Open the cache store for ``cache_dir``.
+
+    With no explicit backend, a directory that already has a SQLite index
+    (for example after ``migrate-cache``) uses it; otherwise the flat file
+    layout is used.
+    """
+    if backend is None:
+        backend = "sqlite" if (cache_dir / SQLITE_INDEX).exists() else "files"
+    if backend == "sqlite":
+        return SQLiteCacheStore(cache_dir)
+    if backend == "files":
+        return FileCacheStore(cache_dir)
+    raise ValueError(f"Unknown cache backend: {backend}")
+
+
+def migrate_file_cache(cache_dir: Path, delete: bool = False) -> int:
+    """Copy a flat-file cache directory into a SQLite store in the same directory.
+
+    Args:
+        cache_dir: Directory holding ``<sha>.meta.json`` sidecars and bodies.
+        delete: Remove the old body and meta files once copied.
+
+    Returns:
+        Number of entries migrated.
+    """
+    source = FileCacheStore(cache_dir)
+    dest = SQLiteCacheStore(cache_dir)
+    migrated = 0
+    try:
+        for key, kind, meta in source.iter_entries():
+            body = source.read_body(key, kind)
+            if body is None:
+                continue
+            dest.write_body(key, kind, body)
+            dest.put_meta(key, kind, meta)
+            if delete:
+                source.delete(key, kind)
+            migrated += 1
+            if migrated % 10000 == 0:
+                logger.info("Migrated %d cache entries...", migrated)
+    finally:
+        dest.close()
+    logger.info("Migrated %d cache entries in %s", migrated, cache_dir)
+    return migrated
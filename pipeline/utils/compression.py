@@ -0,0 +1,124 @@
+"""Optional compression for cached response bodies.
+
+Two codecs are supported: ``zlib`` (standard library) and ``zstd``
+(requires the optional ``zstandard`` package). Statute HTML typically
+compresses 5-10x. Readers never need to know how an entry was written:
+``decompress`` takes the codec recorded alongside the entry, and
+``sniff_codec`` recognises compressed data by its header so files written
+without metadata (the section-page cache) can be read either way.
+"""
+
+from __future__ import annotations
+
+import logging
+import zlib
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+CODECS = ("zlib", "zstd")
+
+# File suffix appended to compressed files that carry no separate metadata
+SUFFIXES = {"zlib": ".zz", "zstd": ".zst"}
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 10
+
+
+def _zstd_available() -> bool:
+    """Return True if the optional zstandard package is installed."""
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def resolve_codec(codec: str | None) -> str | None:
+    """Validate a configured codec name, falling back to zlib if zstd is missing.
+
+    Returns None when compression is disabled (``None``, ``""`` or ``"none"``).
+    """
+    if not codec or codec == "none":
+        return None
+    if codec not in CODECS:
+        raise ValueError(f"Unknown compression codec: {codec}")
+    if codec == "zstd" and not _zstd_available():
+        logger.warning("zstd compression requested but 'zstandard' is not installed; using zlib")
+        return "zlib"
+    return codec
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    """Compress ``data`` with ``codec``."""
+    if codec == "zlib":
+        return zlib.compress(data, ZLIB_LEVEL)
+    if codec == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    raise ValueError(f"Unknown compression codec: {codec}")
+
+
+def decompress(data: bytes, codec: str | None) -> bytes:
+    """Decompress ``data`` written with ``codec``; ``None`` means stored as-is."""
+    if codec is None:
+        return data
+    if codec == "zlib":
+        return zlib.decompress(data)
+    if codec == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f"Unknown compression codec: {codec}")
+
+
+def sniff_codec(data: bytes) -> str | None:
+    """Guess the codec of ``data`` from its header, or None if uncompressed.
+
+    Only meaningful for text bodies such as HTML, which can never start
+    with a zstd frame or a valid zlib header.
+    """
+    if data[:4] == _ZSTD_MAGIC:
+        return "zstd"
+    if len(data) >= 2 and data[0] == 0x78 and (data[0] << 8 | data[1]) % 31 == 0:
+        return "zlib"
+    return None
+
+
+def write_text(path: Path, text: str, codec: str | None = None) -> Path:
+    """Write ``text`` to ``path``, compressed with ``codec`` if given.
+
+    Compressed files get the codec's suffix (``page.html.zz``), and any
+    other variant of the same file is removed so reads are unambiguous.
+
+    Returns:
+        The path actually written.
+    """
+    data = text.encode("utf-8")
+    target = path
+    if codec is not None:
+        data = compress(data, codec)
+        target = path.with_name(path.name + SUFFIXES[codec])
+    target.write_bytes(data)
+    for other in _variants(path):
+        if other != target:
+            other.unlink(missing_ok=True)
+    return target
+
+
+def read_text(path: Path) -> str | None:
+    """Read text written by ``write_text`` (or a plain file), or None if absent."""
+    for candidate in _variants(path):
+        try:
+            data = candidate.read_bytes()
+        except FileNotFoundError:
+            continue
+        return decompress(data, sniff_codec(data)).decode("utf-8", errors="replace")
+    return None
+
+
+def _variants(path: Path) -> list[Path]:
+    return [path] + [path.with_name(path.name + suffix) for suffix in SUFFIXES.values()]
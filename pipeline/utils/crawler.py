@@ -0,0 +1,187 @@
+"""Concurrent page fetching on top of AsyncHttpCache.
+
+Crawlers hand a whole level of the site tree (e.g. every chapter page of
+every title) to ``fetch_many`` instead of fetching pages one at a time.
+Throughput is then bounded by the per-host rate limit and concurrency cap
+rather than by request round-trip latency.
+
+``crawl`` runs a multi-level crawl from a persistent CrawlFrontier, so it
+can be interrupted and resumed. A ``RoundParser`` hooked into it parses the
+pages each round saved on a background thread while the next round is
+being fetched.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from .cache import AsyncHttpCache, HttpCache
+from .frontier import CrawlFrontier, FrontierItem
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PER_HOST = 4
+
+# URLs claimed from a frontier per concurrent fetch round
+DEFAULT_CRAWL_BATCH = 200
+
+
+async def fetch_all(
+    cache: AsyncHttpCache,
+    urls: Iterable[str],
+) -> dict[str, str | Exception]:
+    """Fetch URLs concurrently through an AsyncHttpCache.
+
+    Each URL is retried according to ``cache.retry_policy``.
+
+    Args:
+        cache: Async cache that enforces per-host limits.
+        urls: URLs to fetch; duplicates are fetched once.
+
+    Returns:
+        Mapping of URL to response body, or to the exception that ended its retries.
+    """
+
+    async def _fetch_one(url: str) -> tuple[str, str | Exception]:
+        try:
+            return url, await cache.afetch_with_retry(url)
+        except Exception as e:
+            return url, e
+
+    unique = list(dict.fromkeys(urls))
+    results = await asyncio.gather(*(_fetch_one(url) for url in unique))
+    return dict(results)
+
+
+def fetch_many(
+    cache: HttpCache,
+    urls: Iterable[str],
+    max_per_host: int = DEFAULT_MAX_PER_HOST,
+) -> dict[str, str | Exception]:
+    """Synchronous entry point: fetch URLs concurrently using ``cache``'s settings.
+
+    Runs a private event loop, so it is safe to call from worker threads.
+    See ``fetch_all`` for the return value.
+    """
+    urls = list(urls)
+    if not urls:
+        return {}
+
+    async def _run() -> dict[str, str | Exception]:
+        async with AsyncHttpCache.from_cache(cache, max_per_host=max_per_host) as acache:
+            return await fetch_all(acache, urls)
+
+    return asyncio.run(_run())
+
+
+class RoundParser:
+    """Parse the pages a crawl round saved while the next round is fetched.
+
+    Handlers ``add`` the pages they save; ``after_round`` (passed to
+    ``crawl``) hands the round's pages to ``parse(fn, paths)`` on a
+    background thread, one call per function. Fetching is network-bound
+    and the parse runs on its own thread (or worker processes), so the two
+    overlap. At most one round is parsed behind the crawl: a round whose
+    predecessor is still parsing waits for it before being handed over.
+    Failures are logged and left for the parse stage to redo.
+
+    Args:
+        parse: Called as ``parse(fn, paths)`` for each function's pages.
+    """
+
+    def __init__(self, parse: Callable[[Callable[..., Any], list[Path]], Any]):
+        self._parse = parse
+        self._queued: dict[str, tuple[Callable[..., Any], list[Path]]] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="round-parse")
+        self._running: Future | None = None
+
+    def add(self, fn: Callable[..., Any], path: Path, key: str) -> None:
+        """Queue ``path`` for ``fn``; ``key`` names the function (calls with equal keys are grouped)."""
+        self._queued.setdefault(key, (fn, []))[1].append(path)
+
+    def after_round(self, final: bool) -> None:
+        """Hand the queued pages to the background thread (and wait for it if ``final``)."""
+        self._wait()
+        batches, self._queued = list(self._queued.values()), {}
+        if batches:
+            self._running = self._executor.submit(self._run, batches)
+        if final:
+            self._wait()
+
+    def _run(self, batches: list[tuple[Callable[..., Any], list[Path]]]) -> None:
+        for fn, paths in batches:
+            self._parse(fn, paths)
+
+    def _wait(self) -> None:
+        if self._running is None:
+            return
+        try:
+            self._running.result()
+        except Exception as e:
+            logger.warning("Fetch-time parse of a crawl round failed: %s", e)
+        self._running = None
+
+    def close(self) -> None:
+        """Finish any running parse; pages queued since are dropped."""
+        self._wait()
+        self._executor.shutdown()
+
+
+def crawl(
+    cache: HttpCache,
+    frontier: CrawlFrontier,
+    seeds: Iterable[FrontierItem],
+    handle: Callable[[FrontierItem, str], Iterable[FrontierItem]],
+    max_per_host: int = DEFAULT_MAX_PER_HOST,
+    batch_size: int = DEFAULT_CRAWL_BATCH,
+    after_round: Callable[[bool], None] | None = None,
+) -> None:
+    """Drive a crawl from a persistent frontier until nothing is pending.
+
+    Pending URLs are claimed in batches and fetched concurrently. Each page
+    is passed to ``handle(item, html)``, which saves it and returns the links
+    to follow; those are queued in the same transaction that marks the page
+    done. An interrupted crawl picks up where it stopped on the next call.
+    Links to pages the frontier already knows, under any spelling of their
+    URL, are dropped rather than fetched again.
+
+    Args:
+        cache: HTTP cache to fetch through.
+        frontier: Where crawl state is kept between runs.
+        seeds: Starting URLs (ignored when resuming).
+        handle: Page callback returning child items.
+        max_per_host: Concurrent requests per host.
+        batch_size: URLs fetched per round.
+        after_round: Called with False after each round's pages are handled,
+            before the next round is fetched, and with True once nothing is
+            pending, before the frontier is finished.
+    """
+    frontier.start(seeds)
+    while True:
+        items = frontier.claim(batch_size)
+        if not items:
+            if after_round is not None:
+                after_round(True)
+            break
+        pages = fetch_many(cache, [item.url for item in items], max_per_host=max_per_host)
+        for item in items:
+            html = pages[item.url]
+            if isinstance(html, Exception):
+                logger.debug("Crawl failed for %s: %s", item.url, html)
+                frontier.fail(item, f"{type(html).__name__}: {html}")
+                continue
+            frontier.complete(item, handle(item, html))
+        logger.info("Crawl %s: %s", frontier.path.stem, frontier.progress())
+        if after_round is not None:
+            after_round(False)
+    frontier.finish()
+    if frontier.duplicates:
+        logger.info(
+            "Crawl %s: %d fetches saved by skipping links to known pages",
+            frontier.path.stem, frontier.duplicates,
+        )
@@ -0,0 +1,388 @@
+"""Batched curl transport for sites that block Python TLS fingerprints.
+
+Some hosts (Justia behind Cloudflare) reject httpx but accept curl.
+Spawning one curl process per URL costs a fork/exec and a fresh TLS
+handshake every time, so this transport hands curl a whole batch of URLs
+in a config file and lets it reuse connections across them. Results are
+mapped back to individual URLs through curl's per-transfer ``urlnum``.
+
+Batches run either serially (one keep-alive connection, paced with
+``--rate``) or with ``--parallel``. ``CurlTransport.fetch`` also lets
+concurrent callers share batches: a background worker collects URLs
+submitted from many threads and fetches them in one curl invocation.
+Each caller gets its result as soon as its own transfer finishes; with
+``parallel`` > 1 new batches start while earlier ones are still running,
+keeping up to ``parallel`` transfers in flight, and URLs due a retry wait
+in the queue rather than holding up the worker.
+"""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+
+CURL_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "identity",
+}
+
+# What the Justia gap-filling scripts have always sent
+CHROME_HTML_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+CLOUDFLARE_MARKERS = ("Just a moment", "Checking your browser", "cf-browser-verification")
+
+# Per-transfer line curl prints after each URL completes. It goes to
+# stderr, which curl does not buffer, so each line arrives as its
+# transfer finishes rather than when the whole batch exits.
+_WRITE_OUT = "%{stderr}%{urlnum} %{http_code} %{exitcode} %{size_download}\\n"
+
+
+def is_challenge_page(html: str) -> bool:
+    """Return True if ``html`` is a Cloudflare challenge rather than real content."""
+    head = html[:2000]
+    return any(marker in head for marker in CLOUDFLARE_MARKERS)
+
+
+@dataclass
+class CurlResult:
+    """Outcome of one URL in a curl batch."""
+
+    url: str
+    status: int = 0
+    body: str | None = None
+    exit_code: int = 0
+    challenged: bool = False
+
+    @property
+    def retryable(self) -> bool:
+        """Challenge pages, transport errors and 5xx/429 may succeed on another try."""
+        return self.challenged or self.exit_code != 0 or self.status >= 500 or self.status == 429
+
+
+@dataclass
+class _Queued:
+    """A URL submitted to the batching worker."""
+
+    url: str
+    future: Future
+    attempt: int = 0
+    not_before: float = 0.0
+
+
+def _quote(value: str) -> str:
+    """Quote a value for a curl config file."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+class CurlTransport:
+    """Fetch URLs through batched curl invocations.
+
+    Args:
+        timeout: Per-transfer timeout in seconds (``--max-time``).
+        headers: Request headers; defaults to browser-like HTML headers.
+        parallel: Concurrent transfers. With 1 (the default) transfers run
+            serially over a reused connection, one batch at a time.
+        rate: Serial request rate in curl syntax (e.g. ``"40/m"``).
+        batch_size: Maximum URLs per curl invocation.
+        retries: Extra rounds for challenged or transiently failed URLs.
+        retry_delay: Seconds before the first retry round; grows linearly.
+        min_length: Bodies shorter than this count as failures.
+        linger: Seconds the batching worker waits to collect more URLs.
+    """
+
+    def __init__(
+        self,
+        timeout: int = 60,
+        headers: dict[str, str] | None = None,
+        parallel: int = 1,
+        rate: str | None = None,
+        batch_size: int = 50,
+        retries: int = 2,
+        retry_delay: float = 3.0,
+        min_length: int = 100,
+        linger: float = 0.05,
+    ):
+        self.timeout = timeout
+        self.headers = headers or CURL_HEADERS
+        self.parallel = parallel
+        self.rate = rate
+        self.batch_size = batch_size
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.min_length = min_length
+        self.linger = linger
+        self._pending: list[_Queued] = []
+        self._cond = threading.Condition()
+        self._worker: threading.Thread | None = None
+        # Transfers (parallel) or batches (serial) currently running
+        self._in_flight = 0
+
+    # ------------------------------------------------------------------
+    # Batch API
+    # ------------------------------------------------------------------
+
+    def fetch_many(self, urls: list[str]) -> dict[str, CurlResult]:
+        """Fetch ``urls`` in as few curl invocations as possible.
+
+        Challenged and transiently failed URLs are retried together in
+        later rounds. Returns a result for every distinct URL.
+        """
+        results: dict[str, CurlResult] = {}
+        todo = list(dict.fromkeys(urls))
+        for attempt in range(self.retries + 1):
+            if attempt > 0:
+                time.sleep(self.retry_delay * attempt)
+                logger.debug("curl retry round %d for %d URLs", attempt, len(todo))
+            for start in range(0, len(todo), self.batch_size):
+                for result in self._run_batch(todo[start:start + self.batch_size]):
+                    results[result.url] = result
+            todo = [url for url in todo if not self.ok(results[url]) and results[url].retryable]
+            if not todo:
+                break
+        return results
+
+    def ok(self, result: CurlResult) -> bool:
+        """Whether a result holds a usable page."""
+        return (
+            result.exit_code == 0
+            and 200 <= result.status < 400
+            and result.body is not None
+            and len(result.body) >= self.min_length
+            and not result.challenged
+        )
+
+    def _command(self, config_path: Path) -> list[str]:
+        # --parallel draws a progress meter on stderr even with -s
+        command = ["curl", "-sL", "--no-progress-meter", "--max-time", str(self.timeout), "--config", str(config_path)]
+        for name, value in self.headers.items():
+            command += ["-H", f"{name}: {value}"]
+        if self.parallel > 1:
+            # Without --parallel-immediate curl holds transfers back hoping
+            # to reuse a connection, which serialises HTTP/1.1 hosts
+            command += ["--parallel", "--parallel-immediate", "--parallel-max", str(self.parallel)]
+        elif self.rate:
+            command += ["--rate", self.rate]
+        return command + ["-w", _WRITE_OUT]
+
+    def _run_batch(
+        self,
+        urls: list[str],
+        on_result: Callable[[int, CurlResult], None] | None = None,
+    ) -> list[CurlResult]:
+        """Run one curl invocation for ``urls`` and read back each transfer.
+
+        ``on_result(index, result)`` is called for each URL as soon as its
+        transfer is complete, while the rest of the batch is still running.
+        """
+        results = [CurlResult(url) for url in urls]
+        with tempfile.TemporaryDirectory(prefix="curl-batch-") as tmp:
+            tmp_dir = Path(tmp)
+            config_path = tmp_dir / "urls.cfg"
+            lines = []
+            for i, url in enumerate(urls):
+                lines.append(f"url = {_quote(url)}")
+                lines.append(f"output = {_quote(str(tmp_dir / f'{i}.out'))}")
+            config_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+            def read(index: int) -> None:
+                out_path = tmp_dir / f"{index}.out"
+                if out_path.exists():
+                    results[index].body = out_path.read_bytes().decode("utf-8", errors="replace")
+                    results[index].challenged = is_challenge_page(results[index].body)
+                if on_result is not None:
+                    on_result(index, results[index])
+
+            try:
+                proc = subprocess.Popen(
+                    self._command(config_path),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
+            except FileNotFoundError as e:
+                logger.warning("curl batch of %d URLs failed: %s", len(urls), e)
+                for index, result in enumerate(results):
+                    result.exit_code = -1
+                    if on_result is not None:
+                        on_result(index, result)
+                return results
+
+            # Serial transfers take up to timeout each; parallel ones overlap
+            rounds = -(-len(urls) // max(1, self.parallel))
+            watchdog = threading.Timer(rounds * (self.timeout + 15) + 30, proc.kill)
+            watchdog.start()
+            reported = set()
+            # Transfers whose output file was not completely written when
+            # curl reported them; read once curl has exited
+            unflushed = []
+            try:
+                for line in proc.stderr:
+                    parts = line.split()
+                    if len(parts) != 4 or not all(p.lstrip("-").isdigit() for p in parts):
+                        continue
+                    index, status, exit_code, size = (int(p) for p in parts)
+                    if not 0 <= index < len(results) or index in reported:
+                        continue
+                    results[index].status = status
+                    results[index].exit_code = exit_code
+                    reported.add(index)
+                    out_path = tmp_dir / f"{index}.out"
+                    if size and (not out_path.exists() or out_path.stat().st_size < size):
+                        unflushed.append(index)
+                    else:
+                        read(index)
+            finally:
+                watchdog.cancel()
+                proc.stderr.close()
+                returncode = proc.wait()
+            if returncode < 0:
+                logger.warning("curl batch of %d URLs was killed after timing out", len(urls))
+            for index in unflushed:
+                read(index)
+            for index, result in enumerate(results):
+                if index not in reported:
+                    result.exit_code = returncode or -1
+                    read(index)
+        return results
+
+    # ------------------------------------------------------------------
+    # Per-URL API backed by a batching worker
+    # ------------------------------------------------------------------
+
+    def submit(self, url: str) -> Future:
+        """Queue ``url`` for the next shared batch; the future yields a CurlResult."""
+        future: Future = Future()
+        self._enqueue(_Queued(url, future))
+        return future
+
+    def fetch_result(self, url: str) -> CurlResult:
+        """Fetch one URL, sharing a curl invocation with concurrent callers."""
+        return self.submit(url).result()
+
+    def fetch(self, url: str) -> str | None:
+        """Fetch one URL and return its body, or None if curl could not get the page."""
+        result = self.fetch_result(url)
+        if not self.ok(result):
+            if result.challenged:
+                logger.debug("curl got Cloudflare challenge for %s", url)
+            return None
+        return result.body
+
+    def _enqueue(self, item: _Queued) -> None:
+        with self._cond:
+            self._pending.append(item)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._work, name="curl-batcher", daemon=True)
+                self._worker.start()
+            self._cond.notify_all()
+
+    def _capacity(self) -> int:
+        """URLs that may start now: free transfer slots, or a whole batch when serial."""
+        if self.parallel > 1:
+            return min(self.parallel - self._in_flight, self.batch_size)
+        return 0 if self._in_flight else self.batch_size
+
+    def _wait_for_work(self) -> bool:
+        """Block until a queued URL is due and there is room to start it.
+
+        Returns False once the worker has had nothing to do for 30 seconds.
+        Called with ``_cond`` held.
+        """
+        idle_since = time.monotonic()
+        while True:
+            now = time.monotonic()
+            if self._capacity() > 0 and any(item.not_before <= now for item in self._pending):
+                return True
+            if self._pending or self._in_flight:
+                idle_since = now
+            elif now - idle_since >= 30:
+                return False
+            due = [item.not_before - now for item in self._pending if item.not_before > now]
+            self._cond.wait(timeout=min(due + [30]))
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                if not self._wait_for_work():
+                    # Idle: let the thread exit; submit() starts a new one
+                    self._worker = None
+                    return
+            # Give concurrent callers a moment to add to the batch
+            time.sleep(self.linger)
+            with self._cond:
+                now = time.monotonic()
+                batch = [item for item in self._pending if item.not_before <= now][: self._capacity()]
+                if not batch:
+                    continue
+                taken = {id(item) for item in batch}
+                self._pending = [item for item in self._pending if id(item) not in taken]
+                self._in_flight += len(batch) if self.parallel > 1 else 1
+            threading.Thread(target=self._run_queued, args=(batch,), name="curl-batch", daemon=True).start()
+
+    def _release(self, slots: int) -> None:
+        with self._cond:
+            self._in_flight -= slots
+            self._cond.notify_all()
+
+    def _run_queued(self, batch: list[_Queued]) -> None:
+        """Fetch a batch taken from the queue, settling or requeueing each URL.
+
+        A URL due another try goes back in the queue with a not-before
+        time instead of this thread sleeping on it.
+        """
+        settled = set()
+
+        def on_result(index: int, result: CurlResult) -> None:
+            settled.add(index)
+            item = batch[index]
+            if not self.ok(result) and result.retryable and item.attempt < self.retries:
+                item.attempt += 1
+                item.not_before = time.monotonic() + self.retry_delay * item.attempt
+                logger.debug("curl retry %d for %s", item.attempt, item.url)
+                self._enqueue(item)
+            else:
+                item.future.set_result(result)
+            if self.parallel > 1:
+                self._release(1)
+
+        try:
+            self._run_batch([item.url for item in batch], on_result)
+        except Exception as e:
+            for index, item in enumerate(batch):
+                if index not in settled:
+                    item.future.set_exception(e)
+                    if self.parallel > 1:
+                        self._release(1)
+        finally:
+            if self.parallel == 1:
+                self._release(1)
+
+
+_shared: CurlTransport | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_transport() -> CurlTransport:
+    """The process-wide transport used for HttpCache's curl fallback."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = CurlTransport()
+        return _shared
@@ -0,0 +1,151 @@
+"""Per-state record of the section patterns and tags a state's pages use.
+
+Section extraction tries every block element of a page (``p``, ``div``,
+``span`` and a dozen more) against every section-number pattern, but a
+state's pages only ever match one or two of them: Nevada's ``NRS 1.010``,
+New Hampshire's ``Section: 1:1``. An ``ExtractionProfile`` counts the
+patterns and element tags that matched during a parse and is saved as
+JSON in the cache. The next parse of the state tries only those patterns
+on only those tags.
+
+A restricted pass gives the same sections as a full one on the same pages,
+because a pattern or tag left out never matched anywhere in the state.
+After a re-fetch pages can change, so a page the restricted pass gets
+nothing from is parsed again with everything, and a parse that yields fewer
+sections than the profile recorded is redone in full (see
+``OfficialWebsiteIngestor.parse``).
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+
+from .section_numbers import SectionNumberMatcher
+
+logger = logging.getLogger(__name__)
+
+PROFILE_VERSION = 1
+
+
+class ExtractionProfile:
+    """Patterns and tags that matched a state's pages, learned from its last parse.
+
+    Args:
+        matcher: The full pattern set.
+        tags: The full set of element tags tried.
+        parser: HTML parser backend; trees (and so tags) differ between backends.
+        patterns: Learned match counts per pattern name; empty until a parse is recorded.
+        tag_counts: Learned match counts per tag name.
+        sections: Sections the learning parse produced.
+
+    Attributes:
+        seen_patterns: Matches per pattern in the current parse.
+        seen_tags: Matches per element tag in the current parse.
+        fallbacks: Pages the current parse re-extracted with every pattern.
+    """
+
+    def __init__(
+        self,
+        matcher: SectionNumberMatcher,
+        tags: Iterable[str],
+        parser: str,
+        patterns: dict[str, int] | None = None,
+        tag_counts: dict[str, int] | None = None,
+        sections: int = 0,
+    ):
+        self.full_matcher = matcher
+        self.full_tags = frozenset(tags)
+        self.parser = parser
+        self.patterns = Counter(patterns or {})
+        self.tag_counts = Counter(tag_counts or {})
+        self.sections = sections
+        self.seen_patterns: Counter[str] = Counter()
+        self.seen_tags: Counter[str] = Counter()
+        self.fallbacks = 0
+        self.matcher = matcher.subset(self.patterns)
+        self.tags = frozenset(self.tag_counts) & self.full_tags
+
+    @property
+    def learned(self) -> bool:
+        """True if there are learned patterns to restrict extraction to."""
+        return bool(self.patterns) and bool(self.tags)
+
+    def _signature(self) -> dict:
+        return {
+            "version": PROFILE_VERSION,
+            "parser": self.parser,
+            "all_patterns": list(self.full_matcher.names),
+            "all_tags": sorted(self.full_tags),
+        }
+
+    @classmethod
+    def load(cls, path: Path, matcher: SectionNumberMatcher, tags: Iterable[str], parser: str) -> ExtractionProfile:
+        """Read a saved profile, or return an unlearned one.
+
+        A profile saved for another parser backend or another pattern or
+        tag set is ignored: what it learned may not hold any more.
+        """
+        profile = cls(matcher, tags, parser)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return profile
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable extraction profile %s: %s", path, e)
+            return profile
+        if {key: data.get(key) for key in profile._signature()} != profile._signature():
+            logger.info("Extraction profile %s is out of date; relearning", path)
+            return profile
+        return cls(matcher, tags, parser, data.get("patterns"), data.get("tags"), data.get("sections", 0))
+
+    def relearn(self) -> ExtractionProfile:
+        """An unlearned profile with the same full pattern and tag sets."""
+        return ExtractionProfile(self.full_matcher, self.full_tags, self.parser)
+
+    def scratch(self) -> ExtractionProfile:
+        """Same learned profile with nothing recorded, for one file of a parallel parse."""
+        scratch = copy.copy(self)
+        scratch.seen_patterns = Counter()
+        scratch.seen_tags = Counter()
+        scratch.fallbacks = 0
+        return scratch
+
+    def recorded(self) -> dict:
+        """What the current parse recorded, as plain data (for caches and worker results)."""
+        return {"patterns": dict(self.seen_patterns), "tags": dict(self.seen_tags), "fallbacks": self.fallbacks}
+
+    def merge(self, recorded: dict) -> None:
+        """Add what another profile recorded (see ``recorded``) to this one."""
+        self.seen_patterns.update(recorded["patterns"])
+        self.seen_tags.update(recorded["tags"])
+        self.fallbacks += recorded["fallbacks"]
+
+    def record(self, pattern: str, tag: str) -> None:
+        """Count a section-number match of ``pattern`` on a ``tag`` element."""
+        self.seen_patterns[pattern] += 1
+        self.seen_tags[tag] += 1
+
+    def save(self, path: Path, sections: int) -> None:
+        """Write what the current parse saw as the profile for the next one."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            **self._signature(),
+            "sections": sections,
+            "patterns": dict(self.seen_patterns.most_common()),
+            "tags": dict(self.seen_tags.most_common()),
+        }
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        tmp.replace(path)
+
+    def summary(self) -> str:
+        """One-line description of the current parse for logs."""
+        patterns = ", ".join(f"{name} {count}" for name, count in self.seen_patterns.most_common()) or "none"
+        tags = ", ".join(f"{name} {count}" for name, count in self.seen_tags.most_common()) or "none"
+        mode = "profiled" if self.learned else "full"
+        return f"{mode} extraction; patterns: {patterns}; tags: {tags}; {self.fallbacks} pages fell back"
@@ -0,0 +1,263 @@
+"""Persistent crawl frontier for multi-level site crawls.
+
+The frontier records every URL a crawl has discovered together with its
+state (pending, in flight, done or failed), depth, parent, priority and
+whatever the crawler needs to process the page later (``data``). It lives
+in a small SQLite database, so a crawl killed by a crash or a job timeout
+resumes where it stopped: URLs that were in flight go back to pending and
+everything already done is skipped.
+
+A page is marked done in the same transaction that records the links found
+on it, so the frontier never holds a finished page whose children are lost.
+
+The frontier doubles as the crawl's visited set: URLs are keyed by their
+canonical form (see ``urls.canonicalize_url``), so a page linked from many
+parents, or spelled in several ways, is queued and fetched once. The set
+lives in an on-disk index rather than memory, so it stays exact (unlike a
+Bloom filter) however large the crawl gets.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .urls import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+IN_FLIGHT = "in_flight"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass
+class FrontierItem:
+    """One URL in the frontier.
+
+    Higher ``priority`` values are claimed first; ties go to the URL that
+    was discovered first.
+    """
+
+    url: str
+    depth: int = 0
+    parent: str | None = None
+    priority: int = 0
+    data: dict = field(default_factory=dict)
+
+    def child(self, url: str, priority: int | None = None, **data) -> FrontierItem:
+        """A link found on this page, one level deeper."""
+        return FrontierItem(
+            url=url,
+            depth=self.depth + 1,
+            parent=self.url,
+            priority=self.priority if priority is None else priority,
+            data=data,
+        )
+
+
+class CrawlFrontier:
+    """SQLite-backed queue of URLs for one crawl.
+
+    Args:
+        path: Database file; created if missing.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(frontier)")]
+        if columns and "key" not in columns:
+            # Frontier from before canonical keys; crawl state is disposable
+            self._conn.executescript("DROP TABLE frontier; DROP TABLE IF EXISTS crawl;")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS frontier ("
+            " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " key TEXT NOT NULL UNIQUE,"
+            " url TEXT NOT NULL,"
+            " state TEXT NOT NULL,"
+            " depth INTEGER NOT NULL,"
+            " parent TEXT,"
+            " priority INTEGER NOT NULL,"
+            " data TEXT NOT NULL,"
+            " error TEXT,"
+            " updated REAL NOT NULL"
+            ");"
+            "CREATE INDEX IF NOT EXISTS frontier_queue ON frontier (state, priority DESC, seq);"
+            "CREATE TABLE IF NOT EXISTS crawl (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+        )
+        self._started = time.monotonic()
+        self._done_at_start = 0
+        self.duplicates = 0
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> CrawlFrontier:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Crawl lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def finished(self) -> bool:
+        row = self._conn.execute("SELECT value FROM crawl WHERE key = 'finished'").fetchone()
+        return row is not None
+
+    def start(self, seeds: Iterable[FrontierItem]) -> bool:
+        """Begin a crawl, or resume an unfinished one.
+
+        A finished crawl is cleared and started again from ``seeds``; an
+        unfinished one requeues its in-flight URLs and ignores ``seeds``
+        that are already known.
+
+        Returns:
+            True if an interrupted crawl is being resumed.
+        """
+        if self.finished:
+            self.reset()
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.execute(
+                "UPDATE frontier SET state = ? WHERE state = ?", (PENDING, IN_FLIGHT),
+            )
+        resumed = self.count() > 0
+        if resumed:
+            counts = self.counts()
+            logger.info(
+                "Resuming crawl %s: %d done, %d pending, %d failed",
+                self.path.stem, counts[DONE], counts[PENDING], counts[FAILED],
+            )
+        self.add(seeds)
+        self._started = time.monotonic()
+        self._done_at_start = self.counts()[DONE]
+        return resumed
+
+    def finish(self) -> None:
+        """Mark the crawl complete; the next ``start`` begins a new one."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO crawl (key, value) VALUES ('finished', ?)", (str(time.time()),),
+        )
+
+    def reset(self) -> None:
+        """Forget every URL and start from an empty frontier."""
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.execute("DELETE FROM frontier")
+            self._conn.execute("DELETE FROM crawl")
+
+    # ------------------------------------------------------------------
+    # Queue operations
+    # ------------------------------------------------------------------
+
+    def add(self, items: Iterable[FrontierItem]) -> int:
+        """Queue new URLs; URLs already in the frontier (in any spelling) are ignored.
+
+        Returns:
+            Number of URLs added.
+        """
+        with self._conn:
+            self._conn.execute("BEGIN")
+            return self._insert(items)
+
+    def _insert(self, items: Iterable[FrontierItem]) -> int:
+        now = time.time()
+        added = 0
+        seen = 0
+        for item in items:
+            seen += 1
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO frontier (key, url, state, depth, parent, priority, data, updated)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    canonicalize_url(item.url), item.url, PENDING, item.depth,
+                    item.parent, item.priority, json.dumps(item.data), now,
+                ),
+            )
+            added += cursor.rowcount
+        self.duplicates += seen - added
+        return added
+
+    def claim(self, limit: int) -> list[FrontierItem]:
+        """Take up to ``limit`` pending URLs, highest priority first, and mark them in flight."""
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            rows = self._conn.execute(
+                "SELECT key, url, depth, parent, priority, data FROM frontier"
+                " WHERE state = ? ORDER BY priority DESC, seq LIMIT ?",
+                (PENDING, limit),
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE frontier SET state = ?, updated = ? WHERE key = ?",
+                [(IN_FLIGHT, time.time(), row[0]) for row in rows],
+            )
+        return [
+            FrontierItem(url=url, depth=depth, parent=parent, priority=priority, data=json.loads(data))
+            for _, url, depth, parent, priority, data in rows
+        ]
+
+    def complete(self, item: FrontierItem, children: Iterable[FrontierItem] = ()) -> int:
+        """Mark ``item`` done and queue the links found on it, atomically.
+
+        Returns:
+            Number of new URLs queued.
+        """
+        with self._conn:
+            self._conn.execute("BEGIN")
+            added = self._insert(children)
+            self._conn.execute(
+                "UPDATE frontier SET state = ?, error = NULL, updated = ? WHERE key = ?",
+                (DONE, time.time(), canonicalize_url(item.url)),
+            )
+        return added
+
+    def fail(self, item: FrontierItem, error: str) -> None:
+        """Mark ``item`` failed; it is not retried when the crawl resumes."""
+        self._conn.execute(
+            "UPDATE frontier SET state = ?, error = ?, updated = ? WHERE key = ?",
+            (FAILED, error[:500], time.time(), canonicalize_url(item.url)),
+        )
+
+    def error(self, url: str) -> str | None:
+        """The recorded error for a failed URL, if any."""
+        row = self._conn.execute(
+            "SELECT error FROM frontier WHERE key = ? AND state = ?", (canonicalize_url(url), FAILED),
+        ).fetchone()
+        return row[0] if row else None
+
+    # ------------------------------------------------------------------
+    # Progress
+    # ------------------------------------------------------------------
+
+    def count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM frontier").fetchone()[0]
+
+    def counts(self) -> dict[str, int]:
+        """Number of URLs in each state."""
+        counts = dict.fromkeys((PENDING, IN_FLIGHT, DONE, FAILED), 0)
+        for state, n in self._conn.execute("SELECT state, COUNT(*) FROM frontier GROUP BY state"):
+            counts[state] = n
+        return counts
+
+    def progress(self) -> str:
+        """One-line progress summary including pages/sec since ``start``."""
+        counts = self.counts()
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        rate = (counts[DONE] - self._done_at_start) / elapsed
+        return (
+            f"{counts[DONE]} done, {counts[PENDING]} pending, "
+            f"{counts[FAILED]} failed ({rate:.1f} pages/s); "
+            f"{self.duplicates} duplicate links skipped"
+        )
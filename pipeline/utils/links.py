@@ -0,0 +1,167 @@
+"""Streaming ``<a href>`` extraction for the fetch phase.
+
+Crawl handlers only need the links on a page, not a document tree.
+``extract_links`` runs the same tokenizer BeautifulSoup's ``html.parser``
+backend uses, but keeps nothing except the open-tag stack, so it returns
+the same ``(href, text)`` pairs as::
+
+    [(a["href"], a.get_text(strip=True)) for a in soup.find_all("a", href=True)]
+
+several times faster. Tags are opened and closed the way BeautifulSoup's
+tree builder does it (void elements never open, an end tag closes the
+nearest matching open tag and everything above it), so link text comes
+out the same on malformed pages too.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from html.parser import HTMLParser
+
+# Elements BeautifulSoup closes as soon as they open
+VOID_ELEMENTS = frozenset({
+    "area", "base", "basefont", "bgsound", "br", "col", "command", "embed",
+    "frame", "hr", "image", "img", "input", "isindex", "keygen", "link",
+    "menuitem", "meta", "nextid", "param", "source", "spacer", "track", "wbr",
+})
+
+# Elements whose text get_text() leaves out
+_RAW_TEXT = frozenset({"script", "style", "template"})
+
+# (tag, attribute, value): an element like soup.find(tag, class_=value)
+# or soup.find(tag, id=value)
+Scope = tuple[str, str, str]
+
+
+def _matches(scope: Scope, tag: str, attrs: dict[str, str]) -> bool:
+    name, attr, value = scope
+    if tag != name or attr not in attrs:
+        return False
+    actual = attrs[attr]
+    if attr == "class":
+        return actual == value or value in actual.split()
+    return actual == value
+
+
+class _LinkParser(HTMLParser):
+    def __init__(self, scopes: Sequence[Scope]):
+        super().__init__(convert_charrefs=True)
+        self.scopes = scopes
+        # Per link: [href, text parts, index of each scope it sits in]
+        self.links: list[list] = []
+        # Open elements: (tag, link index or None, indexes of scopes it matched)
+        self._stack: list[tuple[str, int | None, tuple[int, ...]]] = []
+        self._open_links: list[int] = []
+        self._open_scopes: list[int] = []
+        self.found_scopes: set[int] = set()
+        self._data: list[str] = []
+        self._raw_text = 0
+        # Void elements opened with a start tag; a matching stray end tag is swallowed
+        self._closed_void: list[str] = []
+
+    def _flush(self) -> None:
+        if not self._data:
+            return
+        text = "".join(self._data).strip()
+        self._data = []
+        if text and self._open_links and not self._raw_text:
+            for index in self._open_links:
+                self.links[index][1].append(text)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._start(tag, attrs)
+
+    def _start(self, tag: str, attrs: list[tuple[str, str | None]], close_void: bool = True) -> None:
+        self._flush()
+        if tag in VOID_ELEMENTS:
+            if close_void:
+                self._closed_void.append(tag)
+            return
+        attr_dict = {key: "" if value is None else value for key, value in attrs}
+        link = None
+        if tag == "a" and "href" in attr_dict:
+            link = len(self.links)
+            self.links.append([attr_dict["href"], [], tuple(self._open_scopes)])
+            self._open_links.append(link)
+        # Like soup.find(): only the first matching element counts
+        scopes = tuple(
+            i for i, candidate in enumerate(self.scopes)
+            if i not in self.found_scopes and _matches(candidate, tag, attr_dict)
+        )
+        self.found_scopes.update(scopes)
+        self._open_scopes.extend(scopes)
+        if tag in _RAW_TEXT:
+            self._raw_text += 1
+        self._stack.append((tag, link, scopes))
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._start(tag, attrs, close_void=False)
+        self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._closed_void:
+            self._closed_void.remove(tag)
+            return
+        self._flush()
+        for depth in range(len(self._stack) - 1, -1, -1):
+            if self._stack[depth][0] == tag:
+                break
+        else:
+            return
+        while len(self._stack) > depth:
+            self._pop()
+
+    def _pop(self) -> None:
+        tag, link, scopes = self._stack.pop()
+        if link is not None:
+            self._open_links.remove(link)
+        for scope in scopes:
+            self._open_scopes.remove(scope)
+        if tag in _RAW_TEXT:
+            self._raw_text -= 1
+
+    def handle_data(self, data: str) -> None:
+        self._data.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self._flush()
+
+    def handle_decl(self, decl: str) -> None:
+        self._flush()
+
+    def handle_pi(self, data: str) -> None:
+        self._flush()
+
+    def unknown_decl(self, data: str) -> None:
+        self._flush()
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+        while self._stack:
+            self._pop()
+
+
+def extract_links(html: str, within: Sequence[Scope] = ()) -> list[tuple[str, str]]:
+    """Return ``(href, text)`` for every ``<a href>`` in ``html``, in page order.
+
+    ``href`` is the attribute as written (not joined with the page URL) and
+    ``text`` is the link's text with each string stripped, as
+    ``get_text(strip=True)`` returns it.
+
+    Args:
+        html: Page source.
+        within: Candidate content areas, tried in order like
+            ``soup.find(...) or soup.find(...) or soup``: links are taken
+            from the first candidate present on the page, or from the whole
+            page if none is.
+    """
+    parser = _LinkParser(within)
+    parser.feed(html)
+    parser.close()
+    links = parser.links
+    for i in range(len(within)):
+        if i in parser.found_scopes:
+            links = [link for link in links if i in link[2]]
+            break
+    return [(href, "".join(parts)) for href, parts, _ in links]
@@ -0,0 +1,98 @@
+"""Negative caching: remember URLs that failed in ways a re-run cannot fix.
+
+Numeric probes (Oregon chapters 1-999, Arizona titles 1-49, ...) and
+constructed section URLs hit many pages that do not exist, and some pages
+only ever return a Cloudflare challenge. Recording those failures lets the
+next run skip them without any network or curl work. Entries live in the
+HTTP cache's store next to the positive entries and expire on their own,
+shorter TTL per failure class.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+
+from .cache_store import FileCacheStore, SQLiteCacheStore
+from .urls import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+# Time-to-live per failure class, in seconds
+DEFAULT_NEGATIVE_TTLS = {
+    "not_found": 24 * 3600,  # 404: may appear when a code is republished
+    "gone": 7 * 24 * 3600,  # 410: removed on purpose
+    "blocked": 6 * 3600,  # 403 / challenge page that curl could not get past
+}
+
+# HTTP status recorded for each failure class
+FAILURE_STATUS = {"not_found": 404, "gone": 410, "blocked": 403}
+
+_KIND = "negative"
+
+
+def failure_class(status_code: int) -> str | None:
+    """Map an HTTP status to a negative-cache failure class, if it has one."""
+    for failure, status in FAILURE_STATUS.items():
+        if status == status_code:
+            return failure
+    return None
+
+
+class NegativeCache:
+    """Failed URLs stored in a cache store, each with a failure class.
+
+    Args:
+        store: The store to keep entries in (usually the HttpCache's).
+        ttls: Per-class TTL overrides, merged over DEFAULT_NEGATIVE_TTLS.
+        ignore: Never report cached failures (entries are still recorded).
+    """
+
+    def __init__(
+        self,
+        store: FileCacheStore | SQLiteCacheStore,
+        ttls: dict[str, float] | None = None,
+        ignore: bool = False,
+    ):
+        self.store = store
+        self.ttls = {**DEFAULT_NEGATIVE_TTLS, **(ttls or {})}
+        self.ignore = ignore
+
+    def _key(self, url: str) -> str:
+        # Namespaced so a URL's negative entry never collides with its positive one
+        return hashlib.sha256(f"negative:{canonicalize_url(url)}".encode()).hexdigest()
+
+    def lookup(self, url: str) -> dict | None:
+        """Return the recorded failure for ``url`` (fresh or not), or None."""
+        return self.store.get_meta(self._key(url), _KIND)
+
+    def is_fresh(self, entry: dict) -> bool:
+        ttl = self.ttls.get(entry.get("failure", ""), 0)
+        return time.time() - entry.get("timestamp", 0) <= ttl
+
+    def get(self, url: str) -> dict | None:
+        """Return a fresh recorded failure for ``url``, unless ignoring the cache."""
+        if self.ignore:
+            return None
+        entry = self.lookup(url)
+        if entry is None or not self.is_fresh(entry):
+            return None
+        return entry
+
+    def record(self, url: str, failure: str) -> None:
+        """Remember that ``url`` failed with ``failure`` (a key of FAILURE_STATUS)."""
+        key = self._key(url)
+        meta = {
+            "url": url,
+            "timestamp": time.time(),
+            "failure": failure,
+            "status_code": FAILURE_STATUS[failure],
+        }
+        self.store.write_body(key, _KIND, b"")
+        self.store.put_meta(key, _KIND, meta)
+        logger.debug("Recorded %s for %s", failure, url)
+
+    def clear(self, url: str) -> None:
+        """Forget a recorded failure (e.g. after the URL succeeded)."""
+        self.store.delete(self._key(url), _KIND)
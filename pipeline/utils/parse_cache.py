@@ -0,0 +1,166 @@
+"""Per-file cache of parse results, keyed by the raw file's content.
+
+Re-parsing a state builds a tree for every raw file even when only a few
+changed since the last run. ``ParseCache`` stores what parsing each file
+produced (Sections, Chapters, ...) under the SHA-256 of the file's bytes,
+so the next parse only runs the parser on new or changed files and takes
+everything else from the cache.
+
+Entries are also keyed by a code version: a hash of the source of the
+modules that decide what a parse produces, plus the installed bs4 and
+lxml versions. Editing a parser invalidates its entries without anyone
+having to remember to bump a number. Entries unused for
+``PRUNE_AFTER_DAYS`` are dropped, the first time a process opens the cache.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import importlib
+import json
+import logging
+import sqlite3
+import time
+import zlib
+from collections.abc import Sequence
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored format changes
+PARSE_CACHE_VERSION = 1
+
+# Comfortably longer than the monthly refresh of bulk sources, whose
+# unchanged files should still find their results
+PRUNE_AFTER_DAYS = 90
+
+# SQLite's default limit on variables in one statement is 999
+_BATCH = 500
+
+# Databases this process has already pruned; a crawl opens its cache once
+# per round, and pruning is only needed once per run
+_pruned: set[Path] = set()
+
+
+@functools.lru_cache(maxsize=None)
+def code_version(modules: tuple[str, ...]) -> str:
+    """Hash of the named modules' source and the HTML parser library versions."""
+    h = hashlib.sha256(f"parse-cache-{PARSE_CACHE_VERSION}".encode())
+    for package in ("beautifulsoup4", "lxml"):
+        try:
+            h.update(f"{package}={metadata.version(package)}".encode())
+        except metadata.PackageNotFoundError:
+            h.update(f"{package}=none".encode())
+    for name in sorted(set(modules)):
+        h.update(name.encode())
+        h.update(Path(importlib.import_module(name).__file__).read_bytes())
+    return h.hexdigest()
+
+
+def describe(fn: Any) -> str:
+    """A stable name for a per-file parse function, bound method or partial."""
+    if isinstance(fn, functools.partial):
+        args = [describe(arg) for arg in fn.args]
+        args += [f"{key}={describe(value)}" for key, value in sorted(fn.keywords.items())]
+        return f"{describe(fn.func)}({', '.join(args)})"
+    fn = getattr(fn, "__func__", fn)
+    if hasattr(fn, "__qualname__"):
+        return f"{fn.__module__}.{fn.__qualname__}"
+    return repr(fn)
+
+
+class ParseCache:
+    """SQLite store of encoded parse results.
+
+    Args:
+        path: Database file; created if missing.
+        version: Code version (see ``code_version``) the results belong to.
+        types: Dataclasses results may contain; they are stored as JSON
+            objects tagged with the class name.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that had to be parsed.
+    """
+
+    def __init__(self, path: Path, version: str, types: Sequence[type]):
+        self.path = path
+        self.version = version
+        self._types = {cls.__name__: cls for cls in types}
+        self.hits = 0
+        self.misses = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY, value BLOB NOT NULL, used_at INTEGER NOT NULL)"
+        )
+        # used_at sits after the blob, so without an index pruning reads
+        # every row's overflow pages
+        self._conn.execute("CREATE INDEX IF NOT EXISTS results_used_at ON results (used_at)")
+        self._now = int(time.time())
+        resolved = path.resolve()
+        if resolved not in _pruned:
+            _pruned.add(resolved)
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM results WHERE used_at < ?", (self._now - PRUNE_AFTER_DAYS * 86400,)
+                )
+
+    def key(self, task: str, digest: str, extra: Sequence[Any] = ()) -> str:
+        """Cache key for ``task`` run on a file with content hash ``digest``."""
+        parts = [self.version, task, digest, *(repr(value) for value in extra)]
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def _encode(self, value: Any) -> bytes:
+        def default(obj):
+            if dataclasses.is_dataclass(obj) and type(obj).__name__ in self._types:
+                fields = {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+                return {"__type__": type(obj).__name__, **fields}
+            raise TypeError(f"Cannot cache a {type(obj).__name__}")
+
+        return zlib.compress(json.dumps(value, default=default).encode("utf-8"))
+
+    def _decode(self, data: bytes) -> Any:
+        def hook(obj):
+            name = obj.pop("__type__", None)
+            return self._types[name](**obj) if name else obj
+
+        return json.loads(zlib.decompress(data), object_hook=hook)
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, Any]:
+        """Decoded results for the keys that are cached."""
+        found = {}
+        unique = list(dict.fromkeys(keys))
+        for i in range(0, len(unique), _BATCH):
+            batch = unique[i:i + _BATCH]
+            marks = ",".join("?" * len(batch))
+            rows = self._conn.execute(f"SELECT key, value FROM results WHERE key IN ({marks})", batch)
+            for key, value in rows:
+                found[key] = self._decode(value)
+            with self._conn:
+                self._conn.execute(f"UPDATE results SET used_at = ? WHERE key IN ({marks})", [self._now, *batch])
+        self.hits += sum(1 for key in keys if key in found)
+        self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def put_many(self, results: dict[str, Any]) -> None:
+        """Store results by key, replacing older entries."""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results (key, value, used_at) VALUES (?, ?, ?)",
+                [(key, self._encode(value), self._now) for key, value in results.items()],
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> ParseCache:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,50 @@
+"""Fan the parse phase's per-file work out to worker processes.
+
+Parsing is CPU-bound (BeautifulSoup and lxml tree building), so threads
+cannot speed it up past the GIL. ``parse_map`` runs a per-file function in
+a ``ProcessPoolExecutor`` and returns the results in input order, so an
+ingestor assembles its Titles and Chapters exactly as a serial loop would.
+
+The function and its arguments are pickled to the workers; ingestor bound
+methods work because ingestors leave their network resources behind when
+pickled (see ``BaseIngestor.__getstate__``).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Chunks per worker: enough to balance uneven file sizes, few enough to
+# keep pickling overhead per file low
+CHUNKS_PER_WORKER = 4
+
+
+def default_workers() -> int:
+    """Number of CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def parse_map(fn: Callable[..., Any], *iterables: Iterable, workers: int = 1) -> list:
+    """Return ``list(map(fn, *iterables))``, computed by ``workers`` processes.
+
+    With one worker (or fewer than two items) everything runs in this
+    process. Items are sent in chunks to cut inter-process overhead.
+    """
+    columns = [list(iterable) for iterable in iterables]
+    count = min((len(column) for column in columns), default=0)
+    workers = min(workers, count)
+    if workers <= 1:
+        return list(map(fn, *columns))
+    chunksize = max(1, count // (workers * CHUNKS_PER_WORKER))
+    logger.debug("Parsing %d files in %d processes (chunks of %d)", count, workers, chunksize)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, *columns, chunksize=chunksize))
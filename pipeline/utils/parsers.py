@@ -0,0 +1,48 @@
+"""HTML parser backends for BeautifulSoup.
+
+Section extraction builds a BeautifulSoup tree for every cached page. The
+tree builder is pluggable: ``lxml`` (C, the default) builds trees faster
+than Python's ``html.parser``; ``html5lib`` is the slowest but repairs
+broken markup the way browsers do. The backend is chosen per state
+with ``parser:`` in sources.yaml.
+
+Backends repair malformed HTML differently, so switching one can change
+the sections a page yields; ``python -m pipeline.cli compare-parsers`` checks
+a state's output under each backend before it is switched.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+
+logger = logging.getLogger(__name__)
+
+PARSERS = ("lxml", "html5lib", "html.parser")
+
+DEFAULT_PARSER = "lxml"
+
+# Module each backend needs; html.parser ships with Python
+_REQUIRES = {"lxml": "lxml", "html5lib": "html5lib"}
+
+
+def parser_available(parser: str) -> bool:
+    """Return True if the package behind ``parser`` is installed."""
+    module = _REQUIRES.get(parser)
+    return module is None or importlib.util.find_spec(module) is not None
+
+
+def resolve_parser(parser: str | None) -> str:
+    """Validate a configured parser name, falling back to html.parser if it is missing.
+
+    Returns DEFAULT_PARSER when ``parser`` is None or empty.
+    """
+    if not parser:
+        parser = DEFAULT_PARSER
+    if parser not in PARSERS:
+        raise ValueError(f"Unknown HTML parser: {parser} (choose from {', '.join(PARSERS)})")
+    if not parser_available(parser):
+        logger.warning("HTML parser %r requested but %r is not installed; using html.parser",
+                       parser, _REQUIRES[parser])
+        return "html.parser"
+    return parser
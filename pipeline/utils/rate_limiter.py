@@ -3,50 +3,153 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import threading
 import time
 from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+logger = logging.getLogger(__name__)
+
+# Status codes that mean "slow down" rather than "this request is broken"
+THROTTLE_STATUS_CODES = frozenset({429, 503})
 
 
 class RateLimiter:
-    """Token-bucket rate limiter.
+    """Thread-safe token-bucket rate limiter with AIMD adaptation.
+
+    Each caller reserves the next free slot before sleeping, so threads and
+    coroutines sharing one limiter are spaced out instead of waking together.
+
+    The limiter adapts to the server: ``throttled()`` (called on a 429/503)
+    multiplies the current rate by ``decrease_factor`` and, given a
+    Retry-After delay, holds every caller until it has passed; each
+    ``succeeded()`` adds ``increase_step`` back until the configured rate
+    is reached again.
 
     Args:
         requests_per_second: Maximum sustained request rate.
         burst: Maximum burst size (defaults to requests_per_second).
+        min_rate: Floor the rate never drops below when backing off.
+        decrease_factor: Multiplier applied to the rate on each throttle.
+        increase_step: Requests per second regained per successful request
+            (defaults to 5% of ``requests_per_second``).
     """
 
-    def __init__(self, requests_per_second: float = 2.0, burst: int | None = None):
+    def __init__(
+        self,
+        requests_per_second: float = 2.0,
+        burst: int | None = None,
+        min_rate: float = 0.1,
+        decrease_factor: float = 0.5,
+        increase_step: float | None = None,
+    ):
+        self.max_rate = requests_per_second
         self.rate = requests_per_second
         self.burst = burst or max(1, int(requests_per_second))
+        self.min_rate = min(min_rate, requests_per_second)
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step or requests_per_second / 20
         self._timestamps: deque[float] = deque()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
 
-    def wait(self) -> None:
-        """Block until a request is allowed (synchronous)."""
-        now = time.monotonic()
-        # Remove timestamps outside the window
-        window = 1.0 / self.rate * self.burst
-        while self._timestamps and now - self._timestamps[0] > window:
-            self._timestamps.popleft()
+    def _reserve(self) -> float:
+        """Claim the next request slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            # Remove timestamps outside the window
+            window = 1.0 / self.rate * self.burst
+            while self._timestamps and now - self._timestamps[0] > window:
+                self._timestamps.popleft()
 
-        if len(self._timestamps) >= self.burst:
-            sleep_until = self._timestamps[0] + window
-            sleep_time = sleep_until - now
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            slot = max(now, self._blocked_until)
+            if len(self._timestamps) >= self.burst:
+                slot = max(slot, self._timestamps[-self.burst] + window)
 
-        self._timestamps.append(time.monotonic())
+            self._timestamps.append(slot)
+            return slot - now
+
+    def wait(self) -> None:
+        """Block until a request is allowed (synchronous)."""
+        sleep_time = self._reserve()
+        if sleep_time > 0:
+            time.sleep(sleep_time)
 
     async def async_wait(self) -> None:
         """Yield until a request is allowed (async)."""
-        now = time.monotonic()
-        window = 1.0 / self.rate * self.burst
-        while self._timestamps and now - self._timestamps[0] > window:
-            self._timestamps.popleft()
-
-        if len(self._timestamps) >= self.burst:
-            sleep_until = self._timestamps[0] + window
-            sleep_time = sleep_until - now
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
-
-        self._timestamps.append(time.monotonic())
+        sleep_time = self._reserve()
+        if sleep_time > 0:
+            await asyncio.sleep(sleep_time)
+
+    def throttled(self, retry_after: float | None = None) -> None:
+        """Back off after the server signalled overload (429/503).
+
+        Args:
+            retry_after: Seconds the server asked us to wait, if it said.
+        """
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            if retry_after is not None and retry_after > 0:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+            rate = self.rate
+        logger.info(
+            "Throttled: backing off to %.2f req/s%s",
+            rate,
+            f", pausing {retry_after:.0f}s" if retry_after else "",
+        )
+
+    def succeeded(self) -> None:
+        """Ramp the rate back up after a successful request."""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def observe(self, status_code: int, retry_after: str | None = None) -> None:
+        """Adapt to a response: back off on 429/503, ramp up on success."""
+        if status_code in THROTTLE_STATUS_CODES:
+            self.throttled(parse_retry_after(retry_after))
+        elif status_code < 400:
+            self.succeeded()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+_host_limiters: dict[str, RateLimiter] = {}
+_host_limiters_lock = threading.Lock()
+
+
+def host_limiter(host: str, requests_per_second: float = 2.0, burst: int | None = None) -> RateLimiter:
+    """Return the process-wide limiter for ``host``, creating it on first use.
+
+    Every HttpCache in the process shares these, so ingestors running in
+    parallel against the same host draw from one budget. When callers ask
+    for different rates, the most conservative one wins.
+    """
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None:
+            limiter = RateLimiter(requests_per_second=requests_per_second, burst=burst)
+            _host_limiters[host] = limiter
+        elif requests_per_second < limiter.max_rate:
+            with limiter._lock:
+                limiter.max_rate = requests_per_second
+                limiter.rate = min(limiter.rate, requests_per_second)
+                limiter.burst = min(limiter.burst, burst or max(1, int(requests_per_second)))
+        return limiter
@@ -0,0 +1,239 @@
+"""Retry policy and per-host circuit breakers for HTTP fetches.
+
+Failures are classified before deciding whether to retry: a 404 or 410
+will not change on a second try, so it is raised immediately, while
+timeouts, connection errors, 5xx and 429 responses are retried with
+jittered exponential backoff. A host that keeps failing trips its circuit
+breaker, after which requests to it fail fast until a cooldown has passed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 4xx responses that are worth retrying (timeouts and throttling)
+RETRYABLE_CLIENT_ERRORS = frozenset({408, 425, 429})
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host whose breaker is open."""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"Circuit open for {host}; retrying in {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Return True if a failed request might succeed when retried."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status >= 500 or status in RETRYABLE_CLIENT_ERRORS
+    # Timeouts, connection resets, protocol errors
+    return isinstance(exc, httpx.TransportError)
+
+
+class CircuitBreaker:
+    """Stop sending requests to a host after repeated transient failures.
+
+    After ``failure_threshold`` consecutive transient failures the breaker
+    opens and every request raises CircuitOpenError. Once ``cooldown``
+    seconds have passed a single trial request is let through: success
+    closes the breaker, failure opens it for another cooldown.
+    """
+
+    def __init__(self, host: str, failure_threshold: int = 5, cooldown: float = 60.0):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def before_request(self) -> None:
+        """Raise CircuitOpenError unless a request to the host may be sent now."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self._opened_at + self.cooldown - time.monotonic()
+            if remaining > 0 or self._trial_in_flight:
+                raise CircuitOpenError(self.host, max(remaining, 0.0))
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("Circuit closed for %s", self.host)
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.warning(
+                        "Circuit opened for %s after %d consecutive failures",
+                        self.host, self._failures,
+                    )
+                self._opened_at = time.monotonic()
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def host_breaker(host: str, failure_threshold: int = 5, cooldown: float = 60.0) -> CircuitBreaker:
+    """Return the process-wide circuit breaker for ``host``, creating it on first use."""
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(host, failure_threshold, cooldown)
+            _breakers[host] = breaker
+        return breaker
+
+
+@dataclass
+class RetryPolicy:
+    """How often and how patiently to retry a failed fetch.
+
+    Args:
+        attempts: Total attempts per URL, including the first.
+        base_delay: Backoff before the first retry; doubled for each later one.
+        max_delay: Upper bound on a single backoff.
+        jitter: Fraction of each backoff that is randomised, so many
+            workers failing together do not retry in lockstep.
+        failure_threshold: Consecutive transient failures that open a host's breaker.
+        cooldown: Seconds a host's breaker stays open.
+    """
+
+    attempts: int = 3
+    base_delay: float = 3.0
+    max_delay: float = 60.0
+    jitter: float = 0.5
+    failure_threshold: int = 5
+    cooldown: float = 60.0
+
+    def backoff(self, attempt: int) -> float:
+        """Seconds to sleep before retry number ``attempt + 1``."""
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * (1 - self.jitter * random.random())
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        return host_breaker(urlsplit(url).netloc, self.failure_threshold, self.cooldown)
+
+    def call(
+        self,
+        fn: Callable[[], T],
+        url: str,
+        record: Callable[[str, float], None] | None = None,
+    ) -> T:
+        """Call ``fn`` (a fetch of ``url``), retrying transient failures.
+
+        ``record(event, amount)`` receives counters for the run summary:
+        ``retries``, ``retry_sleep`` and ``wasted_sleep`` (backoff spent on
+        URLs that failed anyway), ``permanent_failures`` and ``short_circuited``.
+        """
+        breaker = self.breaker(url)
+        slept = 0.0
+        for attempt in range(self.attempts):
+            try:
+                breaker.before_request()
+            except CircuitOpenError:
+                self._record(record, "short_circuited")
+                self._record(record, "wasted_sleep", slept)
+                raise
+            try:
+                result = fn()
+            except Exception as e:
+                delay = self._on_failure(e, breaker, url, attempt, record, slept)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                slept += delay
+                continue
+            breaker.record_success()
+            return result
+        raise AssertionError("unreachable")
+
+    async def acall(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        url: str,
+        record: Callable[[str, float], None] | None = None,
+    ) -> T:
+        """Async counterpart of ``call``."""
+        breaker = self.breaker(url)
+        slept = 0.0
+        for attempt in range(self.attempts):
+            try:
+                breaker.before_request()
+            except CircuitOpenError:
+                self._record(record, "short_circuited")
+                self._record(record, "wasted_sleep", slept)
+                raise
+            try:
+                result = await fn()
+            except Exception as e:
+                delay = self._on_failure(e, breaker, url, attempt, record, slept)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                slept += delay
+                continue
+            breaker.record_success()
+            return result
+        raise AssertionError("unreachable")
+
+    def _on_failure(
+        self,
+        exc: Exception,
+        breaker: CircuitBreaker,
+        url: str,
+        attempt: int,
+        record: Callable[[str, float], None] | None,
+        slept: float,
+    ) -> float | None:
+        """Classify a failure; return the backoff before retrying, or None to give up."""
+        if not is_transient(exc):
+            # The host answered, so it is healthy even though the page is not
+            breaker.record_success()
+            self._record(record, "permanent_failures")
+            self._record(record, "wasted_sleep", slept)
+            logger.debug("Not retrying %s: %s", url, exc)
+            return None
+        breaker.record_failure()
+        if attempt >= self.attempts - 1:
+            self._record(record, "wasted_sleep", slept)
+            return None
+        delay = self.backoff(attempt)
+        self._record(record, "retries")
+        self._record(record, "retry_sleep", delay)
+        logger.info("Retry %d for %s in %.1fs: %s", attempt + 1, url, delay, exc)
+        return delay
+
+    @staticmethod
+    def _record(record: Callable[[str, float], None] | None, event: str, amount: float = 1) -> None:
+        if record is not None and amount:
+            record(event, amount)
@@ -0,0 +1,109 @@
+"""Recognise section-number prefixes ("§ 1-1-1. Heading") in element text.
+
+Section extraction tries a list of patterns against the text of every
+block element on a page. Running them one after another costs one
+``re.match`` call per pattern per element, and most elements match none.
+``SectionNumberMatcher`` joins the patterns into a single alternation
+with one named group per pattern, so each element needs one match
+attempt. Regex alternation tries branches left to right, so the pattern
+that wins is the one the sequential loop would have stopped at.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple
+
+# Trailing separator between a number and its heading
+_SEP = r"\s*[.\-–—:\s]+"
+
+# Named patterns; each captures (number, rest of the text)
+PATTERNS = {
+    # § 1-1-1. Heading text
+    "section_sign": r"(?:§+\s*)([\d\-\.a-zA-Z:]+)" + _SEP + r"(.*)",
+    # SECTION 1-1-10. Heading (SC, other states with uppercase)
+    "section_caps": r"SECTION\s+([\d\-\.a-zA-Z:]+)" + _SEP + r"(.*)",
+    # NRS 0.010 (Nevada style - may use EN SPACE \u2002 and replacement chars)
+    "nrs": r"NRS[\s\u2002\u00a0]+([\d\.]+[A-Z]?)[\s\u2002\u00a0\ufffd]+([A-Za-z].*)",
+    # "Section: 1:1 Heading" or "Section: 1-A:1 Heading" (NH style)
+    "section_colon": r"Section:\s+([\d\-a-zA-Z:]+)\s+(.*)",
+    # Section 1-1-1. or Sec. 1-1-1.
+    "sec": r"Sec(?:tion)?\.?\s*([\d\-\.a-zA-Z:]+)" + _SEP + r"(.*)",
+    # KRS style ".1-101 Short title" (dot-prefixed)
+    "dot_prefixed": r"\.([\d]+-[\d]+[a-zA-Z]?)\s+(.*)",
+    # Numbered like "1-101." or "12.01." at start of line
+    "numbered": r"^([\d]+[\-\.]\d[\d\-\.a-zA-Z]*)" + _SEP + r"(.*)",
+    # ORS style "001.010" or "1.010"
+    "ors": r"^(\d{1,3}\.\d{3,}[a-zA-Z]?)\s*[.\s]+(.*)",
+    # Art./Article prefix
+    "article": r"Art(?:icle)?\.?\s*([\d\-\.a-zA-Z]+)" + _SEP + r"(.*)",
+}
+
+
+class SectionNumber(NamedTuple):
+    """A matched section-number prefix."""
+
+    number: str
+    rest: str
+    # Name of the pattern that matched
+    pattern: str
+
+
+class SectionNumberMatcher:
+    """First of several ``(number, rest)`` patterns matching at the start of a text.
+
+    Equivalent to trying ``re.compile(p, re.DOTALL).match(text)`` for each
+    pattern in order and keeping the first match, in one match attempt.
+
+    Attributes:
+        names: Pattern names, in the order they are tried.
+        hits: Matches per pattern name, for profiling which patterns a
+            state's pages actually use.
+    """
+
+    def __init__(self, patterns: Sequence[tuple[str, str]]):
+        self._patterns = list(patterns)
+        self.names = tuple(name for name, _ in self._patterns)
+        branches = []
+        # Group index of each branch's number; its rest is the group after it
+        self._groups: dict[str, int] = {}
+        group = 1
+        for name, pattern in self._patterns:
+            inner = re.compile(pattern).groups
+            if inner != 2:
+                raise ValueError(f"Pattern {name!r} must capture (number, rest), not {inner} groups")
+            branches.append(f"(?P<{name}>{pattern})")
+            self._groups[name] = group + 1
+            group += 1 + inner
+        # An empty pattern list matches nothing
+        self._regex = re.compile("|".join(branches) or "(?!)", re.DOTALL)
+        self.hits: Counter[str] = Counter()
+
+    @classmethod
+    def named(cls, *names: str) -> SectionNumberMatcher:
+        """Matcher over the given entries of PATTERNS, tried in that order."""
+        return cls([(name, PATTERNS[name]) for name in names])
+
+    def subset(self, names: Iterable[str]) -> SectionNumberMatcher:
+        """Matcher over only the named patterns, still tried in this matcher's order."""
+        keep = set(names)
+        return SectionNumberMatcher([(name, p) for name, p in self._patterns if name in keep])
+
+    def match(self, text: str) -> SectionNumber | None:
+        """Return ``(number, rest, pattern)`` from the first pattern matching ``text``, or None."""
+        m = self._regex.match(text)
+        if m is None:
+            return None
+        name = m.lastgroup
+        self.hits[name] += 1
+        group = self._groups[name]
+        return SectionNumber(m.group(group), m.group(group + 1), name)
+
+
+# Patterns extract_sections_from_soup tries on every block element
+SECTION_NUMBER = SectionNumberMatcher.named(
+    "section_sign", "section_caps", "nrs", "section_colon", "sec",
+    "dot_prefixed", "numbered", "ors", "article",
+)
@@ -0,0 +1,62 @@
+"""Stripped text of every element in a BeautifulSoup tree, computed once.
+
+``tag.get_text(strip=True)`` walks the tag's whole subtree, so calling it
+on every block element of a page (each ``div`` and every ``div``, ``span``
+or ``b`` inside it) visits the same strings over and over: quadratic in
+nesting depth on big chapter pages. ``TextIndex`` walks the tree once,
+appends each stripped string to one buffer and records where every tag's
+text starts and ends; a tag's text is then a slice of that buffer.
+"""
+
+from __future__ import annotations
+
+from bs4 import BeautifulSoup, Tag
+
+# String types get_text() includes by default (comments, scripts and
+# other NavigableString subclasses are left out)
+_TEXT_TYPES = Tag.MAIN_CONTENT_STRING_TYPES
+
+
+class TextIndex:
+    """``get_text(strip=True)`` for every tag under ``root``.
+
+    Attributes:
+        tags: Every tag below ``root`` in document order, i.e. the order
+            ``root.find_all(...)`` returns them in.
+    """
+
+    def __init__(self, root: BeautifulSoup | Tag):
+        self.tags: list[Tag] = []
+        self._spans: dict[int, tuple[int, int]] = {}
+        pieces: list[str] = []
+        length = 0
+        stack = [(root, iter(root.contents), 0)]
+        while stack:
+            tag, children, start = stack[-1]
+            for node in children:
+                if isinstance(node, Tag):
+                    self.tags.append(node)
+                    stack.append((node, iter(node.contents), length))
+                    break
+                if type(node) in _TEXT_TYPES:
+                    text = node.strip()
+                    if text:
+                        pieces.append(text)
+                        length += len(text)
+            else:
+                stack.pop()
+                self._spans[id(tag)] = (start, length)
+        self._text = "".join(pieces)
+
+    def text(self, tag: Tag) -> str:
+        """The tag's text, as ``tag.get_text(strip=True)`` returns it."""
+        if tag.interesting_string_types is not _TEXT_TYPES:
+            # <script>, <style> and the like: only their own kind of string counts
+            return tag.get_text(strip=True)
+        start, end = self._spans[id(tag)]
+        return self._text[start:end]
+
+    def find_all(self, names: frozenset[str] | set[str]) -> list[tuple[Tag, str]]:
+        """``(tag, text)`` for every tag whose name is in ``names``, in document order."""
+        text = self.text
+        return [(tag, text(tag)) for tag in self.tags if tag.name in names]
@@ -0,0 +1,50 @@
+"""URL canonicalization for crawl de-duplication and cache keys.
+
+The same page is often linked in several spellings: with and without a
+trailing slash, with query parameters in a different order, with a
+fragment, an explicit default port or upper-case host. ``canonicalize_url``
+maps all of them to one string, which the crawl frontier and the HTTP
+cache use as the page's identity. It is only an identity: pages are still
+requested with the URL as discovered, since servers such as Justia
+redirect when the trailing slash is missing.
+"""
+
+from __future__ import annotations
+
+import posixpath
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str) -> str:
+    """Return the canonical form of ``url``.
+
+    - scheme and host are lower-cased, default ports dropped
+    - the fragment is removed
+    - ``.``/``..`` segments are resolved and the trailing slash is dropped
+    - query parameters are sorted (blank values kept)
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host if port is None or port == _DEFAULT_PORTS.get(scheme) else f"{host}:{port}"
+    if parts.username or parts.password:
+        userinfo = parts.username or ""
+        if parts.password:
+            userinfo += f":{parts.password}"
+        netloc = f"{userinfo}@{netloc}"
+
+    path = parts.path or "/"
+    normalized = posixpath.normpath(path)
+    # normpath keeps a leading "//" and turns "/" into "/"; never return ""
+    path = "/" + normalized.lstrip("/") if normalized not in (".", "") else "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, path, query, ""))
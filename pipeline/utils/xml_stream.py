@@ -0,0 +1,165 @@
+"""Stream the title/chapter/section structure out of a bulk statute XML file.
+
+``etree.parse`` builds the whole document before anything is read from it,
+and some bulk files are hundreds of MB. ``iter_xml_titles`` walks the file
+with ``etree.iterparse`` instead: each section is handed to a callback
+when its end tag closes and is then cut out of the tree, and everything
+else outside sections except the ``num``/``heading`` children of titles,
+chapters and articles is dropped as soon as it closes. The tree in memory
+is never much bigger than the largest section.
+
+What comes out matches the lookups the ingestors made on a whole tree:
+titles are the ``title`` elements below the root (or the root itself if
+there are none), and a title's chapters, articles and sections are all
+such elements anywhere inside it, in document order. Tags match with or
+without the root element's namespace.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from lxml import etree
+
+# Elements whose num/heading children and attributes describe them
+_CONTAINERS = frozenset({"title", "chapter", "article"})
+_HEADER = frozenset({"num", "heading"})
+
+
+@dataclass
+class XmlDivision:
+    """A chapter or article element and the parsed sections inside it.
+
+    ``elem`` keeps its attributes and its ``num``/``heading`` children only.
+    """
+
+    elem: Any
+    sections: list = field(default_factory=list)
+
+
+@dataclass
+class XmlTitle:
+    """A title element (or the root of a file without any) and what is inside it.
+
+    Attributes:
+        elem: The element, with its attributes and ``num``/``heading`` children only.
+        ns: Namespace of the root element (``"{uri}"`` or ``""``).
+        chapters: Every ``chapter`` element inside, in document order.
+        articles: Every ``article`` element inside, in document order.
+        sections: Every parsed section inside, in document order.
+    """
+
+    elem: Any
+    ns: str
+    chapters: list[XmlDivision] = field(default_factory=list)
+    articles: list[XmlDivision] = field(default_factory=list)
+    sections: list = field(default_factory=list)
+
+
+def _namespace(tag: str) -> str:
+    return tag.split("}")[0] + "}" if tag.startswith("{") else ""
+
+
+def _filled(slots: list[list]) -> list:
+    return [slot[0] for slot in slots if slot[0] is not None]
+
+
+def _is_container(elem, root, kinds: dict[str, str]) -> bool:
+    return elem is root or (isinstance(elem.tag, str) and kinds.get(elem.tag) in _CONTAINERS)
+
+
+def iter_xml_titles(path: Path, section: Callable[[Any, str], Any]) -> Iterator[XmlTitle]:
+    """Yield the titles of an XML file, parsing its sections with ``section(elem, ns)``.
+
+    ``section`` sees each ``section`` element whole (including any
+    sections nested in it) and returns a parsed section, or None to skip
+    it. Titles are yielded as soon as they (and any title enclosing them)
+    close.
+    """
+    root = None
+    root_title = None
+    ns = ""
+    kinds: dict[str, str] = {}
+    open_titles: list[XmlTitle] = []
+    open_divisions: dict[str, list[XmlDivision]] = {"chapter": [], "article": []}
+    # One [parsed-or-None] slot per open section, filled when it closes
+    open_sections: list[list] = []
+    # Titles in start order, held until the outermost open title closes
+    pending: list[XmlTitle] = []
+    # num/heading elements of a container that are open; kept whole
+    open_headers = 0
+    # Closed elements to cut out of the tree. libxml2 may still be adding
+    # to an element's tail when its end event fires, so they go on the
+    # next event, once the tail is complete.
+    done: list = []
+
+    for event, elem in etree.iterparse(str(path), events=("start", "end")):
+        for closed in done:
+            closed.getparent().remove(closed)
+        done.clear()
+        if root is None:
+            root = elem
+            ns = _namespace(elem.tag)
+            kinds = {f"{ns}{name}": name for name in _CONTAINERS | _HEADER | {"section"}}
+            kinds.update({name: name for name in _CONTAINERS | _HEADER | {"section"}})
+            root_title = XmlTitle(elem, ns)
+            open_titles.append(root_title)
+            continue
+        kind = kinds.get(elem.tag) if isinstance(elem.tag, str) else None
+
+        if event == "start":
+            if kind == "title":
+                if root_title is not None:
+                    # The file has titles, so the root is not one
+                    open_titles.remove(root_title)
+                    root_title = None
+                title = XmlTitle(elem, ns)
+                open_titles.append(title)
+                pending.append(title)
+            elif kind in ("chapter", "article"):
+                division = XmlDivision(elem)
+                for title in open_titles:
+                    (title.chapters if kind == "chapter" else title.articles).append(division)
+                open_divisions[kind].append(division)
+            elif kind == "section":
+                slot = [None]
+                for title in open_titles:
+                    title.sections.append(slot)
+                for divisions in open_divisions.values():
+                    for division in divisions:
+                        division.sections.append(slot)
+                open_sections.append(slot)
+            elif kind in _HEADER and _is_container(elem.getparent(), root, kinds):
+                open_headers += 1
+            continue
+
+        if kind is None and (open_sections or open_headers):
+            continue
+        if elem is root:
+            break
+        parent = elem.getparent()
+        if kind == "section":
+            open_sections.pop()[0] = section(elem, ns)
+        elif kind == "title":
+            title = open_titles.pop()
+            title.sections = _filled(title.sections)
+            if not open_titles:
+                yield from pending
+                pending.clear()
+        elif kind in ("chapter", "article"):
+            division = open_divisions[kind].pop()
+            division.sections = _filled(division.sections)
+        elif kind in _HEADER and _is_container(parent, root, kinds):
+            open_headers -= 1
+            continue
+        # Nothing reads this element again; sections inside a section stay
+        # until the outer one has been parsed
+        if not open_sections and not open_headers:
+            done.append(elem)
+
+    if root_title is not None:
+        root_title.sections = _filled(root_title.sections)
+        yield root_title
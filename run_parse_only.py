@@ -1,4 +1,11 @@
-"""Parse-only: re-parse cached data without fetching. Much faster."""
+"""Parse-only: re-parse cached data without fetching. Much faster.
+
+Usage: python run_parse_only.py [--parse-workers N] [--no-parse-cache]
+
+Results for raw files unchanged since the last run come from the parse
+cache (cache/parse/), so re-parsing an unchanged state is quick.
+"""
+import argparse
 import sys
 import time
 import json
@@ -13,6 +20,7 @@ import yaml
 
 from pipeline.ingestion.base import StructureLevel
 from pipeline.normalization.normalizer import write_state
+from pipeline.utils.parse_pool import default_workers
 
 ROOT_DIR = Path(__file__).resolve().parent
 DATA_DIR = ROOT_DIR / "data" / "states"
@@ -25,7 +33,7 @@ with open("pipeline/config/state_metadata.yaml") as f:
     metadata = {s["slug"]: s for s in meta_list}
 
 
-def get_ingestor(slug):
+def get_ingestor(slug, parse_workers=1, parse_cache=True):
     from pipeline.ingestion.dc_council import DCCouncilIngestor
     from pipeline.ingestion.state_provided import StateProvidedIngestor
     from pipeline.ingestion.official_website import OfficialWebsiteIngestor
@@ -41,6 +49,8 @@ def get_ingestor(slug):
             StructureLevel(level=s["level"], label=s["label"])
             for s in source_config.get("structure", [])
         ],
+        "parse_workers": parse_workers,
+        "parse_cache": parse_cache,
     }
     cls_map = {
         "dc_council": DCCouncilIngestor,
@@ -53,11 +63,11 @@ def get_ingestor(slug):
     return cls(state=slug, config=config, cache_dir=CACHE_DIR)
 
 
-def parse_state(slug):
+def parse_state(slug, parse_workers=1, parse_cache=True):
     """Parse cached data without fetching."""
     start = time.time()
     try:
-        ingestor = get_ingestor(slug)
+        ingestor = get_ingestor(slug, parse_workers, parse_cache)
         source_type = sources[slug]["source_type"]
 
         # Find cached raw data
@@ -68,7 +78,8 @@ def parse_state(slug):
             if not raw_path.exists():
                 raw_path = CACHE_DIR / "raw" / slug
         elif source_type == "dc_council":
-            raw_path = CACHE_DIR / "raw" / slug
+            # fetch() keeps the repository zip here
+            raw_path = CACHE_DIR / "raw" / "dc"
         else:
             return slug, 0, 0, "unknown source_type"
 
@@ -96,49 +107,65 @@ def parse_state(slug):
         return slug, 0, elapsed, str(e)[:120]
 
 
-# Parse all states with cached data
-states_to_parse = []
-for slug in sorted(sources.keys()):
-    source_type = sources[slug]["source_type"]
-    if source_type == "official_website":
-        cache_path = CACHE_DIR / "raw" / slug / "official"
-    elif source_type == "state_provided":
-        cache_path = CACHE_DIR / "raw" / slug / "html"
-        if not cache_path.exists():
-            cache_path = CACHE_DIR / "raw" / slug
-    elif source_type == "dc_council":
-        cache_path = CACHE_DIR / "raw" / slug
-    else:
-        continue
-    if cache_path.exists():
-        file_count = sum(1 for _ in cache_path.rglob("*") if _.is_file())
-        if file_count > 0:
-            states_to_parse.append((slug, file_count))
-
-print(f"Parsing {len(states_to_parse)} states with cached data...")
-sys.stdout.flush()
-
-with ThreadPoolExecutor(max_workers=6) as executor:
-    futures = {executor.submit(parse_state, s): s for s, _ in states_to_parse}
-    done = 0
-    for future in as_completed(futures):
-        done += 1
-        slug, sections, elapsed, error = future.result()
-        status = f"{sections:>6} sections" if not error else f"ERROR: {error[:80]}"
-        print(f"  [{done}/{len(states_to_parse)}] {slug:<20} {status} ({elapsed:.1f}s)")
-        sys.stdout.flush()
-
-print("\n=== Final Summary ===")
-total = 0
-states_with_data = 0
-for state in sorted(os.listdir("data/states")):
-    mf = f"data/states/{state}/manifest.json"
-    if os.path.exists(mf):
-        with open(mf) as f:
-            m = json.load(f)
-        s = m["stats"]["sections"]
-        total += s
-        if s > 0:
-            states_with_data += 1
-            print(f"  {state}: {s:,}")
-print(f"\n{states_with_data} states with data, {total:,} total sections")
+def main():
+    arg_parser = argparse.ArgumentParser(description="Re-parse cached data without fetching.")
+    arg_parser.add_argument("--parse-workers", type=int, default=1,
+                            help="Processes for each state's parse (0: one per CPU)")
+    arg_parser.add_argument("--no-parse-cache", action="store_true",
+                            help="Re-parse every raw file instead of reusing results for unchanged files")
+    args = arg_parser.parse_args()
+    args.parse_workers = args.parse_workers or default_workers()
+
+    # Parse all states with cached data
+    states_to_parse = []
+    for slug in sorted(sources.keys()):
+        source_type = sources[slug]["source_type"]
+        if source_type == "official_website":
+            cache_path = CACHE_DIR / "raw" / slug / "official"
+        elif source_type == "state_provided":
+            cache_path = CACHE_DIR / "raw" / slug / "html"
+            if not cache_path.exists():
+                cache_path = CACHE_DIR / "raw" / slug
+        elif source_type == "dc_council":
+            cache_path = CACHE_DIR / "raw" / "dc"
+        else:
+            continue
+        if cache_path.exists():
+            file_count = sum(1 for _ in cache_path.rglob("*") if _.is_file())
+            if file_count > 0:
+                states_to_parse.append((slug, file_count))
+
+    print(f"Parsing {len(states_to_parse)} states with cached data...")
+    sys.stdout.flush()
+
+    # Threads only overlap I/O; with parse workers the CPUs are already busy
+    state_threads = 6 if args.parse_workers == 1 else 1
+    with ThreadPoolExecutor(max_workers=state_threads) as executor:
+        futures = {executor.submit(parse_state, s, args.parse_workers, not args.no_parse_cache): s for s, _ in states_to_parse}
+        done = 0
+        for future in as_completed(futures):
+            done += 1
+            slug, sections, elapsed, error = future.result()
+            status = f"{sections:>6} sections" if not error else f"ERROR: {error[:80]}"
+            print(f"  [{done}/{len(states_to_parse)}] {slug:<20} {status} ({elapsed:.1f}s)")
+            sys.stdout.flush()
+
+    print("\n=== Final Summary ===")
+    total = 0
+    states_with_data = 0
+    for state in sorted(os.listdir("data/states")):
+        mf = f"data/states/{state}/manifest.json"
+        if os.path.exists(mf):
+            with open(mf) as f:
+                m = json.load(f)
+            s = m["stats"]["sections"]
+            total += s
+            if s > 0:
+                states_with_data += 1
+                print(f"  {state}: {s:,}")
+    print(f"\n{states_with_data} states with data, {total:,} total sections")
+
+
+# Parse workers may be started by re-importing this module
+if __name__ == "__main__":
+    main()
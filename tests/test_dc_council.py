@@ -0,0 +1,122 @@
+"""DC Council fetch/parse against a local stand-in for GitHub.
+
+The stand-in serves the commits endpoint (answering with the branch's
+commit SHA) and a repository zip per commit, so the revision check, the
+download and the incremental re-parse can be exercised offline.
+"""
+
+import io
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pipeline.ingestion.dc_council import DCCouncilIngestor
+
+REV_A = "a" * 40
+REV_B = "b" * 40
+SECTIONS = {"1": ["1-101", "1-102", "1-151", "1-201"], "3": ["3-101", "3-285", "3-355"]}
+CHANGED = {"1-151", "3-285"}
+
+
+def section_xml(number: str, body: str) -> bytes:
+    return (
+        '<section xmlns="https://code.dccouncil.us/schemas/dc-library">'
+        f"<num>{number}</num><heading>Heading {number}</heading>"
+        f"<text>{body} {number}</text>"
+        '<annotations><annotation type="History">History</annotation></annotations>'
+        "</section>"
+    ).encode()
+
+
+def repo_zip(changed: set[str]) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        titles = "law-xml-codified-master/us/dc/council/code/titles"
+        for title, numbers in SECTIONS.items():
+            zf.writestr(
+                f"{titles}/{title}/index.xml",
+                f'<container xmlns="https://code.dccouncil.us/schemas/dc-library"><heading>Title {title}</heading></container>',
+            )
+            for number in numbers:
+                body = "Amended body" if number in changed else "Body"
+                zf.writestr(f"{titles}/{title}/sections/{number}.xml", section_xml(number, body))
+    return buf.getvalue()
+
+
+@pytest.fixture
+def github():
+    """A local server standing in for the GitHub commits endpoint and archive downloads."""
+    state = {"head": REV_A, "requests": []}
+    archives = {REV_A: repo_zip(set()), REV_B: repo_zip(CHANGED)}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            state["requests"].append(self.path)
+            if self.path == "/commits/master":
+                body = state["head"].encode()
+            elif self.path.startswith("/archive/") and self.path[len("/archive/"):-len(".zip")] in archives:
+                body = archives[self.path[len("/archive/"):-len(".zip")]]
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    state["url"] = f"http://127.0.0.1:{server.server_port}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_and_parse_follow_upstream_revision(github, tmp_path, monkeypatch):
+    parsed = []
+    parse_member = DCCouncilIngestor._parse_section_member
+
+    def counting_parse(self, zip_path, member, title_num):
+        parsed.append(member.rsplit("/", 1)[-1][:-len(".xml")])
+        return parse_member(self, zip_path, member, title_num)
+
+    monkeypatch.setattr(DCCouncilIngestor, "_parse_section_member", counting_parse)
+
+    def run():
+        github["requests"].clear()
+        parsed.clear()
+        ingestor = DCCouncilIngestor(
+            "district-of-columbia",
+            {
+                "archive_url": github["url"] + "/archive/{ref}.zip",
+                "revision_url": github["url"] + "/commits/master",
+            },
+            cache_dir=tmp_path,
+        )
+        state_code = ingestor.parse(ingestor.fetch())
+        return {s.number: s.text for t in state_code.titles for c in t.chapters for s in c.sections}
+
+    all_sections = sorted(n for numbers in SECTIONS.values() for n in numbers)
+
+    first = run()
+    assert github["requests"] == ["/commits/master", f"/archive/{REV_A}.zip"]
+    assert sorted(parsed) == all_sections
+    assert first["1-151"] == "Body 1-151"
+
+    # Unchanged SHA: only the revision check goes out, and nothing is re-parsed
+    assert run() == first
+    assert github["requests"] == ["/commits/master"]
+    assert parsed == []
+
+    # Moved SHA: the new commit's zip is downloaded once and only changed members are re-parsed
+    github["head"] = REV_B
+    moved = run()
+    assert github["requests"] == ["/commits/master", f"/archive/{REV_B}.zip"]
+    assert sorted(parsed) == sorted(CHANGED)
+    assert moved["1-151"] == "Amended body 1-151"
+    assert {n for n in moved if moved[n] != first[n]} == CHANGED